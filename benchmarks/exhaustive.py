@@ -0,0 +1,129 @@
+"""
+Optimality check of the native exact damage solver against exhaustive enumeration on toy problems.
+
+Usage: python -m benchmarks.exhaustive [cases]
+
+Every case is a synthetic profile with a few talismans and a random handful of reforges per equipment class, small
+enough to try every combination of reforges. The check fails when the objective of the solver's reforges isn't the best
+one found by enumeration, or only one of them finds a feasible solution.
+"""
+import itertools
+import random
+import sys
+import time
+
+from lib.optimizer import DamageOptimizerProblem
+from lib.damage_solver import _STRENGTH, _DamageModel, _reforge_options, damage_objective, flatten_reforge_counts, \
+    solve_damage_problem_exact
+from benchmarks.profiles import ARMOR_SETS, WEAPONS, make_profile, make_profile_data
+from constants import DAMAGE_REFORGES, RARITIES
+
+# (perfect crit chance, attack speed limit) of every case
+OPTIONS = ((True, 100), (False, 0), (True, 0), (False, 100), (True, 50))
+REFORGES_PER_CLASS = 3
+MAX_TALISMANS = 6
+
+
+def toy_problem(seed):
+    """
+    DamageOptimizerProblem of a random weapon, armor set and up to MAX_TALISMANS talismans, with REFORGES_PER_CLASS
+    reforges of every equipment class.
+    """
+    rng = random.Random(seed)
+    weapon, armor_set = rng.choice(list(WEAPONS)), rng.choice(list(ARMOR_SETS))
+    counts = {rarity: 0 for rarity in RARITIES}
+    for rarity in rng.choices(RARITIES[:5], k=rng.randint(1, MAX_TALISMANS)):
+        counts[rarity] += 1
+    random.seed(seed)  # item uuids and skill levels of the profile
+    profile = make_profile(make_profile_data(weapons=[weapon], armor_sets=[armor_set], talisman_counts=counts,
+                                             pets=['TIGER']))
+
+    reforges_set = {equipment_class: dict(rng.sample(sorted(reforges.items()), REFORGES_PER_CLASS))
+                    for equipment_class, reforges in DAMAGE_REFORGES.items()}
+    perfect_crit_chance, attack_speed_limit = OPTIONS[seed % len(OPTIONS)]
+    loadout = profile.loadout(weapon=profile.weapons[0], armor=profile.current_armor, pet=profile.active_pet)
+    return DamageOptimizerProblem(
+        loadout,
+        perfect_crit_chance=perfect_crit_chance,
+        attack_speed_limit=attack_speed_limit,
+        only_blacksmith_reforges=False,
+        include_dungeon=False,
+        reforges_set=reforges_set,
+        time_limit=600,
+        backend='native'
+    )
+
+
+def feasible(problem, stats):
+    if problem.perfect_crit_chance and stats['crit chance'] < 99.5 - 1e-6:
+        return False
+    if problem.uses_attack_speed and problem.attack_speed_limit and \
+            stats['attack speed'] > problem.attack_speed_limit + 1e-6:
+        return False
+    return True
+
+
+def enumerate_best(problem):
+    """
+    Return the best objective of every combination of reforges, None when none of them is feasible, and how many
+    combinations there are.
+    """
+    model = _DamageModel(problem)
+    # Every item group with its amount and the reforges it can get
+    groups = []
+    for equipment_type in problem.equipment_types:
+        for rarity in RARITIES:
+            amount = problem.counts[equipment_type].get(rarity, 0)
+            if amount > 0:
+                options = _reforge_options(problem, equipment_type, rarity, (_STRENGTH,))
+                reforges = [reforge for reforge, _ in options]
+                groups.append([[((equipment_type, rarity, reforge), 1) for reforge in chosen]
+                               for chosen in itertools.combinations_with_replacement(reforges, amount)])
+
+    best, combinations = None, 0
+    for choice in itertools.product(*groups):
+        combinations += 1
+        counts = {}
+        for key, count in itertools.chain.from_iterable(choice):
+            counts[key] = counts.get(key, 0) + count
+        stats = model.stats_for(counts)
+        if feasible(problem, stats):
+            objective = damage_objective(problem, stats)
+            best = objective if best is None else max(best, objective)
+    return best, combinations
+
+
+def main(cases):
+    failures = 0
+    for seed in range(cases):
+        problem = toy_problem(seed)
+        start = time.perf_counter()
+        best, combinations = enumerate_best(problem)
+        enumerate_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, counts = solve_damage_problem_exact(problem)
+        solve_time = time.perf_counter() - start
+        # The solver's reforges are scored like the enumerated ones, infeasible ones count as no solution
+        stats = _DamageModel(problem).stats_for(flatten_reforge_counts(counts))
+        objective = damage_objective(problem, stats) if counts and feasible(problem, stats) else None
+
+        if best is None or objective is None:
+            ok = best is None and objective is None
+        else:
+            ok = abs(objective - best) <= 1e-9 * best
+        failures += not ok
+        print(f'{seed} {problem.weapon_name} {sum(problem.counts["talisman"].values())} talismans '
+              f'{problem.perfect_crit_chance}/{problem.attack_speed_limit} > {combinations:,} combinations, '
+              f'best {best if best is None else f"{best:,.2f}"} in {enumerate_time:.2f} s, '
+              f'solver {objective if objective is None else f"{objective:,.2f}"} in {solve_time * 1e3:.1f} ms'
+              f'{"" if ok else " MISMATCH"}')
+
+    print()
+    print(f'{cases} cases, {failures} mismatches')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
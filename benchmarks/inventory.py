@@ -0,0 +1,163 @@
+"""
+Synthetic inventory data shaped like the hypixel api's, for benchmarks that run without api access.
+"""
+import random
+from base64 import b64encode
+from gzip import compress
+from struct import pack
+
+from lib.nbt import TAG_BYTE, TAG_SHORT, TAG_INT, TAG_LONG, TAG_FLOAT, TAG_DOUBLE, TAG_BYTE_ARRAY, TAG_STRING, \
+    TAG_LIST, TAG_COMPOUND, TAG_INT_ARRAY, TAG_LONG_ARRAY
+from constants import RARITIES
+
+_FORMATS = {TAG_BYTE: '>B', TAG_SHORT: '>H', TAG_INT: '>I', TAG_LONG: '>Q', TAG_FLOAT: '>f', TAG_DOUBLE: '>d'}
+
+
+class Tag:
+    """
+    Typed NBT value, compounds are plain dicts of tags.
+    `value` of a list tag is a (subtype, [values]) tuple.
+    """
+
+    def __init__(self, tag_id, value):
+        self.tag_id = tag_id
+        self.value = value
+
+
+def _encode_string(s):
+    s = s.encode('utf-8')
+    return pack('>H', len(s)) + s
+
+
+def _encode_payload(tag_id, value):
+    if tag_id in _FORMATS:
+        return pack(_FORMATS[tag_id], value)
+    if tag_id == TAG_STRING:
+        return _encode_string(value)
+    if tag_id == TAG_BYTE_ARRAY:
+        return pack('>I', len(value)) + value
+    if tag_id == TAG_INT_ARRAY:
+        return pack(f'>I{len(value)}I', len(value), *value)
+    if tag_id == TAG_LONG_ARRAY:
+        return pack(f'>I{len(value)}Q', len(value), *value)
+    if tag_id == TAG_LIST:
+        subtype, values = value
+        return pack('>BI', subtype, len(values)) + b''.join(
+            _encode_payload(*_unwrap(subtype, v)) for v in values)
+    if tag_id == TAG_COMPOUND:
+        return b''.join(pack('>B', tag.tag_id) + _encode_string(name) + _encode_payload(tag.tag_id, tag.value)
+                        for name, tag in ((k, _wrap(v)) for k, v in value.items())) + b'\x00'
+    raise ValueError(tag_id)
+
+
+def _wrap(value):
+    return Tag(TAG_COMPOUND, value) if isinstance(value, dict) else value
+
+
+def _unwrap(subtype, value):
+    if isinstance(value, Tag):
+        return value.tag_id, value.value
+    return subtype, value
+
+
+def encode_nbt(root):
+    """
+    Encode a compound of tags into uncompressed NBT data with an unnamed root compound.
+    """
+    return b'\x0a' + _encode_string('') + _encode_payload(TAG_COMPOUND, root)
+
+
+def encode_inventory_data(items, *, backpack=False):
+    """
+    Encode a list of item compounds (or None for empty slots) the way the api sends inventories.
+    """
+    data = compress(encode_nbt({'i': Tag(TAG_LIST, (TAG_COMPOUND, [item or {} for item in items]))}))
+    return data if backpack else b64encode(data).decode()
+
+
+def make_item(internal_name, name, lore, *, extra=None, skull=False):
+    """
+    Build an item compound like the ones in the hypixel inventory data.
+    """
+    extra_attributes = {
+        'id': Tag(TAG_STRING, internal_name),
+        'uuid': Tag(TAG_STRING, '%08x-%04x-%04x-%04x-%012x' % tuple(
+            random.getrandbits(bits) for bits in (32, 16, 16, 16, 48))),
+        'timestamp': Tag(TAG_STRING, '2/16/20 9:24 PM'),
+        'originTag': Tag(TAG_STRING, 'UNKNOWN'),
+    }
+    extra_attributes.update(extra or {})
+    tag = {
+        'HideFlags': Tag(TAG_INT, 254),
+        'display': {
+            'Lore': Tag(TAG_LIST, (TAG_STRING, lore)),
+            'Name': Tag(TAG_STRING, name),
+        },
+        'ExtraAttributes': extra_attributes,
+    }
+    if skull:
+        tag['SkullOwner'] = {
+            'Id': Tag(TAG_STRING, 'c4b2b0a4-58b6-3b3f-8d6c-bd11ac0b2a4e'),
+            'Properties': {
+                'textures': Tag(TAG_LIST, (TAG_COMPOUND, [
+                    {'Value': Tag(TAG_STRING, b64encode(bytes(random.getrandbits(8) for _ in range(180))).decode())}
+                ])),
+            },
+        }
+    return {
+        'id': Tag(TAG_SHORT, 397 if skull else 276),
+        'Count': Tag(TAG_BYTE, 1),
+        'tag': tag,
+        'Damage': Tag(TAG_SHORT, 3 if skull else 0),
+    }
+
+
+def make_talisman(internal_name, rarity, *, reforge=None):
+    name = internal_name.replace('_', ' ').title()
+    lore = [
+        '§7Strength: §c+{0} §9({1} +{0})'.format(random.randint(1, 8), (reforge or 'Hurtful').title()),
+        '§7Crit Damage: §c+{}%'.format(random.randint(1, 8)),
+        '',
+        '§7Some talisman ability that is',
+        '§7described over a few lines.',
+        '',
+        f'§6§l{rarity.upper()} ACCESSORY',
+    ]
+    extra = {'modifier': Tag(TAG_STRING, reforge)} if reforge else {}
+    return make_item(internal_name, f'§6{name}', lore, extra=extra, skull=True)
+
+
+def make_weapon(internal_name, rarity, *, reforge='spicy'):
+    lore = [
+        '§7Damage: §c+200',
+        '§7Strength: §c+110 §9(Spicy +10)',
+        '§7Crit Damage: §c+80% §9(Spicy +80%)',
+        '',
+        '§9Critical VI, §9Ender Slayer VI, §9First Strike IV',
+        '§9Giant Killer VI, §9Sharpness VI, §9Vampirism VI',
+        '',
+        '§6§l{} SWORD'.format(rarity.upper()),
+    ]
+    extra = {
+        'modifier': Tag(TAG_STRING, reforge),
+        'enchantments': {enchant: Tag(TAG_INT, 6) for enchant in (
+            'critical', 'ender_slayer', 'giant_killer', 'sharpness', 'vampirism', 'looting')},
+        'anvil_uses': Tag(TAG_INT, 4),
+        'hot_potato_count': Tag(TAG_INT, 10),
+    }
+    return make_item(internal_name, f'§6Spicy {internal_name.title()}', lore, extra=extra)
+
+
+def make_inventory(size=36, *, fill=0.8):
+    """
+    Random inventory of weapons and talismans with roughly `fill` of the slots used.
+    """
+    items = []
+    for i in range(size):
+        if random.random() > fill:
+            items.append(None)
+        elif random.random() < 0.2:
+            items.append(make_weapon('ASPECT_OF_THE_DRAGONS', 'legendary'))
+        else:
+            items.append(make_talisman(f'TALISMAN_{i}', random.choice(RARITIES), reforge='hurtful'))
+    return items
@@ -0,0 +1,128 @@
+"""
+Micro-benchmark of the inventory NBT decoder.
+
+Usage: python -m benchmarks.nbt_decoder [recorded skyblock/profiles json ...]
+
+Recorded responses are searched for every `*.data` inventory blob, without any file synthetic inventories are used.
+The closure based reader parse_nbt replaced is kept here as reference_parse_nbt and timed on the same data.
+"""
+import json
+import random
+import sys
+import timeit
+from io import BytesIO
+from struct import unpack
+
+from lib import parse_nbt, decompress_nbt
+from benchmarks.inventory import encode_inventory_data, make_inventory
+
+
+def reference_parse_nbt(data):
+    """
+    The reader decode_inventory_data used before lib.nbt, reading the buffer piece by piece through closures.
+    Returns the root compound like parse_nbt, it only reads the first tag of the root like the old reader.
+    """
+    raw = BytesIO(data)
+
+    def read(type, length):
+        if type in 'chil':
+            return int.from_bytes(raw.read(length), byteorder='big')
+        if type == 's':
+            return raw.read(length).decode('utf-8')
+        return unpack(f'>{type}', raw.read(length))[0]
+
+    def parse_list():
+        subtype = read('c', 1)
+        payload = []
+        for _ in range(read('i', 4)):
+            parse_next_tag(payload, subtype)
+        return payload
+
+    def parse_compound():
+        payload = {}
+        while parse_next_tag(payload) != 0:  # Parse tags until we find an endcap (type == 0)
+            pass  # Nothing needs to happen here
+        return payload
+
+    payloads = {
+        1: lambda: read('c', 1),  # Byte
+        2: lambda: read('h', 2),  # Short
+        3: lambda: read('i', 4),  # Int
+        4: lambda: read('l', 8),  # Long
+        5: lambda: read('f', 4),  # Float
+        6: lambda: read('d', 8),  # Double
+        7: lambda: raw.read(read('i', 4)),  # Byte Array
+        8: lambda: read('s', read('h', 2)),  # String
+        9: parse_list,  # List
+        10: parse_compound,  # Compound
+        11: lambda: [read('i', 4) for _ in range(read('i', 4))],  # Int Array
+        12: lambda: [read('l', 8) for _ in range(read('i', 4))]  # Long Array
+    }
+
+    def parse_next_tag(dictionary, tag_id=None):
+        name = None
+        if tag_id is None:  # Are we inside a list?
+            tag_id = read('c', 1)
+            if tag_id == 0:  # Is this the end of a compound?
+                return 0
+            name = read('s', read('h', 2))
+
+        payload = payloads[tag_id]()
+        if isinstance(dictionary, dict):
+            dictionary[name] = payload
+        else:
+            dictionary.append(payload)
+
+    raw.read(3)  # Remove file header (we ignore footer)
+    root = {}
+    parse_next_tag(root)
+    return root
+
+
+def recorded_blobs(paths):
+    blobs = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            data = node.get('data')
+            if isinstance(data, str) and node.get('type') == 0:
+                blobs.append(data)
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    for path in paths:
+        with open(path) as f:
+            walk(json.load(f))
+    return blobs
+
+
+def synthetic_blobs():
+    random.seed(0)
+    return [encode_inventory_data(make_inventory(size)) for size in (36, 45, 45, 36, 72, 36)]
+
+
+def main(paths):
+    blobs = recorded_blobs(paths) if paths else synthetic_blobs()
+    if not blobs:
+        sys.exit('No inventory data found.')
+    decompressed = [decompress_nbt(blob) for blob in blobs]
+    size = sum(len(data) for data in decompressed)
+
+    if any(parse_nbt(data)['i'] != reference_parse_nbt(data)['i'] for data in decompressed):
+        sys.exit('parse_nbt and the reference reader disagree.')
+
+    number = max(1, 2000 // len(blobs))
+    print(f'{len(blobs)} inventories, {size / 1024:.1f} KiB of NBT')
+    times = {}
+    for name, parse in (('reference', reference_parse_nbt), ('parse_nbt', parse_nbt)):
+        best = min(timeit.repeat(lambda: [parse(data) for data in decompressed], number=number, repeat=5)) / number
+        times[name] = best
+        print(f'{name} > {best / len(blobs) * 1e6:.1f} µs per inventory, {size / best / 1024 ** 2:.1f} MiB/s')
+    print(f'parse_nbt is {times["reference"] / times["parse_nbt"]:.2f}x faster than the reference reader')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,117 @@
+"""
+Latency and quality benchmark of the damage optimizer backends.
+
+Usage: python -m benchmarks.optimizer [recorded skyblock/profiles json ...]
+
+Every weapon of the recorded profiles is optimized with their worn armor and active pet, without any file synthetic
+profiles of every weapon and armor set in benchmarks.profiles are used. Each case is solved by every backend that
+can run here and by the greedy heuristic. The gap of a result is how far its objective is below the best one found.
+"""
+import random
+import shutil
+import sys
+import time
+
+import numpy
+
+from lib.optimizer import DamageOptimizerProblem, damage_solvers, damage_model_builders
+from lib.damage_solver import damage_objective, greedy_damage_solution
+from benchmarks.profiles import recorded_profiles, synthetic_profiles
+from constants import DAMAGE_REFORGES
+
+# (perfect crit chance, attack speed limit) of every case
+OPTIONS = ((True, 100), (False, 0), (True, 0))
+
+
+def available_backends():
+    backends = list(damage_solvers)
+    if shutil.which('scip') is None:
+        backends.remove('scip')
+    return backends
+
+
+def cases(profiles):
+    """
+    (name, loadout, perfect crit chance, attack speed limit) of every weapon of every profile.
+    """
+    for name, profile in profiles:
+        armor = profile.current_armor
+        if all(piece is None for piece in armor.values()):
+            armor = profile.wardrobe[0] if profile.wardrobe else None
+        for weapon in profile.weapons:
+            loadout = profile.loadout(weapon=weapon, armor=armor, pet=profile.active_pet)
+            for perfect_crit_chance, attack_speed_limit in OPTIONS:
+                yield f'{name} {weapon.internal_name} {perfect_crit_chance}/{attack_speed_limit}', loadout, \
+                      perfect_crit_chance, attack_speed_limit
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def run_case(loadout, perfect_crit_chance, attack_speed_limit, backends):
+    """
+    Return {backend: (build seconds, solve seconds, objective or None, optimized)} of one case.
+    Solve times include building the model again, the way the bot solves.
+    """
+    results = {}
+    for backend in backends + ['greedy']:
+        problem, build = timed(lambda: DamageOptimizerProblem(
+            loadout,
+            perfect_crit_chance=perfect_crit_chance,
+            attack_speed_limit=attack_speed_limit,
+            only_blacksmith_reforges=False,
+            include_dungeon=False,
+            reforges_set=DAMAGE_REFORGES,
+            backend=backend if backend != 'greedy' else 'native'
+        ))
+        if backend == 'greedy':
+            result, solve = timed(greedy_damage_solution, problem)
+        else:
+            build += timed(damage_model_builders[backend], problem)[1]
+            result, solve = timed(damage_solvers[backend], problem)
+
+        if result is None or not result[1]:
+            results[backend] = (build, solve, None, False)
+        else:
+            results[backend] = (build, solve, damage_objective(problem, result[0]), result[0]['is optimized'])
+    return results
+
+
+def main(paths):
+    random.seed(0)
+    profiles = recorded_profiles(paths) if paths else synthetic_profiles()
+    backends = available_backends()
+    if not profiles:
+        sys.exit('No profiles with the inventory api found.')
+
+    print(f'{len(profiles)} profiles, backends > {", ".join(backends)}')
+    rows = {backend: [] for backend in backends + ['greedy']}
+    for name, loadout, perfect_crit_chance, attack_speed_limit in cases(profiles):
+        results = run_case(loadout, perfect_crit_chance, attack_speed_limit, backends)
+        objectives = [objective for _, _, objective, _ in results.values() if objective is not None]
+        best = max(objectives, default=None)
+        for backend, (build, solve, objective, optimized) in results.items():
+            if best is None:
+                gap = 0.0  # infeasible for every backend
+            elif objective is None:
+                gap = 1.0
+            else:
+                gap = (best - objective) / best
+            rows[backend].append((build, solve, gap, optimized))
+        print(f'{name} > best {best:,.0f}' if best is not None else f'{name} > infeasible')
+
+    print()
+    for backend, backend_rows in rows.items():
+        build, solve, gap, optimized = (numpy.array(column) for column in zip(*backend_rows))
+        print(f'{backend} > {len(backend_rows)} cases, '
+              f'build p50 {numpy.percentile(build, 50) * 1e3:.1f} ms p95 {numpy.percentile(build, 95) * 1e3:.1f} ms, '
+              f'solve p50 {numpy.percentile(solve, 50) * 1e3:.1f} ms p95 {numpy.percentile(solve, 95) * 1e3:.1f} ms, '
+              f'gap mean {gap.mean() * 100:.2f}% max {gap.max() * 100:.2f}%, '
+              f'{len(backend_rows) - optimized.sum()} not optimized')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,131 @@
+"""
+Profiles for benchmarks that run without api access, built from recorded `skyblock/profiles` responses or generated.
+"""
+import json
+import random
+from types import SimpleNamespace
+
+from lib.profile import Profile
+from benchmarks.inventory import encode_inventory_data, make_item, make_talisman
+from constants import RARITIES
+
+# internal name: (rarity, stats)
+WEAPONS = {
+    'MIDAS_SWORD': ('legendary', {'Damage': 150, 'Strength': 50}),
+    'ASPECT_OF_THE_END': ('rare', {'Damage': 100, 'Strength': 100}),
+    'LIVID_DAGGER': ('legendary', {'Damage': 210, 'Strength': 60, 'Crit Chance': 100, 'Crit Damage': 50,
+                                   'Bonus Attack Speed': 50}),
+}
+
+# set name: (rarity, stats of the helmet, chestplate, leggings and boots)
+ARMOR_SETS = {
+    'SUPERIOR_DRAGON': ('legendary', (
+        {'Strength': 10, 'Crit Chance': 2, 'Crit Damage': 10, 'Health': 90, 'Defense': 130},
+        {'Strength': 10, 'Crit Chance': 2, 'Crit Damage': 10, 'Health': 150, 'Defense': 190},
+        {'Strength': 10, 'Crit Chance': 2, 'Crit Damage': 10, 'Health': 130, 'Defense': 170},
+        {'Strength': 10, 'Crit Chance': 2, 'Crit Damage': 10, 'Health': 80, 'Defense': 110},
+    )),
+    'TARANTULA': ('epic', (
+        {'Crit Damage': 25, 'Health': 100, 'Defense': 80},
+        {'Crit Damage': 25, 'Health': 140, 'Defense': 120},
+        {'Crit Damage': 25, 'Health': 125, 'Defense': 105},
+        {'Crit Damage': 25, 'Health': 90, 'Defense': 70},
+    )),
+    'MASTIFF': ('epic', (
+        {'Crit Damage': 50, 'Health': 120, 'Speed': 5},
+        {'Crit Damage': 50, 'Health': 180, 'Speed': 5},
+        {'Crit Damage': 50, 'Health': 160, 'Speed': 5},
+        {'Crit Damage': 50, 'Health': 110, 'Speed': 5},
+    )),
+}
+
+ARMOR_TYPES = ('helmet', 'chestplate', 'leggings', 'boots')
+
+
+def _stat_lines(stats):
+    return [f'§7{stat}: §c+{value}{"%" if stat in ("Crit Chance", "Crit Damage", "Bonus Attack Speed") else ""}'
+            for stat, value in stats.items()]
+
+
+def make_gear(internal_name, rarity, item_type, stats):
+    """
+    Build a weapon or armor piece compound without a reforge.
+    """
+    lore = _stat_lines(stats) + ['', f'§6§l{rarity.upper()} {item_type.upper()}']
+    return make_item(internal_name, f'§6{internal_name.replace("_", " ").title()}', lore)
+
+
+def make_profile_data(*, weapons, armor_sets, talisman_counts, pets=(), skill_xp=15_000_000):
+    """
+    Member data of a profile with the given weapons in its inventory and armor sets, the first one worn and the others
+    in the wardrobe, talisman_counts talismans of each rarity in the talisman bag and pets of type names.
+    """
+    inventory = [make_gear(name, WEAPONS[name][0], 'sword', WEAPONS[name][1]) for name in weapons]
+    armor = []
+    for set_name in armor_sets:
+        rarity, stats = ARMOR_SETS[set_name]
+        armor.append([make_gear(f'{set_name}_{piece_type.upper()}', rarity, piece_type, piece_stats)
+                      for piece_type, piece_stats in zip(ARMOR_TYPES, stats)])
+
+    # Wardrobe slots go by page of 9 sets, one row of 9 per armor type
+    wardrobe = [None] * 36
+    for index, pieces in enumerate(armor[1:9]):
+        for row, piece in enumerate(pieces):
+            wardrobe[index + 9 * row] = piece
+
+    talismans = [make_talisman(f'TALISMAN_{rarity.upper()}_{i}', rarity, reforge=random.choice(('hurtful', 'itchy')))
+                 for rarity, count in talisman_counts.items() for i in range(count)]
+
+    return {
+        'inv_contents': {'data': encode_inventory_data(inventory)},
+        'inv_armor': {'data': encode_inventory_data(armor[0] if armor else [])},
+        'wardrobe_contents': {'data': encode_inventory_data(wardrobe)},
+        'talisman_bag': {'data': encode_inventory_data(talismans)},
+        'pets': [{'type': pet, 'exp': 25_000_000, 'tier': 'LEGENDARY', 'active': index == 0}
+                 for index, pet in enumerate(pets)],
+        'fairy_souls_collected': random.randint(0, 200),
+        **{f'experience_skill_{skill}': random.randint(skill_xp // 10, skill_xp)
+           for skill in ('combat', 'foraging', 'mining', 'farming', 'fishing', 'enchanting', 'alchemy', 'taming')},
+    }
+
+
+def make_profile(member_data, *, uuid='0' * 32, name='Synthetic'):
+    """
+    Profile of a single member profile made of member_data.
+    """
+    raw_profile_data = {'profile_id': uuid, 'cute_name': name, 'members': {uuid: member_data}}
+    return Profile(player=SimpleNamespace(uuid=uuid), raw_profile_data=raw_profile_data, load_all=True)
+
+
+def synthetic_profiles(*, talismans=(10, 60)):
+    """
+    One profile per weapon and armor set with a random number of talismans, between the bounds of `talismans`.
+    """
+    profiles = []
+    for weapon in WEAPONS:
+        for armor_set in ARMOR_SETS:
+            total = random.randint(*talismans)
+            counts = {rarity: 0 for rarity in RARITIES}
+            for rarity in random.choices(RARITIES[:5], weights=(5, 4, 3, 2, 1), k=total):
+                counts[rarity] += 1
+            member_data = make_profile_data(weapons=[weapon], armor_sets=[armor_set], talisman_counts=counts,
+                                            pets=['TIGER'])
+            profiles.append((f'{armor_set} + {total} talismans', make_profile(member_data)))
+    return profiles
+
+
+def recorded_profiles(paths):
+    """
+    Profiles of every member with the inventory api on in recorded `skyblock/profiles` responses.
+    """
+    profiles = []
+    for path in paths:
+        with open(path) as f:
+            response = json.load(f)
+        for raw_profile_data in response['profiles'] if isinstance(response, dict) else response:
+            for uuid, member_data in raw_profile_data['members'].items():
+                if 'inv_contents' not in member_data:
+                    continue
+                profile = Profile(player=SimpleNamespace(uuid=uuid), raw_profile_data=raw_profile_data, load_all=True)
+                profiles.append((f'{path} {uuid[:8]} {profile.name}', profile))
+    return profiles
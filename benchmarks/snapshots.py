@@ -0,0 +1,73 @@
+"""
+Round trip check and size of compacted profile snapshots.
+
+Usage: python -m benchmarks.snapshots [recorded skyblock/profiles json ...]
+
+Every member of the recorded profiles, without any file a synthetic coop, is built into a Profile from the raw data
+and from ProfileSnapshotStore.expand(ProfileSnapshotStore.compact(...)). Both must read the same.
+"""
+import json
+import random
+import sys
+from types import SimpleNamespace
+
+from lib.profile import Profile
+from lib.snapshots import ProfileSnapshotStore
+from benchmarks.profiles import make_profile_data
+
+# Profile attributes a snapshot must keep the same
+ATTRIBUTES = ('id', 'name', 'last_save', 'purse', 'coop_members', 'minions', 'unique_minions', 'minion_slots',
+              'enabled_api', 'skills', 'slayers', 'fairy_souls', 'talisman_counts')
+
+
+def synthetic_raw_profiles():
+    random.seed(0)
+    members = {}
+    for index in range(3):
+        member_data = make_profile_data(weapons=['MIDAS_SWORD'], armor_sets=['SUPERIOR_DRAGON'],
+                                        talisman_counts={'common': 3, 'rare': 2}, pets=['TIGER'])
+        minions = random.sample(('WHEAT', 'CARROT', 'COBBLESTONE', 'SPIDER', 'ZOMBIE', 'SNOW'), 3)
+        member_data['crafted_generators'] = [f'{minion}_{tier}' for minion in minions
+                                             for tier in range(1, random.randint(2, 11))]
+        members[f'{index}' * 32] = member_data
+    return [{'profile_id': 'f' * 32, 'cute_name': 'Synthetic', 'members': members, 'banking': {'balance': 1e6}}]
+
+
+def read(profile):
+    return {attribute: getattr(profile, attribute, None) for attribute in ATTRIBUTES}
+
+
+def main(paths):
+    raw_profiles = []
+    for path in paths:
+        with open(path) as f:
+            response = json.load(f)
+        raw_profiles.extend(response['profiles'] if isinstance(response, dict) else response)
+    if not raw_profiles:
+        raw_profiles = synthetic_raw_profiles()
+
+    checked = mismatched = raw_size = compacted_size = 0
+    for raw_profile_data in raw_profiles:
+        for uuid in raw_profile_data['members']:
+            player = SimpleNamespace(uuid=uuid)
+            data = ProfileSnapshotStore.compact(uuid, raw_profile_data)
+            expanded = ProfileSnapshotStore.expand(data)
+            raw_size += len(json.dumps(raw_profile_data))
+            compacted_size += len(data)
+
+            expected = read(Profile(player=player, raw_profile_data=raw_profile_data, load_all=True))
+            actual = read(Profile(player=player, raw_profile_data=expanded, load_all=True))
+            checked += 1
+            for attribute in ATTRIBUTES:
+                if expected[attribute] != actual[attribute]:
+                    mismatched += 1
+                    print(f'{raw_profile_data["profile_id"]} {uuid} > {attribute} differs')
+
+    print(f'{checked} members, {mismatched} mismatches, '
+          f'snapshots are {compacted_size / max(raw_size, 1) * 100:.1f}% of the raw json')
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
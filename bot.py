@@ -7,7 +7,7 @@ import motor.motor_asyncio
 from typing import Optional
 from discord.ext import commands
 
-from lib import HypixelAPIClient
+from lib import HypixelAPIClient, ProfileSnapshotStore, OptimizerPool, OptimizerResultCache
 from utils import Context
 import config
 
@@ -22,9 +22,14 @@ class Bot(commands.AutoShardedBot):
 
         self.config = config
         self.http_session: Optional[aiohttp.ClientSession] = None
-        self.hypixel_api_client = HypixelAPIClient(config.API_KEY, self.loop, timeout=aiohttp.ClientTimeout(total=30))
+        self.hypixel_api_client = HypixelAPIClient(config.API_KEY, self.loop, cache_size=config.HYPIXEL_CACHE_SIZE,
+                                                   timeout=aiohttp.ClientTimeout(total=30))
         self.mongo_client = motor.motor_asyncio.AsyncIOMotorClient(config.DATABASE_URI)
         self.db = self.mongo_client.sbs
+        self.hypixel_api_client.profile_snapshots = ProfileSnapshotStore(
+            self.db['profile_snapshots'], max_age=config.PROFILE_SNAPSHOT_MAX_AGE)
+        self.optimizer_pool = OptimizerPool(max_workers=config.OPTIMIZER_WORKERS, timeout=config.OPTIMIZER_TIMEOUT)
+        self.optimizer_cache = OptimizerResultCache(self.db['optimizer_results'], max_size=config.OPTIMIZER_CACHE_SIZE)
 
         self.blacklisted_discord_ids = []
         self.blacklisted_guild_ids = []
@@ -78,12 +83,14 @@ class Bot(commands.AutoShardedBot):
 
     async def close(self):
         """
-        Close the Discord connection, the http session, connector, resolver and hypixel api client.
+        Close the Discord connection, the http session, connector, resolver, hypixel api client and optimizer pool.
         """
         await super().close()
 
         await self.hypixel_api_client.close()
 
+        self.optimizer_pool.shutdown()
+
         if self._connector:
             await self._connector.close()
 
@@ -136,3 +143,6 @@ class Bot(commands.AutoShardedBot):
         # Cache blacklisted guild ids
         async for guild in self.db['guilds'].find({'global_blacklisted': True}):
             self.blacklisted_guild_ids.append(guild['_id'])
+
+        await self.hypixel_api_client.profile_snapshots.create_indexes()
+        await self.optimizer_cache.create_indexes()
@@ -217,6 +217,12 @@ class ErrorHandler(commands.Cog):
                 ctx,
                 description='You have no armors equipped or in wardrobe.'
             ).send()
+        elif isinstance(error, OptimizerTimeoutError):
+            await CommandErrorEmbed(
+                ctx,
+                description='The optimizer is too busy or took too long to optimize your gear!\n'
+                            'Please try again later.'
+            ).send()
         elif isinstance(error, HypixelLanguageError):
             await CommandErrorEmbed(
                 ctx,
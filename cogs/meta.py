@@ -104,6 +104,15 @@ class Meta(commands.Cog, name='Bot'):
 
         memory_usage = self.process.memory_full_info().uss / 1024 ** 2
         cpu_usage = self.process.cpu_percent() / psutil.cpu_count()
+        api_cache = self.bot.hypixel_api_client.cache_stats()
+        api_cache_lookups = api_cache['hits'] + api_cache['misses']
+        api_cache_hit_rate = api_cache['hits'] / api_cache_lookups * 100 if api_cache_lookups else 0
+        optimizer_cache = self.bot.optimizer_cache.stats()
+        optimizer_cache_hits = optimizer_cache['hits'] + optimizer_cache['db hits']
+        optimizer_cache_lookups = optimizer_cache_hits + optimizer_cache['misses']
+        optimizer_cache_hit_rate = (optimizer_cache_hits / optimizer_cache_lookups * 100
+                                    if optimizer_cache_lookups else 0)
+        optimizer_pool = self.bot.optimizer_pool.stats()
         embed.add_field(
             name='Process',
             value=f'{memory_usage:.2f} MiB\n{cpu_usage:.2f}% CPU',
@@ -113,8 +122,22 @@ class Meta(commands.Cog, name='Bot'):
             value=f'{self.bot.latency * 1000:.0f} ms',
             inline=True
         ).add_field(
-            name='\u200b',
-            value='\u200b',
+            name='API Cache',
+            value=f'{api_cache["size"]:,} / {api_cache["max size"]:,} entries\n'
+                  f'{api_cache_hit_rate:.2f}% hit rate\n'
+                  f'{api_cache["evictions"]:,} evictions',
+            inline=True
+        ).add_field(
+            name='Optimizer Cache',
+            value=f'{optimizer_cache["size"]:,} / {optimizer_cache["max size"]:,} entries\n'
+                  f'{optimizer_cache_hit_rate:.2f}% hit rate\n'
+                  f'{optimizer_cache["db hits"]:,} db hits',
+            inline=True
+        ).add_field(
+            name='Optimizer Queue',
+            value=f'{optimizer_pool["running"]:,} / {optimizer_pool["workers"]:,} running\n'
+                  f'{optimizer_pool["queued"]:,} queued\n'
+                  f'{optimizer_pool["completed"]:,} completed',
             inline=True
         )
 
@@ -1,11 +1,13 @@
 import copy
+import discord
 from discord.ext import commands
 
-from lib import damage_optimizer
+from lib import DamageOptimizerProblem, DamageLoadouts, StatOptimizerProblem, STAT_GOALS
+from lib.optimizer import solve_stat_problem
 from lib import APIDisabledError, SessionTimeout, PlayerOnlineError, NoArmorError, NoWeaponError
 from utils import CommandWithCooldown, Embed, colorize, format_pet, emod, damage, ask_for_skyblock_profiles
-from constants.discord import OPTIMIZER_GOALS, RARITY_COLORS, PET_EMOJIS, DAMAGE_POTIONS, NUMBER_EMOJIS, SUPPORT_ITEMS
-from constants import DAMAGE_REFORGES
+from constants.discord import OPTIMIZER_GOALS, STAT_OPTIMIZER_GOALS, RARITY_COLORS, PET_EMOJIS, NUMBER_EMOJIS
+from constants import DAMAGE_REFORGES, DAMAGE_POTIONS, SUPPORT_ITEMS
 
 
 class OptimizeGear(commands.Cog, name='Damage'):
@@ -15,7 +17,6 @@ class OptimizeGear(commands.Cog, name='Damage'):
 
     @commands.command(cls=CommandWithCooldown, cooldown_after_parsing=True)
     @commands.cooldown(1, 10.0, commands.BucketType.user)
-    @commands.max_concurrency(1, per=commands.BucketType.channel, wait=False)
     async def optimizer(self, ctx, player: str = '', profile: str = ''):
         """
         Optimizes your equipments to their best reforges.
@@ -64,9 +65,7 @@ class OptimizeGear(commands.Cog, name='Damage'):
                 )
             )
 
-        profile.set_weapon(weapon)
-        profile.set_armor(armor, dungeon=include_dungeon)
-        profile.set_pet(pet, dungeon=include_dungeon)
+        profile = profile.loadout(weapon=weapon, armor=armor, pet=pet, dungeon=include_dungeon)
 
         profile_confirm = await self.confirm_equipment(ctx, profile)
         if not profile_confirm:
@@ -93,7 +92,10 @@ class OptimizeGear(commands.Cog, name='Damage'):
         if not option_confirm:
             raise SessionTimeout
 
-        best_route = damage_optimizer(
+        profile.set_potions(selected_pots)
+        profile.set_support_items(selected_buffs)
+
+        problem = DamageOptimizerProblem(
             profile,
             perfect_crit_chance=perfect_crit_chance,
             attack_speed_limit=attack_speed_limit,
@@ -101,11 +103,233 @@ class OptimizeGear(commands.Cog, name='Damage'):
             include_dungeon=include_dungeon,
             reforges_set=reforges_set
         )
+        best_route = await self.bot.optimizer_cache.get(problem)
+        if best_route is not None:
+            return await self.send_optimizer_result(ctx, profile, best_route, include_dungeon)
+
+        async def optimize():
+            # Show the quick heuristic result right away and edit it when the solver finds a better one
+            message = None
+            async for route in self.bot.optimizer_pool.solutions(problem, owner=self.job_owner(ctx),
+                                                                 queued=self.queue_reporter(ctx)):
+                message = await self.send_optimizer_result(ctx, profile, route, include_dungeon, message=message,
+                                                           searching=not route[0]['is optimized'])
+            if not route[0]['is optimized']:
+                # The solver gave up, the best result so far is final
+                await self.send_optimizer_result(ctx, profile, route, include_dungeon, message=message)
+            return route
+
+        best_route = await ctx.cancellable(optimize())
+        await self.bot.optimizer_cache.put(problem, best_route)
+
+    @commands.command(cls=CommandWithCooldown, cooldown_after_parsing=True)
+    @commands.cooldown(1, 60.0, commands.BucketType.user)
+    async def loadouts(self, ctx, player: str = '', profile: str = ''):
+        """
+        Optimizes every combination of your weapons, armor sets and pets and ranks them by damage.
+        """
+        await ctx.send(f'{ctx.author.mention}, Welcome to the loadout optimizer!\n'
+                       f'Please enter `exit` at any given point in the optimizer to exit')
+
+        player = await ask_for_skyblock_profiles(ctx, player, profile, session=self.bot.http_session,
+                                                 hypixel_api_client=self.bot.hypixel_api_client)
+        profile = player.profile
+
+        if player.online:
+            raise PlayerOnlineError
+
+        if not profile.enabled_api['skills'] or not profile.enabled_api['inventory']:
+            raise APIDisabledError(player.uname, profile.name)
+
+        if not profile.weapons:
+            raise NoWeaponError
+
+        if not DamageLoadouts.armor_sets(profile):
+            raise NoArmorError
+
+        include_dungeon = False
+        if profile.has_dungeon_items:
+            include_dungeon = await ctx.prompt(
+                embed=Embed(
+                    ctx=ctx,
+                    title="Do you want to use your items' dungeon stats? yes/no"
+                )
+            )
+
+        perfect_crit_chance = await ctx.prompt(embed=Embed(
+            ctx=ctx,
+            title='What would you like to optimize for?'
+        ).add_field(
+            value='\n\n'.join(f'> {o["emoji"]}\n`{o["name"]}`' for o in OPTIMIZER_GOALS)
+        ), emoji_list=[('💯', True), ('💥', False)])
+
+        attack_speed_limit = await self.prompt_for_attack_speed(ctx)
+
+        only_blacksmith, reforges_set, ignored_reforges = await self.prompt_for_reforges(ctx)
+
+        selected_pots = await self.prompt_for_potions(ctx, profile)
+
+        selected_buffs = await self.prompt_for_support_item(ctx, profile)
+
+        option_confirm = await self.confirm_options(ctx, perfect_crit_chance, attack_speed_limit, only_blacksmith,
+                                                    ignored_reforges, selected_pots, selected_buffs,
+                                                    profile.has_dungeon_items, include_dungeon)
+        if not option_confirm:
+            raise SessionTimeout
+
+        # Workers build the loadouts, only the ranked ones are built here
+        loadouts = DamageLoadouts(
+            profile,
+            perfect_crit_chance=perfect_crit_chance,
+            attack_speed_limit=attack_speed_limit,
+            only_blacksmith_reforges=only_blacksmith,
+            include_dungeon=include_dungeon,
+            reforges_set=reforges_set,
+            potions=selected_pots,
+            support_items=selected_buffs
+        )
+
+        await ctx.send(f'{ctx.author.mention}, Optimizing {len(loadouts):,} loadouts, this can take a while...\n'
+                       f'Enter `exit` to cancel.')
+        ranking, unsolved = await ctx.cancellable(self.bot.optimizer_pool.rank(
+            loadouts, limit=10, owner=self.job_owner(ctx), queued=self.queue_reporter(ctx)))
+
+        if not ranking:
+            return await ctx.send(f'{ctx.author.mention}, Optimization is not possible with the options you chose!\n'
+                                  f'Collect more talismans or raise your combat level before trying again.')
+
+        embed = Embed(
+            ctx=ctx,
+            title=f'Best {len(ranking)} of {len(loadouts):,} loadouts{" (partial)" if unsolved else ""}',
+            description=f'```{len(unsolved):,} loadouts could not be optimized in time, they are ranked by '
+                        f'quick estimates and better loadouts may be missing.```' if unsolved else None
+        ).add_footer(
+            text='Player\'s stats include pots.\n'
+                 '{s}'.format(s='Armor/Weapon includes dungeon stats.\n' if include_dungeon else '') +
+                 f'Use {ctx.prefix}optimizer with a loadout to see its reforges.'
+        )
+        for position, (index, (best_stats, _)) in enumerate(ranking, start=1):
+            loadout = loadouts.loadout(profile, index)
+            base_mod = emod('base', loadout.weapon) + loadout.stats.combat_bonus + (
+                loadout.stats.archery_bonus if loadout.weapon.type == 'bow' else 0)
+            base_damage = damage(best_stats['damage'], best_stats['strength'], best_stats['crit damage'], base_mod)
+            armor = '\n'.join(f'{piece}' for piece in loadout.armor.values() if piece is not None)
+            embed.add_field(
+                name=f'**#{position} > {base_damage:,.0f} base damage'
+                     f'{"" if best_stats["is optimized"] else " (estimate)"}**',
+                value=f'```{loadout.weapon}\n{armor}\n{format_pet(loadout.pet) if loadout.pet else None}```'
+                      f'```Strength > {best_stats["strength"]:.0f}\n'
+                      f'Crit damage > {best_stats["crit damage"]:.0f}%\n'
+                      f'Crit chance > {best_stats["crit chance"]:.0f}%\n'
+                      f'Attack speed > {best_stats["attack speed"]:.0f}%```',
+                inline=False
+            )
+
+        await embed.send()
+
+    @commands.command(cls=CommandWithCooldown, cooldown_after_parsing=True)
+    @commands.cooldown(1, 10.0, commands.BucketType.user)
+    async def reforges(self, ctx, player: str = '', profile: str = ''):
+        """
+        Optimizes your reforges for effective health, intelligence or speed.
+        """
+        await ctx.send(f'{ctx.author.mention}, Welcome to the reforges optimizer!\n'
+                       f'Please enter `exit` at any given point in the optimizer to exit')
+
+        player = await ask_for_skyblock_profiles(ctx, player, profile, session=self.bot.http_session,
+                                                 hypixel_api_client=self.bot.hypixel_api_client)
+        profile = player.profile
 
-        await self.send_optimizer_result(ctx, profile, best_route, include_dungeon)
+        if player.online:
+            raise PlayerOnlineError
+
+        if not profile.enabled_api['skills'] or not profile.enabled_api['inventory']:
+            raise APIDisabledError(player.uname, profile.name)
+
+        # The weapon's reforge counts too but a player without one can still reforge the rest
+        weapon = await self.prompt_for_weapon(ctx, profile)
+
+        armor = await self.prompt_for_armor(ctx, profile)
+        if not armor:
+            raise NoArmorError
+
+        pet = await self.prompt_for_pet(ctx, profile)
+
+        dungeon_item_used = any(item is not None and item.dungeon for item in (weapon, *armor.values()))
+        include_dungeon = False
+        if dungeon_item_used:
+            include_dungeon = await ctx.prompt(
+                embed=Embed(
+                    ctx=ctx,
+                    title="Do you want to use your items' dungeon stats? yes/no"
+                )
+            )
+
+        profile = profile.loadout(weapon=weapon, armor=armor, pet=pet, dungeon=include_dungeon)
+
+        profile_confirm = await self.confirm_equipment(ctx, profile)
+        if not profile_confirm:
+            raise SessionTimeout
+
+        goal = await ctx.prompt(embed=Embed(
+            ctx=ctx,
+            title='What would you like to optimize for?'
+        ).add_field(
+            value='\n\n'.join(f'> {o["emoji"]}\n`{o["name"]}`' for o in STAT_OPTIMIZER_GOALS)
+        ), emoji_list=[(o['emoji'], o['goal']) for o in STAT_OPTIMIZER_GOALS])
+
+        only_blacksmith = await ctx.prompt(embed=Embed(
+            ctx=ctx,
+            title='Do you only want to use reforges from the blacksmith? yes/no'
+        ))
+
+        problem = StatOptimizerProblem(
+            profile,
+            STAT_GOALS[goal],
+            only_blacksmith_reforges=only_blacksmith,
+            include_dungeon=include_dungeon
+        )
+        best_route = await self.bot.optimizer_cache.get(problem)
+        if best_route is None:
+            best_route = await ctx.cancellable(self.bot.optimizer_pool.run(
+                problem, solver=solve_stat_problem, owner=self.job_owner(ctx), queued=self.queue_reporter(ctx)))
+            await self.bot.optimizer_cache.put(problem, best_route)
+        await self.send_stat_optimizer_result(ctx, profile, problem, best_route)
+
+    @staticmethod
+    def job_owner(ctx):
+        return ctx.guild.id if ctx.guild else None, ctx.author.id
+
+    @staticmethod
+    def queue_reporter(ctx):
+        """
+        Return a callback for the optimizer queue that keeps one message with the author's place in it up to date.
+        """
+        message = None
+
+        async def queued(position):
+            nonlocal message
+            if position:
+                content = f'{ctx.author.mention}, You are #{position} in the optimizer queue.\n' \
+                          f'Please enter `exit` to leave the queue.'
+            else:
+                content = f'{ctx.author.mention}, Your turn! Optimizing...'
+            try:
+                if message is None:
+                    message = await ctx.send(content)
+                else:
+                    await message.edit(content=content)
+            except discord.HTTPException:
+                pass  # a missed update isn't worth losing the place in the queue
+
+        return queued
 
     @staticmethod
-    async def send_optimizer_result(ctx, profile, best_route, include_dungeon):
+    async def send_optimizer_result(ctx, profile, best_route, include_dungeon, *, message=None, searching=False):
+        """
+        Send the optimizer result, or edit `message` with it, and return the message.
+        `searching` results are the best so far while the optimizer still looks for better ones.
+        """
         weapon = profile.weapon
         best_stats = best_route[0] or {}
         best_equip = best_route[1] or {}
@@ -115,9 +339,13 @@ class OptimizeGear(commands.Cog, name='Damage'):
             return await ctx.send(f'{ctx.author.mention}, Optimization is not possible with the options you chose!\n'
                                   f'Collect more talismans or raise your combat level before trying again.')
 
+        if searching:
+            title = 'Optimizing...'
+        else:
+            title = 'Successful!' if is_optimized else 'Unsuccessful!'
         embed = Embed(
             ctx=ctx,
-            title='{s}'.format(s='Successful!' if is_optimized else 'Unsuccessful!')
+            title=title
         ).add_footer(
             text='Player\'s stats include pots.\n'
                  '{s}'.format(s='Armor/Weapon includes dungeon stats.\n' if include_dungeon else '') +
@@ -196,7 +424,14 @@ class OptimizeGear(commands.Cog, name='Damage'):
                   f'{weapon_damage_after}```{after_damage}'
         )
 
-        if not is_optimized:
+        if searching:
+            embed.add_field(
+                name='**Searching**',
+                value='This is the best result found so far.\n'
+                      'This message will be updated when the bot finds a better one.',
+                inline=False
+            )
+        elif not is_optimized:
             embed.add_field(
                 name='**Warning**',
                 value='The bot took too long to optimize your gear so it gave up.\n'
@@ -204,7 +439,62 @@ class OptimizeGear(commands.Cog, name='Damage'):
                 inline=False
             )
 
-        await embed.send()
+        if message is not None:
+            return await embed.edit(message)
+        return await embed.send()
+
+    @staticmethod
+    async def send_stat_optimizer_result(ctx, profile, problem, best_route):
+        """
+        Send the stat optimizer result with the goal's stats before and after reforging.
+        """
+        best_stats, best_equip = best_route
+        goal = problem.goal
+
+        if not best_equip:
+            return await ctx.send(f'{ctx.author.mention}, Optimization is not possible with the options you chose!')
+
+        embed = Embed(
+            ctx=ctx,
+            title='Successful!' if best_stats['is optimized'] else 'Unsuccessful!'
+        ).add_footer(
+            text='{s}'.format(s='Armor/Weapon includes dungeon stats.\n' if problem.include_dungeon else '') +
+                 'Please make sure your "before" stats are correct before reforging.'
+        )
+
+        for equipment in best_equip:
+            for rarity in best_equip[equipment]:
+                text = colorize(' + '.join([f'{best_equip[equipment][rarity][reforge]} {reforge.title()}' for reforge in
+                                            best_equip[equipment][rarity]]), RARITY_COLORS[rarity])
+                embed.add_field(
+                    name=f'**{rarity.title()} {equipment.title()}**',
+                    value=text,
+                    inline=False
+                )
+
+        before_stats = {stat: profile.stats.get_stat(stat, dungeon=problem.include_dungeon) for stat in goal.stats}
+        for stat, cap in problem.caps.items():
+            before_stats[stat] = min(before_stats[stat], cap)
+        before_stats[goal.name] = goal.objective(before_stats)
+
+        names = dict.fromkeys((*goal.stats, goal.name))
+        embed.add_field(
+            name='**Before**',
+            value='```' + '\n'.join(f'{name.capitalize()} > {before_stats[name]:,.0f}' for name in names) + '```'
+        )
+        embed.add_field(
+            name='**After**',
+            value='```' + '\n'.join(f'{name.capitalize()} > {best_stats[name]:,.0f}' for name in names) + '```'
+        )
+
+        if not best_stats['is optimized']:
+            embed.add_field(
+                name='**Warning**',
+                value='The bot took too long to optimize your gear so it gave up.\n'
+                      'This result is the best it could do in the allotted time.',
+                inline=False
+            )
+        return await embed.send()
 
     @staticmethod
     async def prompt_for_attack_speed(ctx):
@@ -373,13 +663,13 @@ class OptimizeGear(commands.Cog, name='Damage'):
 
     @staticmethod
     async def prompt_for_potions(ctx, profile):
-        weapon = profile.weapon
+        # Without a chosen weapon, like for every loadout at once, any bow is enough to ask for archery
+        weapons = [profile.weapon] if profile.weapon else profile.weapons
         selected_pots = []
         for name, pot in DAMAGE_POTIONS.items():
-            buff = pot['stats']
             levels = pot['levels']
 
-            if weapon.type != 'bow' and name == 'archery':
+            if all(weapon.type != 'bow' for weapon in weapons) and name == 'archery':
                 continue
 
             emoji_list = [(NUMBER_EMOJIS[level], level) for level in levels]
@@ -392,12 +682,6 @@ class OptimizeGear(commands.Cog, name='Damage'):
 
             selected_pots.append((name, selected_level))
 
-            for stat, amount in buff.items():
-                if stat == 'archery bonus':
-                    profile.stats.archery_bonus += amount[selected_level]
-                else:
-                    profile.stats.add_stat(stat, amount[selected_level])
-
             if name == 'dungeon' and selected_level > 0 or name == 'god' and selected_level == 1:
                 break
         return selected_pots
@@ -407,14 +691,11 @@ class OptimizeGear(commands.Cog, name='Damage'):
         selected_buffs = []
         for name, orb in SUPPORT_ITEMS.items():
             internal_name = orb['internal']
-            buff = orb['stats']
 
             if internal_name in profile.inventory or internal_name in profile.echest:
                 confirm = await ctx.prompt(message=f'{ctx.author.mention}, Will you be using your `{name}`?')
                 if confirm:
                     selected_buffs.append(name)
-                    for stat, amount in buff.items():
-                        profile.stats.add_stat(stat, amount)
         return selected_buffs
 
     async def prompt_for_reforges(self, ctx):
@@ -1,8 +1,7 @@
 from discord.ext import commands
 
 from lib import APIDisabledError
-from utils import Embed, CommandWithCooldown, ask_for_skyblock_profiles
-from constants import TALISMANS
+from utils import Embed, CommandWithCooldown, ask_for_skyblock_profiles, TALISMAN_CATALOG
 
 
 class ViewMissing(commands.Cog, name='Damage'):
@@ -31,18 +30,13 @@ class ViewMissing(commands.Cog, name='Damage'):
         if not profile.enabled_api['inventory']:
             raise APIDisabledError(player.uname, profile.name)
 
-        talismans = TALISMANS.copy()
-        for talisman in profile.talismans:
-            if talisman.active:
-                for regex in TALISMANS.keys():
-                    if regex.match(talisman.internal_name):
-                        talismans.pop(regex)
+        talismans = [TALISMAN_CATALOG.names[index] for index in TALISMAN_CATALOG.missing(profile.talismans)]
 
         embed = Embed(
             ctx=ctx,
             title=f'{player.uname} | {profile.name.capitalize()}',
             description=f'```This profile is currently missing '
-                        f'{len(talismans)}/{len(TALISMANS)} talisman{"" if len(talismans) == 1 else "s"}!```'
+                        f'{len(talismans)}/{len(TALISMAN_CATALOG)} talisman{"" if len(talismans) == 1 else "s"}!```'
         ).set_thumbnail(
             url=player.get_avatar_url()
         )
@@ -50,7 +44,7 @@ class ViewMissing(commands.Cog, name='Damage'):
         if talismans:
             embed.add_field(
                 name='[Roughly sorted by price]',
-                value='```' + '\n'.join(talismans.values()) + '```',
+                value='```' + '\n'.join(talismans) + '```',
                 inline=False
             )
 
@@ -24,8 +24,7 @@ class ViewPlayer(commands.Cog, name='Spy'):
         Displays a player\'s guild, skills, and slayer levels.
         """
         player = await ask_for_skyblock_profiles(ctx, player, profile, session=self.bot.http_session,
-                                                 hypixel_api_client=self.bot.hypixel_api_client, auto_set=True,
-                                                 get_guild=True)
+                                                 hypixel_api_client=self.bot.hypixel_api_client, get_guild=True)
         profile = player.profile
         guild = player.guild
 
@@ -45,7 +44,7 @@ class ViewPlayer(commands.Cog, name='Spy'):
                         f'```Deaths > {profile.deaths:,}\n'
                         f'Guild > {guild.name if guild else None}\n'
                         f'Money > {profile.bank_balance + profile.purse:,.2f}\n'
-                        f'Pet > {format_pet(profile.pet)}```'
+                        f'Pet > {format_pet(profile.active_pet)}```'
         ).add_field(
             name=f'🔰 \tSkills',
             value=f'```Average > {profile.skill_average:.2f}\n'
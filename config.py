@@ -10,6 +10,13 @@ API_KEY = os.getenv('API_KEY')
 SCIP_TIMELIMIT = os.getenv('SCIP_TIMELIMIT', 4)
 DATABASE_URI = os.getenv('DATABASE_URI')
 MAINTAINER_IDS = os.getenv('MAINTAINER_IDS', '')
+HYPIXEL_CACHE_SIZE = int(os.getenv('HYPIXEL_CACHE_SIZE', 1024))
+GUILD_LOAD_CONCURRENCY = int(os.getenv('GUILD_LOAD_CONCURRENCY', 10))
+PROFILE_SNAPSHOT_MAX_AGE = int(os.getenv('PROFILE_SNAPSHOT_MAX_AGE', 86400))
+OPTIMIZER_WORKERS = int(os.getenv('OPTIMIZER_WORKERS', 2))
+OPTIMIZER_TIMEOUT = float(os.getenv('OPTIMIZER_TIMEOUT', 30))
+OPTIMIZER_BACKEND = os.getenv('OPTIMIZER_BACKEND', 'scip')
+OPTIMIZER_CACHE_SIZE = int(os.getenv('OPTIMIZER_CACHE_SIZE', 1024))
 
 COG_EXTENSIONS = [
     # Event/Error handler
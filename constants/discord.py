@@ -3,6 +3,13 @@ OPTIMIZER_GOALS = [
     {'emoji': '💥', 'name': 'Maximum damage'}
 ]
 
+# Goals of the stat optimizer, `goal` is their name in lib.optimizer.STAT_GOALS
+STAT_OPTIMIZER_GOALS = [
+    {'emoji': '🏰', 'name': 'Effective health', 'goal': 'ehp'},
+    {'emoji': '🧠', 'name': 'Intelligence', 'goal': 'intelligence'},
+    {'emoji': '💨', 'name': 'Speed', 'goal': 'speed'},
+]
+
 WHITE = ('', '')
 GRAY = ('bf', '')
 PUKE = ('css', '')
@@ -59,52 +66,6 @@ PET_EMOJIS = {
     'GOLEM': '🗿',
 }
 
-DAMAGE_POTIONS = {
-    'god': {
-        'stats': {'strength': [0, 78.8], 'crit chance': [0, 25], 'crit damage': [0, 40], 'speed': [0, 228], 'defense': [0, 66], 'archery bonus': [0,80]},
-        'levels': [0, 1]
-    },
-    'dungeon': {
-        'stats': {'strength': [0, 20, 20, 20, 30, 30, 30], 'crit chance': [0, 10, 10, 15, 15, 20, 20],
-                  'crit damage': [0, 10, 10, 20, 20, 30, 30], 'speed': [0, 5, 10, 10, 10, 10, 15],
-                  'defense': [0, 5, 5, 10, 15, 20, 20],
-                  'archery bonus': [0, 0, 0, 0, 12.5, 25, 50]},
-        'levels': [0, 1, 2, 3, 4, 5, 6]
-    },
-    'critical': {
-        'stats': {'crit chance': [0, 10, 15, 20, 25], 'crit damage': [0, 10, 20, 30, 40]},
-        'levels': [0, 3, 4]
-    },
-    'strength': {
-        # Assume cola
-        'stats': {'strength': [0, 5.25, 13.125, 21, 31.5, 42, 52.5, 63, 78.75]},
-        'levels': [0, 5, 6, 7, 8]
-    },
-    'spirit': {
-        'stats': {'crit damage': [0, 10, 20, 30, 40]},
-        'levels': [0, 3, 4]
-    },
-    'archery': {
-        'stats': {'archery bonus': [0, 17.5, 30, 55, 80]},
-        'levels': [0, 3, 4]
-    }
-}
-
-SUPPORT_ITEMS = {
-    'weird tuba': {
-        'internal': 'WEIRD_TUBA',
-        'stats': {'strength': 30}
-    },
-    'mana flux': {
-        'internal': 'MANA_FLUX_POWER_ORB',
-        'stats': {'strength': 10}
-    },
-    'overflux': {
-        'internal': 'OVERFLUX_POWER_ORB',
-        'stats': {'strength': 25}
-    }
-}
-
 NUMBER_EMOJIS = ['0️⃣', '1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
 
 SKILL_EMOJIS = {
@@ -1,9 +1,14 @@
 from .exceptions import *
 from .guild import Guild
-from .stats import ProfileStats, ItemStats, PetStats
-from .item import Item, decode_inventory_data
+from .stats import ProfileStats, LoadoutStats, ItemStats, PetStats
+from .nbt import parse_nbt, decompress_nbt
+from .item import Item, ItemDefinition, decode_inventory_data
 from .pet import Pet
 from .profile import Profile
+from .snapshots import ProfileSnapshotStore
 from .player import Player
-from .optimizer import damage_optimizer
+from .optimizer import damage_optimizer, DamageOptimizerProblem, DamageLoadouts, stat_optimizer, StatOptimizerProblem, \
+    OptimizerGoal, STAT_GOALS
+from .optimizer_pool import OptimizerPool
+from .optimizer_cache import OptimizerResultCache
 from .api import HypixelAPIClient
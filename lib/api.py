@@ -1,11 +1,119 @@
 import aiohttp
 import asyncio
+import functools
+import heapq
+import itertools
+import time
+from collections import OrderedDict
 from urllib.parse import quote
 
 from . import Player
 from . import HypixelResponseCodeError, HypixelAPITimeout, HypixelAPINoSuccess, HypixelAPIRateLimitError
 
 
+class HypixelRateLimiter:
+    """
+    Async token bucket kept in sync with the `RateLimit-*` headers hypixel sends back.
+
+    Requests wait in a queue ordered by priority (lower goes first) instead of being sent into a 429.
+    Tokens refill continuously at `limit` per `period` seconds, every response caps the bucket to the
+    remaining amount hypixel reports and an exhausted bucket stays empty until hypixel says it resets.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, *, limit: int = 120, period: float = 60.0):
+        self.loop = loop
+        self.limit = limit
+        self.period = period
+
+        self.tokens = float(limit)
+        self._updated_at = time.monotonic()
+        self._reset_at = None
+
+        self._waiters = []
+        self._counter = itertools.count()
+        self._wakeup_handle = None
+
+    def __len__(self):
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _refill(self):
+        now = time.monotonic()
+        if self._reset_at is not None:
+            if now >= self._reset_at:
+                self._reset_at = None
+                self.tokens = float(self.limit)
+        else:
+            self.tokens = min(float(self.limit), self.tokens + (now - self._updated_at) * self.limit / self.period)
+        self._updated_at = now
+
+    async def acquire(self, priority: int = 0):
+        """
+        Wait until a token is available for a request with `priority` and take it.
+        """
+        self._refill()
+        if not self._waiters and self.tokens >= 1:
+            self.tokens -= 1
+            return
+
+        future = self.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._schedule_wakeup()
+        await future
+
+    def update(self, headers, *, status: int = 200):
+        """
+        Sync the bucket with the rate limit headers of a hypixel response.
+        """
+        self._refill()
+
+        limit = headers.get('RateLimit-Limit')
+        remaining = headers.get('RateLimit-Remaining')
+        reset = headers.get('RateLimit-Reset', headers.get('Retry-After'))
+
+        if limit is not None and limit.isdigit():
+            self.limit = int(limit)
+        if remaining is not None and remaining.isdigit():
+            self.tokens = min(self.tokens, float(remaining))
+        if status == 429:
+            self.tokens = 0.0
+
+        if self.tokens < 1 and reset is not None and reset.isdigit():
+            self._reset_at = time.monotonic() + int(reset)
+        elif status == 429:
+            self._reset_at = time.monotonic() + self.period
+
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+
+        self._release()
+        if not self._waiters:
+            return
+
+        if self._reset_at is not None:
+            delay = self._reset_at - time.monotonic()
+        else:
+            delay = (1 - self.tokens) * self.period / self.limit
+        self._wakeup_handle = self.loop.call_later(max(delay, 0), self._schedule_wakeup)
+
+    def _release(self):
+        """
+        Hand out the available tokens to the queued requests in priority order.
+        """
+        self._refill()
+        while self._waiters and self.tokens >= 1:
+            *_, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # waiter got cancelled
+            self.tokens -= 1
+            future.set_result(None)
+        while self._waiters and self._waiters[0][-1].done():
+            heapq.heappop(self._waiters)
+
+
 class HypixelAPIClient:
     """
     Hypixel API wrapper.
@@ -13,11 +121,34 @@ class HypixelAPIClient:
 
     _url = 'https://api.hypixel.net'
 
-    def __init__(self, api_key, loop: asyncio.AbstractEventLoop, **kwargs):
+    # Request priorities for the rate limiter queue, interactive lookups go ahead of bulk fan-out
+    PRIORITY_INTERACTIVE = 0
+    PRIORITY_BULK = 1
+
+    # Seconds a successful response is served from cache per endpoint, endpoints not listed here are never cached
+    _cache_ttls = {
+        'skyblock/bazaar': 20,
+        'skyblock/profiles': 60,
+        'player': 60,
+        'guild': 300,
+    }
+
+    def __init__(self, api_key, loop: asyncio.AbstractEventLoop, *, cache_size: int = 1024, **kwargs):
         self.key = api_key
         self.loop = loop
         self.session = None
 
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._pending_requests = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+
+        self.rate_limiter = HypixelRateLimiter(loop)
+        # Optional ProfileSnapshotStore players read their skyblock profiles through
+        self.profile_snapshots = None
+
         self._ready = asyncio.Event(loop=loop)
         self._creation_task = None
         self._default_session_kwargs = kwargs
@@ -81,18 +212,115 @@ class HypixelAPIClient:
                 response_text = await response.text()
                 raise HypixelResponseCodeError(response=response, response_text=response_text)
 
-    async def request(self, method: str, endpoint: str, *, raise_for_status: bool = True, **kwargs):
+    @staticmethod
+    def _cache_key(method: str, endpoint: str, params: dict):
+        return method.upper(), endpoint, tuple(sorted((k, str(v)) for k, v in params.items() if k != 'key'))
+
+    def _get_cached(self, cache_key):
+        """
+        Return the cached response for `cache_key` or None if it's missing or expired.
+        """
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._cache[cache_key]
+            self.cache_evictions += 1
+            return None
+
+        self._cache.move_to_end(cache_key)
+        return response
+
+    def _set_cached(self, cache_key, response, ttl):
+        self._cache[cache_key] = (time.monotonic() + ttl, response)
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+            self.cache_evictions += 1
+
+    def clear_cache(self):
+        """
+        Drop every cached response.
+        """
+        self._cache.clear()
+
+    def cache_stats(self):
+        """
+        Return the response cache counters.
+        """
+        return {
+            'size': len(self._cache),
+            'max size': self._cache_size,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'evictions': self.cache_evictions,
+            'in flight': len(self._pending_requests),
+        }
+
+    async def request(self, method: str, endpoint: str, *, raise_for_status: bool = True, use_cache: bool = True,
+                      priority: int = PRIORITY_INTERACTIVE, **kwargs):
         """
         A HTTP request to the Hypixel API and return the JSON response.
+
+        GET responses of endpoints in `_cache_ttls` are cached and identical requests in flight share one call.
+        Requests that do reach hypixel are queued by `priority` in the rate limiter, a request sharing a call in
+        flight keeps the priority of the request that started it.
+        """
+        ttl = self._cache_ttls.get(endpoint, 0)
+        if not use_cache or ttl <= 0 or method.upper() != 'GET':
+            return await self._request(method, endpoint, raise_for_status=raise_for_status, priority=priority,
+                                       **kwargs)
+
+        cache_key = self._cache_key(method, endpoint, kwargs.get('params', {}))
+        response = self._get_cached(cache_key)
+        if response is not None:
+            self.cache_hits += 1
+            return response
+
+        if cache_key in self._pending_requests:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            # The call runs in its own task so cancelling any of the requests sharing it never cancels it
+            task = self.loop.create_task(self._cached_request(cache_key, ttl, method, endpoint,
+                                                              raise_for_status=raise_for_status, priority=priority,
+                                                              **kwargs))
+            task.add_done_callback(functools.partial(self._forget_request, cache_key))
+            self._pending_requests[cache_key] = task
+        return await asyncio.shield(self._pending_requests[cache_key])
+
+    def _forget_request(self, cache_key, task):
+        """
+        Stop sharing the finished request for `cache_key`.
+        """
+        del self._pending_requests[cache_key]
+        # Mark the exception as retrieved in case every request waiting for it was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _cached_request(self, cache_key, ttl, method: str, endpoint: str, **kwargs):
+        """
+        Send the HTTP request shared by the requests for `cache_key` and cache its response for `ttl` seconds.
+        """
+        response = await self._request(method, endpoint, **kwargs)
+        self._set_cached(cache_key, response, ttl)
+        return response
+
+    async def _request(self, method: str, endpoint: str, *, raise_for_status: bool = True,
+                       priority: int = PRIORITY_INTERACTIVE, **kwargs):
+        """
+        Send the HTTP request to the Hypixel API without going through the cache.
         """
         await self._ready.wait()
+        await self.rate_limiter.acquire(priority)
 
         # Add API key to params
-        if 'params' not in kwargs:
-            kwargs['params'] = {}
-        kwargs['params']['key'] = self.key
+        kwargs['params'] = {**kwargs.get('params', {}), 'key': self.key}
         try:
             async with self.session.request(method.upper(), self._url_for(endpoint), **kwargs) as resp:
+                self.rate_limiter.update(resp.headers, status=resp.status)
                 await self.maybe_raise_for_status(resp, raise_for_status)
                 resp = await resp.json()
                 if resp is None or 'success' not in resp:
@@ -0,0 +1,842 @@
+import abc
+import math
+import time
+
+import numpy
+
+from constants import RARITIES
+from utils import reforge_class
+
+# Stats the damage problem reads from a reforge, in the order of the talisman grid axes
+_STRENGTH, _CRIT_DAMAGE, _CRIT_CHANCE, _ATTACK_SPEED = 'strength', 'crit damage', 'crit chance', 'attack speed'
+
+# Grid cells no talisman combination reaches, they stay far below _REACHABLE even after adding crit damage to them
+_UNREACHABLE = numpy.iinfo(numpy.int32).min // 4
+_REACHABLE = _UNREACHABLE // 2
+_EPSILON = 1e-9
+# Missing crit chance or extra attack speed costs far more than any damage the heuristic could gain from it
+_PENALTY = 1e12
+# Smallest objective gain the heuristic still takes a step for
+_IMPROVEMENT = 1e-6
+
+
+class _SearchTimeout(Exception):
+    """
+    A native search ran past its deadline.
+    """
+
+
+def _reforge_options(problem, equipment_type, rarity, stats):
+    """
+    Reforges an item of that equipment type and rarity can get with their values of `stats`, in table order.
+    """
+    table = problem.reforge_table
+    class_index, rarity_index = table.class_index(equipment_type), table.rarity_index(rarity)
+    indices = numpy.flatnonzero(problem.allowed_reforges[class_index, rarity_index])
+    values = [table.stat_column(stat)[class_index, rarity_index, indices].tolist() for stat in stats]
+    return [(table.reforge_name(equipment_type, index), vector)
+            for index, vector in zip(indices.tolist(), zip(*values))]
+
+
+def _pareto(points, *, key, value):
+    """
+    Drop points whose `value` tuple is dominated by another point with the same `key`.
+    Equal points keep the first one.
+    """
+    groups = {}
+    for point in points:
+        groups.setdefault(key(point), []).append(point)
+
+    kept = []
+    for group in groups.values():
+        # Sorting best first means a point can only be dominated by points already kept
+        group.sort(key=value, reverse=True)
+        front = []
+        for point in group:
+            point_value = value(point)
+            if not any(all(a >= b for a, b in zip(value(other), point_value)) for other in front):
+                front.append(point)
+        kept.extend(front)
+    return kept
+
+
+class _DamageModel:
+    """
+    Objective and reported stats of the damage optimizer for a DamageOptimizerProblem.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.uses_attack_speed = problem.uses_attack_speed and bool(problem.attack_speed_limit)
+        self.uses_crit_chance = bool(problem.perfect_crit_chance)
+        self.variable_multiplier = not problem.only_blacksmith_reforges
+        self.tarantula_helmet = problem.helmet_name == 'TARANTULA_HELMET'
+
+        self.base_strength = problem.base_stats[_STRENGTH]
+        self.base_crit_damage = problem.base_stats[_CRIT_DAMAGE]
+        self.base_crit_chance = problem.base_stats[_CRIT_CHANCE]
+        self.base_attack_speed = problem.base_stats[_ATTACK_SPEED]
+        self.feasible = True
+
+    def _gear_slots(self):
+        """
+        One slot per weapon and armor piece, with every reforge it can get as a stat vector.
+        Vector is (strength, crit damage, crit chance, attack speed, weapon damage, renowned pieces).
+        """
+        problem = self.problem
+        slots = []
+        for equipment_type in problem.equipment_types[1:]:
+            rarity = next((rarity for rarity, count in problem.counts[equipment_type].items() if count > 0), None)
+            if rarity is None:
+                continue
+            coefficients = {stat: sum(problem.children_coefficients[equipment_type][stat])
+                            for stat in problem.stat_names}
+            options = []
+            stats = (_STRENGTH, _CRIT_DAMAGE, _CRIT_CHANCE, _ATTACK_SPEED, 'damage')
+            for reforge, (strength, crit_damage, crit_chance, attack_speed, damage) in _reforge_options(
+                    problem, equipment_type, rarity, stats):
+                options.append((reforge, (
+                    coefficients[_STRENGTH] * strength,
+                    coefficients[_CRIT_DAMAGE] * crit_damage,
+                    coefficients[_CRIT_CHANCE] * crit_chance,
+                    coefficients[_ATTACK_SPEED] * attack_speed,
+                    damage if problem.variable_weapon_damage and equipment_type == 'sword' else 0,
+                    int(reforge == 'renowned' and equipment_type in problem.armor_types and self.variable_multiplier),
+                )))
+            slots.append((equipment_type, rarity, options))
+        return slots
+
+    def _objective(self, multiplier, strength, crit_damage, attack_speed, weapon_damage):
+        problem = self.problem
+        strength = multiplier * strength
+        floored_strength = numpy.floor(strength / 5 + _EPSILON)
+        crit_damage = multiplier * (crit_damage + (strength / 10 if self.tarantula_helmet else 0))
+        damage = (5 + weapon_damage + floored_strength) * (1 + strength / 100) * (1 + crit_damage / 100)
+        if problem.attack_speed_limit:
+            if problem.uses_attack_speed:
+                return damage * (((multiplier * attack_speed + 100) / 100) / 0.5)
+            return damage * (((100 + 100) / 100) / 0.5)
+        return damage
+
+    def _weapon_damage(self, gear_damage):
+        if self.problem.variable_weapon_damage:
+            return self.problem.weapon_base_damage + gear_damage
+        return self.problem.weapon_damage
+
+    def _talisman_items(self):
+        """
+        One entry per talisman rarity with its amount and its non dominated reforges, as nested tuples.
+        Reforge vectors are (strength, crit damage, crit chance, attack speed) with untracked stats zeroed.
+        """
+        items = []
+        for rarity in RARITIES:
+            amount = self.problem.counts['talisman'].get(rarity, 0)
+            if amount <= 0:
+                continue
+            options = [(reforge, (
+                strength,
+                crit_damage,
+                crit_chance if self.uses_crit_chance else 0,
+                attack_speed if self.uses_attack_speed else 0,
+            )) for reforge, (strength, crit_damage, crit_chance, attack_speed) in _reforge_options(
+                self.problem, 'talisman', rarity, (_STRENGTH, _CRIT_DAMAGE, _CRIT_CHANCE, _ATTACK_SPEED))]
+            options = tuple(_pareto(options, key=lambda option: option[1][3], value=lambda option: option[1][:3]))
+            if not options:
+                # Every reforge of this rarity is excluded, same as an infeasible scip model
+                self.feasible = False
+                continue
+            items.append((rarity, amount, options))
+        return tuple(items)
+
+    def _crit_chance_cap(self, items):
+        """
+        Crit chance above what the lowest multiplier and no gear would need never matters, so grids are capped there.
+        """
+        if not self.uses_crit_chance:
+            return 0
+        needed = math.ceil(99.5 / self.problem.multiplier - self.base_crit_chance - _EPSILON)
+        most = sum(amount * max(vector[2] for _, vector in options) for _, amount, options in items)
+        return max(0, min(needed, most))
+
+    def _attack_speed_cap(self, items):
+        """
+        Talisman attack speed above what the limit allows with the lowest multiplier and gear attack speed never
+        fits, so grids drop it.
+        """
+        most = sum(amount * max(vector[3] for _, vector in options) for _, amount, options in items)
+        if not self.uses_attack_speed:
+            return most
+        gear = sum(min(vector[3] for _, vector in options) for _, _, options in self._gear_slots() if options)
+        allowed = math.floor((self.problem.attack_speed_limit + _EPSILON) / self.problem.multiplier
+                             - self.base_attack_speed - gear + _EPSILON)
+        return min(allowed, most)
+
+    def grid_caps(self, items):
+        """
+        Crit chance and attack speed caps of the talisman grid of this problem.
+        """
+        return self._crit_chance_cap(items), self._attack_speed_cap(items)
+
+    def upper_bound(self):
+        """
+        Objective no reforges can beat, crit chance is ignored. Return -inf when some item has no allowed reforge.
+        """
+        problem = self.problem
+        # Reforge vectors of every item group and how many items share them
+        groups = []
+        for rarity in RARITIES:
+            amount = problem.counts['talisman'].get(rarity, 0)
+            if amount > 0:
+                options = _reforge_options(problem, 'talisman', rarity,
+                                           (_STRENGTH, _CRIT_DAMAGE, _CRIT_CHANCE, _ATTACK_SPEED))
+                groups.append((amount, [vector + (0, 0) for _, vector in options]))
+        groups.extend((1, [vector for _, vector in options]) for _, _, options in self._gear_slots())
+        if any(not vectors for _, vectors in groups):
+            return -numpy.inf
+        vectors = numpy.array([vector for _, group_vectors in groups for vector in group_vectors], dtype=numpy.float64)
+        amounts = numpy.array([amount for amount, _ in groups], dtype=numpy.float64)[:, numpy.newaxis]
+        starts = numpy.cumsum([0] + [len(group_vectors) for _, group_vectors in groups])[:-1]
+
+        # Every renowned piece count gives its own multiplier
+        renowned = int((numpy.maximum.reduceat(vectors, starts) * amounts).sum(axis=0)[5])
+        return max(self._upper_bound(problem.multiplier + 0.01 * count, vectors, amounts, starts)
+                   for count in range(renowned + 1))
+
+    def _upper_bound(self, multiplier, vectors, amounts, starts):
+        """
+        Upper bound of the objective of the solutions with that multiplier.
+
+        The objective is a product of factors that each grow linearly with the reforge totals. By the weighted AM-GM
+        inequality the product is at most (sum of weighted factors / n) ^ n divided by the product of the weights,
+        and a weighted sum is maximized by every item on its own.
+        """
+        problem = self.problem
+        strength = numpy.array([multiplier, 0, 0, 0, 0, 0])
+        crit_damage = numpy.array([0, multiplier, 0, 0, 0, 0]) + (multiplier * strength / 10
+                                                                   if self.tarantula_helmet else 0)
+        # Factors as constant + coefficients . reforge totals
+        factors = [
+            (5 + self._weapon_damage(0) + multiplier * self.base_strength / 5,
+             strength / 5 + (numpy.array([0, 0, 0, 0, 1, 0]) if problem.variable_weapon_damage else 0)),
+            (1 + multiplier * self.base_strength / 100, strength / 100),
+            (1 + multiplier * (self.base_crit_damage + (multiplier * self.base_strength / 10
+                                                        if self.tarantula_helmet else 0)) / 100, crit_damage / 100),
+        ]
+        constant_factor = 1
+        attack_speed_cap = None
+        if problem.attack_speed_limit:
+            if problem.uses_attack_speed:
+                factors.append(((multiplier * self.base_attack_speed + 100) / 50,
+                                numpy.array([0, 0, 0, multiplier, 0, 0]) / 50))
+                attack_speed_cap = (problem.attack_speed_limit + 100) / 50
+            else:
+                constant_factor = 4
+        constants = numpy.array([constant for constant, _ in factors])
+        coefficients = numpy.array([coefficient for _, coefficient in factors])
+
+        def extreme(function, scores):
+            return (function.reduceat(scores, starts, axis=0) * amounts).sum(axis=0)
+
+        lowest = constants + extreme(numpy.minimum, vectors @ coefficients.T)
+        highest = constants + extreme(numpy.maximum, vectors @ coefficients.T)
+        if attack_speed_cap is not None:
+            highest[-1] = min(highest[-1], attack_speed_cap)
+        if (lowest <= 0).any():
+            # No bound from factors that can be negative
+            return numpy.inf
+        # Every factor at its own best
+        loose = constant_factor * highest.prod()
+
+        # Weights that balance the factors at their best, and a few skewed ones around them
+        count = len(factors)
+        skews = numpy.array(numpy.meshgrid(*[(0.6, 0.8, 1, 1.25, 1.6)] * count)).reshape(count, -1).T
+        weights = skews / highest
+        bounds = ((weights @ constants + extreme(numpy.maximum, vectors @ coefficients.T @ weights.T)) / count
+                  ) ** count / weights.prod(axis=1)
+        if attack_speed_cap is not None:
+            # Attack speed factor at its cap times the bound of the other factors
+            others = weights[:, :-1]
+            capped = ((others @ constants[:-1] + extreme(numpy.maximum, vectors @ coefficients[:-1].T @ others.T)) /
+                      (count - 1)) ** (count - 1) / others.prod(axis=1)
+            bounds = numpy.minimum(bounds, capped * attack_speed_cap)
+        return min(loose, constant_factor * bounds.min())
+
+    def stats_for(self, counts):
+        """
+        Stats the damage optimizer reports for a set of reforge counts.
+        """
+        problem = self.problem
+        table = problem.reforge_table
+        totals = {stat: 0 for stat in problem.stat_names}
+        weapon_damage = 0
+        renowned = 0
+        for (equipment_type, rarity, reforge), count in counts.items():
+            index = (table.class_index(equipment_type), table.rarity_index(rarity),
+                     table.reforge_index(equipment_type, reforge))
+            for stat in problem.stat_names:
+                coefficient = 1 if equipment_type == 'talisman' else sum(
+                    problem.children_coefficients[equipment_type][stat])
+                totals[stat] += coefficient * int(table.stat_column(stat)[index]) * count
+            if problem.variable_weapon_damage and equipment_type == 'sword':
+                weapon_damage += int(table.stat_column('damage')[index]) * count
+            if reforge == 'renowned' and equipment_type in problem.armor_types and self.variable_multiplier:
+                renowned += count
+
+        multiplier = problem.multiplier + 0.01 * renowned
+        strength = multiplier * (self.base_strength + totals[_STRENGTH])
+        crit_damage = multiplier * (self.base_crit_damage + totals[_CRIT_DAMAGE] +
+                                    (strength / 10 if self.tarantula_helmet else 0))
+        return {
+            'strength': strength,
+            'crit damage': crit_damage,
+            'crit chance': multiplier * (self.base_crit_chance + totals[_CRIT_CHANCE]),
+            'attack speed': multiplier * (self.base_attack_speed + totals[_ATTACK_SPEED])
+            if problem.uses_attack_speed else 100,
+            'is optimized': True,
+            'damage': self._weapon_damage(weapon_damage),
+        }
+
+
+class _TalismanGrid:
+    """
+    Every talisman reforge total, found with a dynamic program over a grid indexed by
+    (crit chance, attack speed, strength) that keeps the highest crit damage of each cell.
+    The grid grows with every talisman to the totals it can reach, and drops attack speed no problem can use.
+    A grid only depends on the talisman reforges and its caps, so problems sharing them share the grid.
+    Raise _SearchTimeout when building it takes past `deadline`, a time.monotonic() value.
+    """
+
+    def __init__(self, items, crit_chance_cap, attack_speed_cap, deadline=None):
+        self.items = items
+        self.crit_chance_cap = crit_chance_cap
+        # Attack speed above this can't come back under the cap with the attack speed later talismans take away
+        self.attack_speed_high = attack_speed_cap + sum(amount * max(0, -min(vector[3] for _, vector in options))
+                                                        for _, amount, options in items)
+
+        grid = numpy.zeros((1, 1, 1), dtype=numpy.int32)
+        self.attack_speed_low = self.strength_low = 0
+        # Winning reforge of every cell after each talisman, which crit chance row fed the capped row,
+        # and the attack speed and strength of the first column of the grid
+        self._layers = []
+        for rarity, amount, options in items:
+            for _ in range(amount):
+                if deadline is not None and time.monotonic() > deadline:
+                    raise _SearchTimeout
+                grid = self._add_talisman(grid, options)
+        self.grid = grid
+
+        # Best crit damage with at least that much crit chance
+        self.grid_at_least = numpy.maximum.accumulate(grid[::-1], axis=0)[::-1]
+        self.attack_speed_values = numpy.arange(grid.shape[1]) + self.attack_speed_low
+        self.strength_values = numpy.arange(grid.shape[2]) + self.strength_low
+
+    def _add_talisman(self, grid, options):
+        cap = self.crit_chance_cap
+        rows, width, length = grid.shape
+        vectors = [vector for _, vector in options]
+        attack_speed_low = self.attack_speed_low + min(vector[3] for vector in vectors)
+        attack_speed_high = min(self.attack_speed_low + width - 1 + max(vector[3] for vector in vectors),
+                                max(self.attack_speed_high, attack_speed_low))
+        strength_low = self.strength_low + min(vector[0] for vector in vectors)
+        shape = (min(cap, rows - 1 + max(vector[2] for vector in vectors)) + 1,
+                 attack_speed_high - attack_speed_low + 1,
+                 self.strength_low + length - 1 + max(vector[0] for vector in vectors) - strength_low + 1)
+
+        new = numpy.full(shape, _UNREACHABLE, dtype=numpy.int32)
+        choice = numpy.zeros(shape, dtype=numpy.int8)
+        cap_source = numpy.zeros(shape[1:], dtype=numpy.int16)
+
+        for index, (strength, crit_damage, crit_chance, attack_speed) in enumerate(vectors):
+            # Where the old grid lands in the new one, the attack speed past the new grid is dropped
+            offset_as = self.attack_speed_low + attack_speed - attack_speed_low
+            offset_s = self.strength_low + strength - strength_low
+            used_as = min(width, shape[1] - offset_as)
+            if used_as <= 0:
+                continue
+            target_as, target_s = slice(offset_as, offset_as + used_as), slice(offset_s, offset_s + length)
+
+            # rows that stay under the cap move up by crit_chance, the rest all land on the cap row
+            direct = max(0, min(rows, cap + 1 - crit_chance))
+            if direct:
+                candidate = grid[:direct, :used_as] + crit_damage
+                target = new[crit_chance:crit_chance + direct, target_as, target_s]
+                better = candidate > target
+                numpy.copyto(target, candidate, where=better)
+                numpy.copyto(choice[crit_chance:crit_chance + direct, target_as, target_s], index, where=better)
+                if crit_chance + direct - 1 == cap:
+                    numpy.copyto(cap_source[target_as, target_s], cap - crit_chance, where=better[-1])
+            if direct < rows:
+                saturated = grid[direct:, :used_as]
+                source_rows = saturated.argmax(axis=0)
+                candidate = numpy.take_along_axis(saturated, source_rows[numpy.newaxis], axis=0)[0] + crit_damage
+                target = new[cap, target_as, target_s]
+                better = candidate > target
+                numpy.copyto(target, candidate, where=better)
+                numpy.copyto(choice[cap, target_as, target_s], index, where=better)
+                numpy.copyto(cap_source[target_as, target_s], source_rows + direct, where=better, casting='unsafe')
+
+        self._layers.append((choice, cap_source, attack_speed_low, strength_low))
+        self.attack_speed_low, self.strength_low = attack_speed_low, strength_low
+        return new
+
+    def reforges(self, crit_chance, attack_speed, strength):
+        """
+        Walk the talisman choices back from a grid cell and count the reforges of each rarity.
+        """
+        counts = {}
+        position = len(self._layers)
+        for rarity, amount, options in reversed(self.items):
+            for _ in range(amount):
+                position -= 1
+                choice, cap_source, attack_speed_low, strength_low = self._layers[position]
+                cell = (crit_chance, attack_speed - attack_speed_low, strength - strength_low)
+                reforge, (option_strength, _, option_crit_chance, option_attack_speed) = options[choice[cell]]
+                counts[('talisman', rarity, reforge)] = counts.get(('talisman', rarity, reforge), 0) + 1
+
+                if crit_chance == self.crit_chance_cap:
+                    crit_chance = int(cap_source[cell[1:]])
+                else:
+                    crit_chance -= option_crit_chance
+                attack_speed -= option_attack_speed
+                strength -= option_strength
+        return counts
+
+
+class _DamageSearch(_DamageModel):
+    """
+    Exact search for the reforges maximizing the damage optimizer objective.
+
+    Talisman reforges only add whole numbers to strength, crit damage, crit chance and attack speed,
+    so every reachable talisman total is in a _TalismanGrid.
+    Weapon and armor pieces, scaled by their item multipliers, are enumerated and reduced to their pareto front.
+    Every gear combination is then evaluated against the whole talisman grid at once, unless an upper bound
+    of its objective shows it can't beat the best solution found so far.
+    Past `deadline`, a time.monotonic() value, building the grid raises _SearchTimeout and the search stops
+    with the best solution found so far, `is_optimized` tells if it finished.
+    """
+
+    def __init__(self, problem, *, talismans=None, deadline=None):
+        super().__init__(problem)
+        self.deadline = deadline
+        self.is_optimized = True
+        self.gear = self._gear_front()
+        items = self._talisman_items()
+        if talismans is None:
+            talismans = _TalismanGrid(items, *self.grid_caps(items), deadline=deadline)
+        self.talismans = talismans
+
+    # --- gear ---
+
+    def _gear_front(self):
+        """
+        Every useful combination of weapon and armor reforges as (vector, choices).
+        """
+        front = [((0, 0, 0, 0, 0, 0), ())]
+        for equipment_type, rarity, options in self._gear_slots():
+            front = [
+                (tuple(a + b for a, b in zip(vector, option_vector)), choices + ((equipment_type, rarity, reforge),))
+                for vector, choices in front for reforge, option_vector in options
+            ]
+            front = _pareto(front, key=self._gear_key, value=self._gear_value)
+        return front
+
+    def _gear_key(self, point):
+        # Attack speed can be limited, so a combination with more of it doesn't always win
+        vector = point[0]
+        return (round(vector[3], 6), vector[5]) if self.uses_attack_speed else vector[5]
+
+    def _gear_value(self, point):
+        vector = point[0]
+        return (vector[0], vector[1], vector[2] if self.uses_crit_chance else 0, vector[4])
+
+    # --- search ---
+
+    def search(self, incumbent=-numpy.inf):
+        """
+        Return (objective, gear choices, talisman cell) of the best solution, None if nothing is feasible
+        or nothing beats the `incumbent` objective.
+        """
+        problem = self.problem
+        talismans = self.talismans
+        if not self.feasible:
+            return None
+
+        # Highest talisman crit damage of each crit chance row, for the objective upper bound of a gear combination
+        row_best = talismans.grid_at_least.max(axis=(1, 2))
+        candidates = []
+        for vector, choices in self.gear:
+            strength, crit_damage, crit_chance, attack_speed, weapon_damage, renowned = vector
+            multiplier = problem.multiplier + 0.01 * renowned
+
+            row = 0
+            if self.uses_crit_chance:
+                row = max(0, math.ceil(99.5 / multiplier - self.base_crit_chance - crit_chance - _EPSILON))
+            if row >= len(row_best) or row_best[row] <= _REACHABLE:
+                continue
+
+            attack_speed_high = self.base_attack_speed + attack_speed + talismans.attack_speed_values[-1]
+            if self.uses_attack_speed:
+                attack_speed_high = min(attack_speed_high, problem.attack_speed_limit / multiplier)
+            bound = self._objective(
+                multiplier,
+                self.base_strength + strength + talismans.strength_values[-1],
+                self.base_crit_damage + crit_damage + row_best[row],
+                attack_speed_high,
+                self._weapon_damage(weapon_damage)
+            )
+            candidates.append((bound, multiplier, row, vector, choices))
+        # Most promising combinations first, so the rest can be skipped once one of them is found
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        best = None
+        strength_values = talismans.strength_values[numpy.newaxis, :]
+        attack_speed_values = talismans.attack_speed_values[:, numpy.newaxis]
+
+        for bound, multiplier, row, vector, choices in candidates:
+            if bound <= max(incumbent, best[0] if best else -numpy.inf) + _EPSILON:
+                break
+            if self.deadline is not None and time.monotonic() > self.deadline:
+                self.is_optimized = False
+                break
+            strength, crit_damage, crit_chance, attack_speed, weapon_damage, renowned = vector
+
+            talisman_crit_damage = talismans.grid_at_least[row]
+            reachable = talisman_crit_damage > _REACHABLE
+
+            total_attack_speed = self.base_attack_speed + attack_speed + attack_speed_values
+            if self.uses_attack_speed:
+                reachable = reachable & (multiplier * total_attack_speed <= problem.attack_speed_limit + _EPSILON)
+            if not reachable.any():
+                continue
+
+            objective = self._objective(
+                multiplier,
+                self.base_strength + strength + strength_values,
+                self.base_crit_damage + crit_damage + talisman_crit_damage,
+                total_attack_speed,
+                self._weapon_damage(weapon_damage)
+            )
+            objective = numpy.where(reachable, objective, -numpy.inf)
+            index = numpy.unravel_index(numpy.argmax(objective), objective.shape)
+            if objective[index] > max(incumbent, best[0] if best else -numpy.inf) + _EPSILON:
+                best = (objective[index], choices, (row,) + index)
+        return best
+
+    def solve(self, incumbent=None):
+        """
+        Return the stats and reforge counts of the best solution, (None, {}) if nothing is feasible
+        or nothing was found before the deadline.
+        `incumbent` is the reforge counts of a known feasible solution, it is kept when nothing beats it.
+        """
+        talismans = self.talismans
+        best = self.search(damage_objective(self.problem, self.stats_for(incumbent)) if incumbent else -numpy.inf)
+        if best is None:
+            if incumbent:
+                return self._result(incumbent), dict(incumbent)
+            return None, {}
+
+        _, gear_choices, (row, attack_speed_index, strength_index) = best
+        # The cell came from the at least table, find the crit chance row that actually holds it
+        crit_damage = talismans.grid_at_least[row, attack_speed_index, strength_index]
+        while talismans.grid[row, attack_speed_index, strength_index] != crit_damage:
+            row += 1
+
+        counts = {choice: 1 for choice in gear_choices}
+        counts.update(talismans.reforges(row, talismans.attack_speed_values[attack_speed_index],
+                                         talismans.strength_values[strength_index]))
+        return self._result(counts), counts
+
+    def _result(self, counts):
+        result = self.stats_for(counts)
+        result['is optimized'] = self.is_optimized
+        return result
+
+
+class _LocalSearch(abc.ABC):
+    """
+    Greedy heuristic for reforge problems, it finds good reforges in milliseconds but doesn't prove them optimal.
+
+    Every talisman rarity and gear piece is a group of items sharing the same reforges. Each group first gets the
+    one reforge that is best for all of its items, then single items, or pairs of items when that's stuck,
+    move to another reforge of their group as long as it improves the objective.
+    Subclasses fill `groups` with _add_group and score rows of reforge totals with _scores.
+    """
+    max_steps = 500
+    # Objective gaining moves tried with a second move when no single move improves anymore
+    pair_candidates = 16
+
+    def _add_group(self, equipment_type, rarity, amount, options):
+        if not options:
+            self.feasible = False
+            return
+        names = [reforge for reforge, _ in options]
+        vectors = numpy.array([vector for _, vector in options], dtype=numpy.float64)
+        self.groups.append((equipment_type, rarity, amount, names, vectors))
+
+    @abc.abstractmethod
+    def _scores(self, totals):
+        """
+        Objective of every row of reforge totals, minus a large penalty for breaking the options.
+        Return the scores and how far each row is from satisfying the options.
+        """
+
+    def _pair_move(self, counts, totals, moves, sources, targets, deltas, score):
+        """
+        Best improving pair of moves where the first one gains objective and the second one repairs the options it
+        broke, like trading crit chance from one talisman rarity to another. Return the moves and the new score.
+        """
+        scores, violation = self._scores(totals + deltas[moves])
+        firsts = moves[numpy.argsort(scores + _PENALTY * violation)[::-1][:self.pair_candidates]]
+        best, best_score = [], score + _IMPROVEMENT
+        for first in firsts:
+            # The second item can come from the reforge the first one moved to, but not from the one it left empty
+            available = counts[sources] - (sources == sources[first]) + (sources == targets[first])
+            seconds = numpy.flatnonzero(available > 0)
+            scores, _ = self._scores(totals + deltas[first] + deltas[seconds])
+            index = int(numpy.argmax(scores))
+            if scores[index] > best_score:
+                best, best_score = [first, seconds[index]], scores[index]
+        return best, best_score
+
+    def solve(self):
+        """
+        Return the reforge counts of the best solution found, None if it doesn't satisfy the options.
+        """
+        if not self.feasible:
+            return None
+
+        # Every reforge of every group is one slot of the flat counts array
+        offsets = numpy.cumsum([0] + [len(names) for *_, names, _ in self.groups])
+        vectors = numpy.concatenate([group_vectors for *_, group_vectors in self.groups])
+        counts = numpy.zeros(len(vectors), dtype=numpy.int64)
+
+        totals = numpy.zeros(vectors.shape[1])
+        for offset, (_, _, amount, _, group_vectors) in zip(offsets, self.groups):
+            scores, _ = self._scores(totals + amount * group_vectors)
+            choice = offset + int(numpy.argmax(scores))
+            counts[choice] = amount
+            totals += amount * vectors[choice]
+
+        # Moving one item from a reforge to another reforge of its group
+        sources, targets = [], []
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            for source in range(start, end):
+                for target in range(start, end):
+                    if source != target:
+                        sources.append(source)
+                        targets.append(target)
+        sources, targets = numpy.array(sources, dtype=numpy.int64), numpy.array(targets, dtype=numpy.int64)
+        deltas = vectors[targets] - vectors[sources]
+
+        score = self._scores(totals[numpy.newaxis])[0][0]
+        for _ in range(self.max_steps):
+            moves = numpy.flatnonzero(counts[sources] > 0)
+            if not len(moves):
+                break
+            scores, _ = self._scores(totals + deltas[moves])
+            best = int(numpy.argmax(scores))
+            if scores[best] > score + _IMPROVEMENT:
+                applied = [moves[best]]
+                score = scores[best]
+            else:
+                applied, score = self._pair_move(counts, totals, moves, sources, targets, deltas, score)
+                if not applied:
+                    break
+            for move in applied:
+                counts[sources[move]] -= 1
+                counts[targets[move]] += 1
+                totals += deltas[move]
+
+        if self._scores(totals[numpy.newaxis])[1][0] > _EPSILON:
+            return None
+        result = {}
+        for offset, (equipment_type, rarity, _, names, _) in zip(offsets, self.groups):
+            for index, reforge in enumerate(names):
+                if counts[offset + index] > 0:
+                    result[equipment_type, rarity, reforge] = int(counts[offset + index])
+        return result
+
+
+class _DamageLocalSearch(_LocalSearch, _DamageModel):
+    """
+    _LocalSearch for the damage problem, missing crit chance and extra attack speed are penalized.
+    """
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        # (equipment type, rarity, amount, reforge names, reforge vectors) of every group
+        self.groups = []
+        for rarity in RARITIES:
+            amount = problem.counts['talisman'].get(rarity, 0)
+            if amount > 0:
+                options = _reforge_options(problem, 'talisman', rarity,
+                                           (_STRENGTH, _CRIT_DAMAGE, _CRIT_CHANCE, _ATTACK_SPEED))
+                self._add_group('talisman', rarity, amount, [(reforge, vector + (0, 0)) for reforge, vector in options])
+        for equipment_type, rarity, options in self._gear_slots():
+            self._add_group(equipment_type, rarity, 1, options)
+
+    def _scores(self, totals):
+        """
+        Objective of every row of reforge totals, minus a large penalty for missing crit chance or extra attack speed.
+        Return the scores and how far each row is from satisfying the options.
+        """
+        problem = self.problem
+        multiplier = problem.multiplier + 0.01 * totals[:, 5]
+        attack_speed = self.base_attack_speed + totals[:, 3]
+        violation = numpy.zeros(len(totals))
+        if self.uses_crit_chance:
+            violation += numpy.maximum(0, 99.5 - multiplier * (self.base_crit_chance + totals[:, 2]))
+        if self.uses_attack_speed:
+            violation += numpy.maximum(0, multiplier * attack_speed - problem.attack_speed_limit - _EPSILON)
+        objective = self._objective(
+            multiplier,
+            self.base_strength + totals[:, 0],
+            self.base_crit_damage + totals[:, 1],
+            attack_speed,
+            self._weapon_damage(totals[:, 4])
+        )
+        return objective - _PENALTY * violation, violation
+
+
+def damage_objective(problem, stats):
+    """
+    Objective the damage optimizer maximizes, from the stats it reports for a solution.
+    """
+    strength = stats['strength']
+    damage = ((5 + stats['damage'] + math.floor(strength / 5 + _EPSILON)) *
+              (1 + strength / 100) * (1 + stats['crit damage'] / 100))
+    if problem.attack_speed_limit:
+        return damage * (((stats['attack speed'] + 100) / 100) / 0.5)
+    return damage
+
+
+def format_reforge_counts(problem, counts):
+    """
+    Same layout as format_counts: equipment type > rarity > reforge > count, in table order.
+    """
+    result = {}
+    for equipment_type in problem.counts:
+        for rarity in RARITIES:
+            for reforge in problem.reforge_table.reforges[reforge_class(equipment_type)]:
+                count = counts.get((equipment_type, rarity, reforge), 0)
+                if count > 0:
+                    result.setdefault(equipment_type, {}).setdefault(rarity, {})[reforge] = count
+    return result
+
+
+def flatten_reforge_counts(counts):
+    """
+    Reforge counts laid out by format_reforge_counts back to {(equipment type, rarity, reforge): count}.
+    """
+    return {(equipment_type, rarity, reforge): count
+            for equipment_type, rarities in counts.items()
+            for rarity, reforges in rarities.items()
+            for reforge, count in reforges.items()}
+
+
+def create_damage_search(problem, *, talismans=None, deadline=None):
+    """
+    Build the talisman grid and gear front solve_damage_problem_exact searches, without searching them.
+    """
+    return _DamageSearch(problem, talismans=talismans, deadline=deadline)
+
+
+def _deadline(problem):
+    return time.monotonic() + float(problem.time_limit)
+
+
+def _unfinished_result(problem):
+    """
+    Greedy result of a problem whose search ran out of time, flagged not optimized like every greedy result.
+    """
+    result = greedy_damage_solution(problem)
+    if result is None:
+        # No solution known, the base stats like an infeasible one
+        return {**_DamageModel(problem).stats_for({}), 'is optimized': False}, {}
+    return result
+
+
+def solve_damage_problem_exact(problem, *, talismans=None, deadline=None):
+    """
+    Solve a DamageOptimizerProblem in process without an external solver.
+    Return the best stats and reforge counts like the scip backend.
+    The problem's warm start, when it has one, lets the search skip gear that can't beat it.
+    `talismans` is a talisman grid shared with other problems, see solve_damage_problems_exact.
+    Like scip the search stops after the problem's time limit, or at `deadline`, a time.monotonic() value,
+    and returns the best solution found by then, or the greedy one, flagged not optimized.
+    """
+    deadline = _deadline(problem) if deadline is None else deadline
+    try:
+        search = create_damage_search(problem, talismans=talismans, deadline=deadline)
+    except _SearchTimeout:
+        return _unfinished_result(problem)
+
+    result, counts = search.solve(flatten_reforge_counts(problem.warm_start) if problem.warm_start else None)
+    if result is None:
+        if not search.is_optimized:
+            return _unfinished_result(problem)
+        # Nothing satisfies the options, same as an infeasible scip model
+        result = search.stats_for({})
+    return result, format_reforge_counts(problem, counts)
+
+
+def solve_damage_problems_exact(problems, *, grid_caps=None):
+    """
+    solve_damage_problem_exact of problems with the same talismans, they share one talisman grid built
+    with `grid_caps` in the time limit of the first problem, see talisman_grid_key.
+    Nothing is kept once the job is done, grids are too large to cache in optimizer workers.
+    """
+    results = []
+    talismans = None
+    for problem in problems:
+        deadline = _deadline(problem)
+        if talismans is None:
+            items, caps = talisman_grid_key(problem)
+            try:
+                talismans = _TalismanGrid(items, *(grid_caps or caps), deadline=deadline)
+            except _SearchTimeout:
+                # The other problems wouldn't get further
+                talismans = False
+        if talismans is False:
+            results.append(_unfinished_result(problem))
+        else:
+            results.append(solve_damage_problem_exact(problem, talismans=talismans, deadline=deadline))
+    return results
+
+
+def talisman_grid_key(problem):
+    """
+    Return the talisman reforges of a problem and the (crit chance, attack speed) caps its talisman grid needs.
+    Problems with the same talisman reforges can share one grid built with the highest of their caps.
+    """
+    model = _DamageModel(problem)
+    items = model._talisman_items()
+    return items, model.grid_caps(items)
+
+
+def damage_upper_bound(problem):
+    """
+    Objective no solution of a DamageOptimizerProblem can beat in milliseconds, -inf if it has no solution.
+    """
+    return _DamageModel(problem).upper_bound()
+
+
+def greedy_damage_solution(problem):
+    """
+    Good reforges for a DamageOptimizerProblem found by local search in a few milliseconds, not proven optimal.
+    Return the stats and reforge counts like the solvers, None when the local search can't satisfy the options.
+    """
+    search = _DamageLocalSearch(problem)
+    counts = search.solve()
+    if counts is None:
+        return None
+    result = search.stats_for(counts)
+    result['is optimized'] = False
+    return result, format_reforge_counts(problem, counts)
+
+
+def greedy_damage_solutions(problems):
+    """
+    greedy_damage_solution of many problems in one optimizer worker job.
+    """
+    return [greedy_damage_solution(problem) for problem in problems]
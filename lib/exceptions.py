@@ -84,6 +84,15 @@ class HypixelLanguageError(SkyblockCommandError):
     pass
 
 
+class OptimizerTimeoutError(SkyblockCommandError):
+    """
+    Exception raised when the optimizer took too long to find a result.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+
 class NotVerified(CheckFailure):
     """
     Exception raised when player is not verified.
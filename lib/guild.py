@@ -1,9 +1,10 @@
 import asyncio
+import aiohttp
 from datetime import datetime
 import copy
 
-from lib import NeverPlayedSkyblockError
-from constants import GUILD_LEVEL_REQUIREMENT
+from lib import NeverPlayedSkyblockError, SkyblockCommandError, APIError
+from constants import GUILD_LEVEL_REQUIREMENT, SKILL_NAMES, SLAYER_NAMES, DUNGEONS
 
 
 class Guild:
@@ -87,103 +88,142 @@ class Guild:
         self.all_members_dungeons = {}
         self.all_members_dungeons_xp = {}
 
+        # Running totals of the loaded members
+        self.loaded_members = 0
+        self.failed_members = []
+        self._totals = {
+            'deaths': 0,
+            'money': 0,
+            'average skills': 0.00,
+            'minion slots': 0,
+            'unique minions': 0,
+            'skills': {skill: 0 for skill in SKILL_NAMES},
+            'skills xp': {skill: 0 for skill in SKILL_NAMES},
+            'slayers': {slayer: 0 for slayer in SLAYER_NAMES},
+            'slayers xp': {slayer: 0 for slayer in SLAYER_NAMES},
+            'dungeons': {dungeon: 0 for dungeon in DUNGEONS},
+            'dungeons xp': {dungeon: 0 for dungeon in DUNGEONS},
+        }
+
     def __str__(self):
         return self.name
 
     def __repr__(self):
         return self.name
 
-    async def load_all_members(self, *, hypixel_api_client):
-        self.hypixel_api_client = hypixel_api_client
-
-        await asyncio.gather(
-            *[self.load_member_data(member, hypixel_api_client=hypixel_api_client) for member in self.guild_members])
+    async def load_all_members(self, *, hypixel_api_client, concurrency=10):
+        async for _ in self.load_members(hypixel_api_client=hypixel_api_client, concurrency=concurrency):
+            pass
 
         self.load_skyblock_stats()
 
+    async def load_members(self, *, hypixel_api_client, concurrency=10):
+        """
+        Load guild members with at most `concurrency` members in flight and yield each member as soon as it's loaded.
+        Member stats are added to the guild totals as they arrive, members that failed to load are put in
+        `failed_members` instead of aborting the whole guild.
+        """
+        self.hypixel_api_client = hypixel_api_client
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(member):
+            async with semaphore:
+                try:
+                    await self.load_member_data(member, hypixel_api_client=hypixel_api_client)
+                except (APIError, SkyblockCommandError, aiohttp.ClientError):
+                    member.player = None
+                    self.failed_members.append(member)
+                return member
+
+        tasks = [asyncio.ensure_future(load(member)) for member in self.guild_members]
+        try:
+            for task in asyncio.as_completed(tasks):
+                member = await task
+                self.loaded_members += 1
+                self.add_member_stats(member)
+                yield member
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def load_member_data(self, member, *, hypixel_api_client):
         if member.uuid is None:
             return
 
-        member.player = await hypixel_api_client.get_player(member.uuid, guild=self)
+        priority = hypixel_api_client.PRIORITY_BULK
+        member.player = await hypixel_api_client.get_player(member.uuid, guild=self, priority=priority)
         try:
-            await member.player.load_skyblock_profiles(load_all=False)
+            await member.player.load_skyblock_profiles(load_all=False, priority=priority)
         except NeverPlayedSkyblockError:
             pass
 
+    def add_member_stats(self, member):
+        """
+        Add a loaded guild member's skyblock stats to the guild totals and leaderboards.
+        """
+        player = member.player
+        if player is None or player.profile is None:
+            return  # for those guild member doesn't player skyblock or failed to load
+        profile = player.profile
+
+        self.all_members_skill_average.update({player.uname: profile.skill_average})
+        self.all_members_unique_minions.update({player.uname: profile.unique_minions})
+        self.all_members_minion_slots.update({player.uname: profile.minion_slots})
+        self.all_members_skills.update({player.uname: profile.skills.copy()})
+        self.all_members_skills_xp.update({player.uname: profile.skills_xp.copy()})
+        self.all_members_slayers.update({player.uname: copy.deepcopy(profile.slayers)})
+        self.all_members_slayers_xp.update({player.uname: copy.deepcopy(profile.slayers_xp)})
+        self.all_members_total_slayers_xp.update({player.uname: profile.total_slayer_xp})
+
+        totals = self._totals
+        self.current_online += player.online
+        totals['deaths'] += profile.deaths
+        totals['money'] += profile.bank_balance + profile.purse
+        totals['average skills'] += profile.skill_average
+        totals['minion slots'] += profile.minion_slots
+        totals['unique minions'] += profile.unique_minions
+
+        for skill in totals['skills'].keys():
+            totals['skills'][skill] += profile.skills.get(skill, 0)
+            totals['skills xp'][skill] += profile.skills_xp.get(skill, 0)
+
+        for slayer in totals['slayers'].keys():
+            totals['slayers'][slayer] += profile.slayers.get(slayer, 0)
+            totals['slayers xp'][slayer] += profile.slayers_xp.get(slayer, 0)
+
+        for dungeon in totals['dungeons'].keys():
+            self.all_members_dungeons.update(
+                {player.uname: {dungeon: profile.dungeon_stats[dungeon].get('level', 0)}})
+            self.all_members_dungeons_xp.update(
+                {player.uname: {dungeon: profile.dungeon_stats[dungeon].get('experience', 0)}})
+            totals['dungeons'][dungeon] += profile.dungeon_stats[dungeon].get('level', 0)
+            totals['dungeons xp'][dungeon] += profile.dungeon_stats[dungeon].get('experience', 0)
+
     def load_skyblock_stats(self):
-        total_deaths = 0
-        total_money = 0
-        total_average_skills = 0.00
-        total_minion_slots = 0
-        total_unique_minions = 0
-
-        total_skills = {'farming': 0, 'mining': 0, 'combat': 0, 'foraging': 0, 'fishing': 0, 'enchanting': 0,
-                        'alchemy': 0, 'taming': 0, 'carpentry': 0, 'runecrafting': 0}
-        total_skills_xp = {'farming': 0, 'mining': 0, 'combat': 0, 'foraging': 0, 'fishing': 0, 'enchanting': 0,
-                           'alchemy': 0, 'taming': 0, 'carpentry': 0, 'runecrafting': 0}
-
-        total_slayers = {'zombie': 0, 'spider': 0, 'wolf': 0}
-        total_slayers_xp = {'zombie': 0, 'spider': 0, 'wolf': 0}
-
-        total_dungeons = {'catacombs': 0}
-        total_dungeons_xp = {'catacombs': 0}
-
-        for member in self.guild_members:
-            player = member.player
-            profile = player.profile
-            if profile is None:
-                continue  # for those guild member doesn't player skyblock
-
-            self.all_members_skill_average.update({player.uname: profile.skill_average})
-            self.all_members_unique_minions.update({player.uname: profile.unique_minions})
-            self.all_members_minion_slots.update({player.uname: profile.minion_slots})
-            self.all_members_skills.update({player.uname: profile.skills.copy()})
-            self.all_members_skills_xp.update({player.uname: profile.skills_xp.copy()})
-            self.all_members_slayers.update({player.uname: copy.deepcopy(profile.slayers)})
-            self.all_members_slayers_xp.update({player.uname: copy.deepcopy(profile.slayers_xp)})
-            self.all_members_total_slayers_xp.update({player.uname: profile.total_slayer_xp})
-
-            self.current_online += player.online
-            total_deaths += profile.deaths
-            total_money += profile.bank_balance + profile.purse
-            total_average_skills += profile.skill_average
-            total_minion_slots += profile.minion_slots
-            total_unique_minions += profile.unique_minions
-
-            for skill in total_skills.keys():
-                total_skills[skill] += profile.skills.get(skill, 0)
-                total_skills_xp[skill] += profile.skills_xp.get(skill, 0)
-
-            for slayer in total_slayers.keys():
-                total_slayers[slayer] += profile.slayers.get(slayer, 0)
-                total_slayers_xp[slayer] += profile.slayers_xp.get(slayer, 0)
-
-            for dungeon in total_dungeons.keys():
-                self.all_members_dungeons.update(
-                    {player.uname: {dungeon: profile.dungeon_stats[dungeon].get('level', 0)}})
-                self.all_members_dungeons_xp.update(
-                    {player.uname: {dungeon: profile.dungeon_stats[dungeon].get('experience', 0)}})
-                total_dungeons[dungeon] += profile.dungeon_stats[dungeon].get('level', 0)
-                total_dungeons_xp[dungeon] += profile.dungeon_stats[dungeon].get('experience', 0)
-
-        self.average_deaths = total_deaths // self.member_amount
-        self.average_money = total_money / self.member_amount
-        self.average_skills = total_average_skills / self.member_amount
-        self.minion_slot = total_minion_slots // self.member_amount
-        self.unique_minions = total_unique_minions // self.member_amount
-
-        for skill in total_skills.keys():
-            self.skills[skill] = total_skills[skill] // self.member_amount
-            self.skills_xp[skill] = total_skills_xp[skill] / self.member_amount
-
-        for slayer in total_slayers.keys():
-            self.slayers[slayer] = total_slayers[slayer] // self.member_amount
-            self.slayers_xp[slayer] = total_slayers_xp[slayer] / self.member_amount
-
-        for dungeon in total_dungeons.keys():
-            self.dungeons[dungeon] = total_dungeons[dungeon] // self.member_amount
-            self.dungeons_xp[dungeon] = total_dungeons_xp[dungeon] / self.member_amount
+        """
+        Compute the guild averages from the member totals collected so far.
+        """
+        if not self.member_amount:
+            return
+        totals = self._totals
+
+        self.average_deaths = totals['deaths'] // self.member_amount
+        self.average_money = totals['money'] / self.member_amount
+        self.average_skills = totals['average skills'] / self.member_amount
+        self.minion_slot = totals['minion slots'] // self.member_amount
+        self.unique_minions = totals['unique minions'] // self.member_amount
+
+        for skill in totals['skills'].keys():
+            self.skills[skill] = totals['skills'][skill] // self.member_amount
+            self.skills_xp[skill] = totals['skills xp'][skill] / self.member_amount
+
+        for slayer in totals['slayers'].keys():
+            self.slayers[slayer] = totals['slayers'][slayer] // self.member_amount
+            self.slayers_xp[slayer] = totals['slayers xp'][slayer] / self.member_amount
+
+        for dungeon in totals['dungeons'].keys():
+            self.dungeons[dungeon] = totals['dungeons'][dungeon] // self.member_amount
+            self.dungeons_xp[dungeon] = totals['dungeons xp'][dungeon] / self.member_amount
 
 
 class GuildMember:
@@ -1,15 +1,72 @@
-import re
-from base64 import b64decode as one
-from gzip import decompress as two
-from io import BytesIO as three
-from struct import unpack
-
-from . import ItemStats
-from utils import get_stats_from_description, closest
+import copy
+from weakref import WeakValueDictionary
+
+from . import ItemStats, parse_nbt, decompress_nbt
+from utils import get_stats_from_description, strip_color_codes, closest
 from constants import ACCUMULATED_CATACOMB_LEVEL_REWARDS
 
 
+class ItemDefinition:
+    """
+    Static part of an item, everything that only depends on its internal name, display name and lore.
+    Identical items share one definition through get_item_definition, so it must never be mutated.
+    """
+    __slots__ = ('internal_name', 'name', 'display', 'description', 'description_clean', 'rarity', 'type',
+                 'dungeon', 'stats', 'reforge_stats', '__weakref__')
+
+    def __init__(self, internal_name, display, *, recombobulation=False, dungeon=False):
+        self.internal_name = internal_name
+        self.display = display
+        self.name = strip_color_codes(display.get('Name', ''))
+        self.description = display.get('Lore', [])
+        self.description_clean = [strip_color_codes(line) for line in self.description]
+
+        # Load item rarity and item from last line of description clean
+        self.rarity = None
+        self.type = None
+        self.dungeon = dungeon
+        if self.description_clean:
+            last_line = self.description_clean[-1].split()
+            # remove extra 'a' from recombobulated item description last line
+            if recombobulation:
+                last_line.pop(0)
+                last_line.pop(-1)
+
+            self.rarity = last_line[0].lower()
+            if len(last_line) > 1:
+                self.type = last_line[1].lower()
+                if (dungeon or last_line[1].lower() == 'dungeon') and len(last_line) > 2:
+                    # In case some dungeon item doesnt have 'dungeon_item_level' attribute
+                    self.dungeon = True
+                    self.type = last_line[2].lower()
+
+        if self.type == 'cutlass':
+            self.type = 'sword'
+
+        self.stats, self.reforge_stats = get_stats_from_description(self.description_clean)
+
+
+# Definitions of every item currently loaded, entries go away with the last item using them
+_item_definitions = WeakValueDictionary()
+
+
+def get_item_definition(internal_name, display, *, recombobulation=False, dungeon=False):
+    """
+    Return the shared definition of an item, building it the first time that item is seen.
+    """
+    key = (internal_name, display.get('Name', ''), tuple(display.get('Lore', ())), recombobulation, dungeon)
+    definition = _item_definitions.get(key)
+    if definition is None:
+        definition = _item_definitions[key] = ItemDefinition(
+            internal_name, display, recombobulation=recombobulation, dungeon=dungeon)
+    return definition
+
+
 class Item:
+    __slots__ = ('_raw_data', 'profile', 'definition', 'slot_number', 'stack_size', 'hot_potatos', 'anvil_uses',
+                 'collection_date', 'runes', 'enchantments', 'reforge', 'recombobulation', 'dungeon',
+                 'dungeon_level', 'stats', 'active', '_contents', '_contents_key')
+
     def __init__(self, raw_data, profile, *, slot_number=0):
         self._raw_data = raw_data
         self.profile = profile
@@ -20,13 +77,6 @@ class Item:
         self.slot_number = slot_number
         self.stack_size = self._raw_data.get('Count', 1)
 
-        # Load item name and description
-        self.name = re.sub('§.', '', tag.get('display', {}).get('Name', ''))
-        self.internal_name = extras.get('id', '')
-
-        self.description = tag.get('display', {}).get('Lore', [])
-        self.description_clean = [re.sub('§.', '', line) for line in self.description]
-
         # Load item extra attributes
         self.hot_potatos = extras.get('hot_potato_count', 0)
         self.anvil_uses = extras.get('anvil_uses', 0) - self.hot_potatos
@@ -38,51 +88,61 @@ class Item:
         if 'rarity_upgrades' in extras:
             if extras['rarity_upgrades'] == 1:
                 self.recombobulation = True
-        self.dungeon = 'dungeon_item_level' in extras
-        self.dungeon_level = None
-        if self.dungeon:
-            self.dungeon_level = extras['dungeon_item_level']
-
-        # Load item rarity and item from last line of description clean
-        self.rarity = None
-        self.type = None
-        if self.description_clean:
-            last_line = self.description_clean[-1].split()
-            # remove extra 'a' from recombobulated item description last line
-            if self.recombobulation:
-                last_line.pop(0)
-                last_line.pop(-1)
-
-            self.rarity = last_line[0].lower()
-            if len(last_line) > 1:
-                self.type = last_line[1].lower()
-                if (self.dungeon or last_line[1].lower() == 'dungeon') and len(last_line) > 2:
-                    # In case some dungeon item doesnt have 'dungeon_item_level' attribute
-                    if not self.dungeon:
-                        self.dungeon = True
-                        self.dungeon_level = 0
-                    self.type = last_line[2].lower()
-
-        if self.type == 'cutlass':
-            self.type = 'sword'
-
-        # Load item from backpacks
-        self.contents = None
+        self.dungeon_level = extras.get('dungeon_item_level', None)
+
+        # Load item name, description, rarity and type from the shared definition
+        self.definition = get_item_definition(extras.get('id', ''), tag.get('display', {}),
+                                              recombobulation=self.recombobulation,
+                                              dungeon=self.dungeon_level is not None)
+        if 'display' in tag:
+            # Point the raw data at the shared name and lore so identical items don't keep their own copies
+            tag['display'] = self.definition.display
+        self.dungeon = self.definition.dungeon
+        if self.dungeon and self.dungeon_level is None:
+            self.dungeon_level = 0
+        self.active = False
+
+        # Find backpack data, the items in it are only decoded when contents is accessed
+        self._contents = None
+        self._contents_key = None
         if self.internal_name == 'NEW_YEAR_CAKE_BAG' or self.internal_name.endswith('_BACKPACK'):
-            for key, value in extras.items():
+            for key in extras:
                 if key == 'new_year_cake_bag_data' or key.endswith('_backpack_data'):
-                    self.contents = decode_inventory_data(value, profile, backpack=True)
+                    self._contents_key = key
                     break
 
-        # Load item stats
-        stats, reforge_stat = get_stats_from_description(self.description_clean)
-        self.stats = ItemStats(stats, item=self, dungeon=self.dungeon)
-        self.stats.reforge_stat = reforge_stat
+        # Load item stats, stats objects are mutable so they get their own copy of the definition stats
+        self.stats = ItemStats(self.definition.stats.copy(), item=self, dungeon=self.dungeon)
+        self.stats.reforge_stat = self.definition.reforge_stats
         if self.dungeon:
             self.stats.dungeon_bonus += self.dungeon_level / 10
 
         self.get_item_stats_extra()
 
+    @property
+    def internal_name(self):
+        return self.definition.internal_name
+
+    @property
+    def name(self):
+        return self.definition.name
+
+    @property
+    def description(self):
+        return self.definition.description
+
+    @property
+    def description_clean(self):
+        return self.definition.description_clean
+
+    @property
+    def rarity(self):
+        return self.definition.rarity
+
+    @property
+    def type(self):
+        return self.definition.type
+
     def get_item_stats_extra(self):
         """
         Get extra stats from some specific item
@@ -115,8 +175,24 @@ class Item:
             elif name == 'PIGMAN_SWORD':
                 self.stats.add_stat('defense', 50)
 
-        if self.reforge == 'renowned':
-            self.profile.stats.multiplier += 0.01
+    @property
+    def contents(self):
+        """
+        Items inside a backpack or new year cake bag, decoded on first access.
+        """
+        if self._contents is None and self._contents_key is not None:
+            extras = self._raw_data['tag']['ExtraAttributes']
+            self._contents = decode_inventory_data(extras[self._contents_key], self.profile, backpack=True)
+        return self._contents
+
+    def copy(self):
+        """
+        Copy whose stats can be changed, like by set bonuses and pets, without changing this item's.
+        """
+        item = copy.copy(self)
+        item.stats = self.stats.copy()
+        item.stats.item = item
+        return item
 
     def __getitem__(self, key):
         if isinstance(key, str):
@@ -138,67 +214,10 @@ class Item:
 
 def decode_inventory_data(raw, profile=None, *, backpack=False, index_empty=False):
     """
-	Takes a raw string representing inventory data.
-	Returns a json object with the inventory's contents.
-	"""
-
-    if backpack:
-        raw = three(two(raw))
-    else:
-        raw = three(two(one(raw)))  # Unzip raw string from the api
-
-    def read(type, length):
-        if type in 'chil':
-            return int.from_bytes(raw.read(length), byteorder='big')
-        if type == 's':
-            return raw.read(length).decode('utf-8')
-        return unpack(f'>{type}', raw.read(length))[0]
-
-    def parse_list():
-        subtype = read('c', 1)
-        payload = []
-        for _ in range(read('i', 4)):
-            parse_next_tag(payload, subtype)
-        return payload
-
-    def parse_compound():
-        payload = {}
-        while parse_next_tag(payload) != 0:  # Parse tags until we find an endcap (type == 0)
-            pass  # Nothing needs to happen here
-        return payload
-
-    payloads = {
-        1: lambda: read('c', 1),  # Byte
-        2: lambda: read('h', 2),  # Short
-        3: lambda: read('i', 4),  # Int
-        4: lambda: read('l', 8),  # Long
-        5: lambda: read('f', 4),  # Float
-        6: lambda: read('d', 8),  # Double
-        7: lambda: raw.read(read('i', 4)),  # Byte Array
-        8: lambda: read('s', read('h', 2)),  # String
-        9: parse_list,  # List
-        10: parse_compound,  # Compound
-        11: lambda: [read('i', 4) for _ in range(read('i', 4))],  # Int Array
-        12: lambda: [read('l', 8) for _ in range(read('i', 4))]  # Long Array
-    }
-
-    def parse_next_tag(dictionary, tag_id=None):
-        name = None
-        if tag_id is None:  # Are we inside a list?
-            tag_id = read('c', 1)
-            if tag_id == 0:  # Is this the end of a compound?
-                return 0
-            name = read('s', read('h', 2))
-
-        payload = payloads[tag_id]()
-        if isinstance(dictionary, dict):
-            dictionary[name] = payload
-        else:
-            dictionary.append(payload)
-
-    raw.read(3)  # Remove file header (we ignore footer)
-    root = {}
-    parse_next_tag(root)
+    Takes a raw string representing inventory data.
+    Returns a list of items with the inventory's contents.
+    """
+    root = parse_nbt(decompress_nbt(raw, backpack=backpack))
 
     items = []
     for i, x in enumerate(root['i']):
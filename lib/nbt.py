@@ -0,0 +1,149 @@
+from base64 import b64decode
+from gzip import decompress
+from struct import Struct
+
+# Tag ids
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+# Integers are read unsigned to stay compatible with the values the bot always had
+_SHORT = Struct('>H')
+_INT = Struct('>I')
+_LONG = Struct('>Q')
+_FLOAT = Struct('>f')
+_DOUBLE = Struct('>d')
+
+# Struct format and size of the tags that can be bulk unpacked in lists and arrays
+_ARRAY_FORMATS = {
+    TAG_BYTE: ('B', 1),
+    TAG_SHORT: ('H', 2),
+    TAG_INT: ('I', 4),
+    TAG_LONG: ('Q', 8),
+    TAG_FLOAT: ('f', 4),
+    TAG_DOUBLE: ('d', 8),
+}
+
+_array_structs = {}
+
+
+def _array_struct(tag_id, length):
+    key = (tag_id, length)
+    struct = _array_structs.get(key)
+    if struct is None:
+        struct = _array_structs[key] = Struct(f'>{length}{_ARRAY_FORMATS[tag_id][0]}')
+    return struct
+
+
+def _parse_payload(data, offset, tag_id):
+    """
+    Parse the payload of a `tag_id` tag starting at `offset`.
+    Return the payload and the offset right after it.
+    """
+    if tag_id == TAG_STRING:
+        end = offset + 2 + _SHORT.unpack_from(data, offset)[0]
+        return data[offset + 2:end].decode('utf-8'), end
+    if tag_id == TAG_COMPOUND:
+        return _parse_compound(data, offset)
+    if tag_id == TAG_BYTE:
+        return data[offset], offset + 1
+    if tag_id == TAG_INT:
+        return _INT.unpack_from(data, offset)[0], offset + 4
+    if tag_id == TAG_SHORT:
+        return _SHORT.unpack_from(data, offset)[0], offset + 2
+    if tag_id == TAG_LIST:
+        return _parse_list(data, offset)
+    if tag_id == TAG_LONG:
+        return _LONG.unpack_from(data, offset)[0], offset + 8
+    if tag_id == TAG_DOUBLE:
+        return _DOUBLE.unpack_from(data, offset)[0], offset + 8
+    if tag_id == TAG_FLOAT:
+        return _FLOAT.unpack_from(data, offset)[0], offset + 4
+    if tag_id == TAG_BYTE_ARRAY:
+        end = offset + 4 + _INT.unpack_from(data, offset)[0]
+        return data[offset + 4:end], end
+    if tag_id == TAG_INT_ARRAY or tag_id == TAG_LONG_ARRAY:
+        length = _INT.unpack_from(data, offset)[0]
+        offset += 4
+        return list(_array_struct(tag_id - 8, length).unpack_from(data, offset)), \
+            offset + length * _ARRAY_FORMATS[tag_id - 8][1]
+    raise ValueError(f'Unknown NBT tag id {tag_id} at offset {offset - 1}')
+
+
+def _parse_compound(data, offset):
+    payload = {}
+    unpack_short = _SHORT.unpack_from
+    while True:
+        tag_id = data[offset]
+        if tag_id == TAG_END:
+            return payload, offset + 1
+        end = offset + 3 + unpack_short(data, offset + 1)[0]
+        name = data[offset + 3:end].decode('utf-8')
+
+        # Inline the most common tags, everything else goes through _parse_payload
+        if tag_id == TAG_STRING:
+            offset = end + 2 + unpack_short(data, end)[0]
+            payload[name] = data[end + 2:offset].decode('utf-8')
+        elif tag_id == TAG_INT:
+            payload[name] = _INT.unpack_from(data, end)[0]
+            offset = end + 4
+        elif tag_id == TAG_BYTE:
+            payload[name] = data[end]
+            offset = end + 1
+        else:
+            payload[name], offset = _parse_payload(data, end, tag_id)
+
+
+def _parse_list(data, offset):
+    tag_id = data[offset]
+    length = _INT.unpack_from(data, offset + 1)[0]
+    offset += 5
+    if not length:
+        return [], offset
+
+    if tag_id in _ARRAY_FORMATS:
+        return list(_array_struct(tag_id, length).unpack_from(data, offset)), \
+            offset + length * _ARRAY_FORMATS[tag_id][1]
+
+    payload = []
+    append = payload.append
+    if tag_id == TAG_STRING:
+        unpack_short = _SHORT.unpack_from
+        for _ in range(length):
+            end = offset + 2 + unpack_short(data, offset)[0]
+            append(data[offset + 2:end].decode('utf-8'))
+            offset = end
+        return payload, offset
+
+    for _ in range(length):
+        value, offset = _parse_payload(data, offset, tag_id)
+        append(value)
+    return payload, offset
+
+
+def parse_nbt(data):
+    """
+    Parse uncompressed NBT data and return the root compound as a dict.
+    The whole buffer is walked by offset with precompiled structs instead of being read piece by piece.
+    """
+    data = bytes(data)
+    # Skip the root compound tag id and name
+    offset = 3 + _SHORT.unpack_from(data, 1)[0]
+    return _parse_compound(data, offset)[0]
+
+
+def decompress_nbt(raw, *, backpack=False):
+    """
+    Unzip raw inventory data from the api, backpack data is already base64 decoded.
+    """
+    return decompress(raw if backpack else b64decode(raw))
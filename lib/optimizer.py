@@ -1,8 +1,18 @@
+import hashlib
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import numpy
 from pyomo.environ import *
 from pyomo.opt import *
 
-from config import SCIP_TIMELIMIT
-from constants import RARITIES
+from config import SCIP_TIMELIMIT, OPTIMIZER_BACKEND
+from constants import RARITIES, WEAPON_ONLY_REFORGES
+from utils import ReforgeTable, DAMAGE_REFORGE_TABLE, REFORGE_TABLE, reforge_class
+from .damage_solver import solve_damage_problem_exact, solve_damage_problems_exact, create_damage_search, \
+    flatten_reforge_counts, damage_objective, damage_upper_bound, greedy_damage_solutions, talisman_grid_key
+from .profile import Profile
+from .stat_solver import solve_stat_problem_exact
 
 
 def format_counts(counts):
@@ -20,9 +30,9 @@ def format_counts(counts):
     return result
 
 
-def solve(m):
+def solve(m, time_limit=SCIP_TIMELIMIT):
     s = SolverFactory('scip', executable='scip')
-    s.options['limits/time'] = SCIP_TIMELIMIT
+    s.options['limits/time'] = time_limit
     result = s.solve(m)
     if result.solver.status == SolverStatus.aborted and result.solver.termination_condition == TerminationCondition.maxTimeLimit:
         return False
@@ -30,31 +40,87 @@ def solve(m):
 
 
 # noinspection PyUnresolvedReferences
-def create_model(counts, reforge_set, only_blacksmith_reforges):
+def create_model(problem, stats):
+    """
+    Model with a reforge count for every reforge an item of the problem's equipment types can get at any rarity.
+    Item counts of each rarity and the multiplier of each equipment type's reforge `stats` are parameters,
+    so one model fits every problem with the same reforge table and equipment types, see set_model_parameters.
+    """
     m = ConcreteModel()
-    m.reforge_set = Set(
-        initialize=[
-            (i, j, k) for i, count in counts.items() for j in RARITIES for k, stats in
-            reforge_set[armor_check(i)].items()
-            if j in stats and count[j] > 0 and (only_blacksmith_reforges is False or stats['blacksmith'] is True)
-        ], ordered=True
-    )
-    m.reforge_counts = Var(
-        m.reforge_set, domain=NonNegativeIntegers, initialize=0)
+    table = problem.reforge_table
+    reforges = []
+    for equipment_type in problem.counts:
+        class_index = table.class_index(equipment_type)
+        for rarity in RARITIES:
+            rarity_index = table.rarity_index(rarity)
+            for reforge_index in numpy.flatnonzero(table.available[class_index, rarity_index]).tolist():
+                reforges.append(((equipment_type, rarity, table.reforge_name(equipment_type, reforge_index)),
+                                 (class_index, rarity_index, reforge_index)))
+    m.reforge_set = Set(initialize=[key for key, _ in reforges], ordered=True)
+    m.reforge_counts = Var(m.reforge_set, domain=NonNegativeIntegers, initialize=0)
+    m.reforge_indices = dict(reforges)
+    m.counts = Param(list(problem.counts), RARITIES, mutable=True, initialize=0)
+    m.coefficients = Param(list(problem.counts), stats, mutable=True, initialize=1)
     m.eqn = ConstraintList()
+
+    # Model keys and table indices of the reforges of each equipment type, for reading coefficients by index
+    groups = {}
+    for key, index in reforges:
+        keys, indices = groups.setdefault(key[0], ([], []))
+        keys.append(key)
+        indices.append(index)
+    m.reforge_groups = {equipment_type: (keys, tuple(numpy.array(indices).T))
+                        for equipment_type, (keys, indices) in groups.items()}
+
+    # Every item gets one reforge, rarities without items have a count of 0
+    for equipment_type in problem.counts:
+        sums = {rarity: [] for rarity in RARITIES}
+        for key in m.reforge_groups.get(equipment_type, ((), ()))[0]:
+            sums[key[1]].append(m.reforge_counts[key])
+        for rarity in RARITIES:
+            if sums[rarity]:
+                m.eqn.add(quicksum(sums[rarity]) == m.counts[equipment_type, rarity])
     return m
 
 
-def create_constraint_rule(stat, m, counts, profile, reforges_set, include_dungeon):
-    rule = quicksum((reforges_set['talisman'][k][j].get(stat, 0) * m.reforge_counts['talisman', j, k] for i, j, k in
-                     m.reforge_set if i == 'talisman'), linear=False)
-    for equip in counts:
+def set_model_parameters(m, problem, stats):
+    """
+    Fill a model built by create_model in with the item counts, reforge stats multipliers and allowed reforges of
+    a problem. Reforges the problem can't get are fixed at 0, the others start at 0 or at the problem's warm start.
+    """
+    for equipment_type, counts in problem.counts.items():
+        for rarity, count in counts.items():
+            m.counts[equipment_type, rarity] = count
+        if equipment_type != 'talisman':
+            for stat in stats:
+                m.coefficients[equipment_type, stat] = sum(problem.children_coefficients[equipment_type][stat])
+
+    warm_start = flatten_reforge_counts(problem.warm_start) if problem.warm_start else {}
+    for key, index in m.reforge_indices.items():
+        count = m.reforge_counts[key]
+        if problem.allowed_reforges[index]:
+            count.unfix()
+            count.value = warm_start.get(key, 0)
+        else:
+            count.fix(0)
+
+
+def reforge_sum(stat, m, problem, equipment_type):
+    """
+    Sum of a stat over the reforge counts of one equipment type.
+    """
+    if equipment_type not in m.reforge_groups:
+        return quicksum(())
+    keys, indices = m.reforge_groups[equipment_type]
+    values = problem.reforge_table.stat_column(stat)[indices].tolist()
+    return quicksum(value * m.reforge_counts[key] for value, key in zip(values, keys) if value)
+
+
+def create_constraint_rule(stat, m, problem):
+    rule = reforge_sum(stat, m, problem, 'talisman')
+    for equip in problem.counts:
         if equip != 'talisman':
-            for child in profile.stats.childrens:
-                if child.type == equip:
-                    rule += child.multiplier * (child.get_dungeon_bonus(stat) if include_dungeon else 1) * quicksum(
-                        (reforges_set[armor_check(equip)][k][j].get(stat, 0) * m.reforge_counts[equip, j, k] for
-                         i, j, k in m.reforge_set if i == equip), linear=False)
+            rule += m.coefficients[equip, stat] * reforge_sum(stat, m, problem, equip)
     return rule
 
 
@@ -62,137 +128,267 @@ def armor_check(armor):
     return 'armor' if armor in ('helmet', 'chestplate', 'leggings', 'boots') else armor
 
 
-# TODO: Add gap limit = 0.10%
-# TODO: possibly a thread limit = 4?
-# noinspection PyUnresolvedReferences,PyTypeChecker,PyCallingNonCallable
-def damage_optimizer(profile, *, perfect_crit_chance, attack_speed_limit, only_blacksmith_reforges, include_dungeon,
-                     reforges_set):
-    # overhead due to rounding
-    if attack_speed_limit == 100:
-        attack_speed_limit = 100.5
-    # remove gilded if there is no midas
-    if not profile.weapon.internal_name == 'MIDAS_SWORD' and not only_blacksmith_reforges:
-        for reforge in reforges_set['sword'].keys():
-            if reforge == 'gilded':
-                reforges_set['sword'].pop('gilded')
-                break
-    # remove warped if there is no aspect of the end
-    if not profile.weapon.internal_name == 'ASPECT_OF_THE_END' and not only_blacksmith_reforges:
-        for reforge in reforges_set['sword'].keys():
-            if reforge == 'warped':
-                reforges_set['sword'].pop('warped')
-                break
-
-    armor_types = [type for type, piece in profile.armor.items(
-    ) if armor_check(type) == 'armor' and piece is not None]
-    equipment_types = ['talisman', profile.weapon.type] + armor_types
-
-    counts = {
-        'talisman': profile.talisman_counts,
-        profile.weapon.type: {rarity: int(profile.weapon.rarity == rarity) for rarity in RARITIES},
-        'helmet': {rarity: int(profile.armor['helmet'].rarity == rarity) for rarity in RARITIES} if profile.armor[
-            'helmet'] else {rarity: 0 for rarity in RARITIES},
-        'chestplate': {rarity: int(profile.armor['chestplate'].rarity == rarity) for rarity in RARITIES} if profile.armor[
-            'chestplate'] else {rarity: 0 for rarity in RARITIES},
-        'leggings': {rarity: int(profile.armor['leggings'].rarity == rarity) for rarity in RARITIES} if profile.armor[
-            'leggings'] else {rarity: 0 for rarity in RARITIES},
-        'boots': {rarity: int(profile.armor['boots'].rarity == rarity) for rarity in RARITIES} if profile.armor[
-            'boots'] else {rarity: 0 for rarity in RARITIES},
-    }
-
-    m = create_model(counts, reforges_set, only_blacksmith_reforges)
-
-    for equipment_type in equipment_types:
-        reforges = reforges_set[armor_check(equipment_type)]
-        sums = {rarity: [] for rarity in RARITIES}
-        for reforge in reforges.keys():
-            for rarity in reforges[reforge].keys():
-                if rarity != 'blacksmith' and (
-                        only_blacksmith_reforges is False or reforges[reforge]['blacksmith'] is True):
-                    if counts[equipment_type][rarity] > 0:
-                        sums[rarity].append(
-                            m.reforge_counts[equipment_type, rarity, reforge])
-        for rarity in RARITIES:
-            if counts[equipment_type][rarity] > 0:
-                m.eqn.add(quicksum(sums[rarity], linear=False)
-                          == counts[equipment_type][rarity])
+def create_multiplier(m, problem):
+    """
+    Add the profile multiplier `m.m` to a model, every renowned armor piece adds 1% to it.
+    Blacksmith reforges have no renowned, the multiplier is a parameter then.
+    """
+    if problem.only_blacksmith_reforges:
+        m.m = Param(mutable=True, initialize=1)
+    else:
+        m.m = Var(domain=Reals)
+        m.start.append((m.m, 1))
+        m.base_multiplier = Param(mutable=True, initialize=1)
+        m.eqn.add(m.m == m.base_multiplier + quicksum(
+            m.reforge_counts[i, j, k] * 0.01 for i, j, k in m.reforge_set
+            if armor_check(i) == 'armor' and k == 'renowned'))
 
-    # for stat in ['strength', 'crit damage'] + ['crit chance'] * perfect_crit_chance + ['attack speed'] * include_attack_speed:
-    #     profile.stats.modifiers[stat].insert(0,
-    #                                         lambda stat: stat + quicksum(
-    #                                             damage_reforges[armor_check(i)][k][j].get(stat, 0) * m.reforge_counts[
-    #                                                 i, j, k] for i, j, k in m.reforge_set))
 
-    # --- variables ---
-    m.s = Var(domain=Reals, initialize=400)
-    m.cd = Var(domain=Reals, initialize=400)
-    m.damage = Var(domain=Reals, initialize=10000)
-    m.floored_strength = Var(domain=Integers, initialize=60)
-    m.cc = Var(domain=Reals, initialize=100)
-    if profile.weapon != 'LIVID_DAGGER':
-        m.a = Var(domain=Reals, initialize=50)
-    if only_blacksmith_reforges:
-        m.m = profile.stats.multiplier
-    else:
-        m.m = Var(domain=Reals, initialize=1)
-    if profile.weapon == 'MIDAS_SWORD' and not only_blacksmith_reforges:
-        m.wd = Var(domain=Reals, initialize=200)
+def set_multiplier(m, problem):
+    if problem.only_blacksmith_reforges:
+        m.m = problem.multiplier
     else:
-        m.wd = profile.weapon.stats.get_stat('damage', dungeon=include_dungeon)
+        m.base_multiplier = problem.multiplier
+
+
+class OptimizerProblem:
+    """
+    Equipment of a profile every optimizer problem reads, the reforge stats of `stat_names` on it.
+    Problems only hold plain values so they can be pickled and solved in another process.
+    """
+    stat_names = ()
+
+    def _load_equipment(self, profile, weapon, include_dungeon):
+        """
+        Read the item counts, reforge stats multipliers and base stats of the profile with `weapon`.
+        """
+        self.armor_types = [type for type, piece in profile.armor.items(
+        ) if armor_check(type) == 'armor' and piece is not None]
+        self.counts = {'talisman': dict(profile.talisman_counts)}
+        if weapon is not None:
+            self.counts[weapon.type] = {rarity: int(weapon.rarity == rarity) for rarity in RARITIES}
+        for piece_type in ('helmet', 'chestplate', 'leggings', 'boots'):
+            piece = profile.armor[piece_type]
+            self.counts[piece_type] = {rarity: int(piece.rarity == rarity) if piece else 0 for rarity in RARITIES}
+
+        # Multiplier of every item stats of each equipment type, reforge stats on them get multiplied by it
+        self.children_coefficients = {}
+        for equip in self.counts:
+            if equip != 'talisman':
+                children = [child for child in profile.stats.childrens if child.type == equip]
+                self.children_coefficients[equip] = {
+                    stat: [child.multiplier * (child.get_dungeon_bonus(stat) if include_dungeon else 1)
+                           for child in children]
+                    for stat in self.stat_names
+                }
+
+        self.multiplier = profile.stats.multiplier
+        self.base_stats = {stat: profile.stats.get_stat(stat, base=True, raw=True, dungeon=include_dungeon)
+                           for stat in self.stat_names}
+
+    def reforge_table_key(self):
+        table = self.reforge_table
+        if table is DAMAGE_REFORGE_TABLE or table is REFORGE_TABLE:
+            return table.name
+        return hashlib.sha1(repr(table.source).encode()).hexdigest()
+
+
+class DamageOptimizerProblem(OptimizerProblem):
+    """
+    Everything the damage optimizer reads from a profile and the chosen options.
+    """
+    stat_names = ('crit chance', 'attack speed', 'strength', 'crit damage')
+
+    def __init__(self, profile, *, perfect_crit_chance, attack_speed_limit, only_blacksmith_reforges,
+                 include_dungeon, reforges_set, time_limit=SCIP_TIMELIMIT, backend=OPTIMIZER_BACKEND):
+        weapon = profile.weapon
+        self.perfect_crit_chance = perfect_crit_chance
+        # overhead due to rounding
+        self.attack_speed_limit = 100.5 if attack_speed_limit == 100 else attack_speed_limit
+        self.only_blacksmith_reforges = only_blacksmith_reforges
+        self.include_dungeon = include_dungeon
+        self.time_limit = time_limit
+        self.backend = backend
+        # Reforge counts of a known good solution, laid out like the solver results, solvers start from it
+        self.warm_start = None
+
+        self.weapon_name = weapon.internal_name
+        self.weapon_type = weapon.type
+        self.weapon_damage = weapon.stats.get_stat('damage', dungeon=include_dungeon)
+        self.weapon_base_damage = weapon.stats.get_stat('damage', base=True, dungeon=include_dungeon)
+        self.helmet_name = profile.armor['helmet'].internal_name if profile.armor['helmet'] else None
+
+        # Reforges sets are the damage reforges with some of them ignored, anything else gets its own table
+        self.reforge_table = DAMAGE_REFORGE_TABLE
+        if not self.reforge_table.contains(reforges_set):
+            self.reforge_table = ReforgeTable(reforges_set, weapon_only=WEAPON_ONLY_REFORGES)
+        # gilded only goes on a midas and warped on an aspect of the end
+        self.allowed_reforges = self.reforge_table.allowed(
+            only_blacksmith=only_blacksmith_reforges, weapon_name=self.weapon_name, reforges=reforges_set)
+
+        self._load_equipment(profile, weapon, include_dungeon)
+        self.equipment_types = ['talisman', weapon.type] + self.armor_types
+
+    def signature(self):
+        """
+        Canonical hashable form of everything the solvers read, problems with the same signature have the same result.
+        No item names are kept, so players with the same rarities and stats share it.
+        """
+        def rounded(values):
+            return tuple(round(value, 6) for value in values)
+
+        return (
+            self.backend,
+            self.time_limit if self.backend == 'scip' else None,
+            bool(self.perfect_crit_chance),
+            self.attack_speed_limit,
+            bool(self.only_blacksmith_reforges),
+            bool(self.include_dungeon),
+            self.weapon_type,
+            self.uses_attack_speed,
+            self.variable_weapon_damage,
+            round(self.weapon_damage, 6),
+            round(self.weapon_base_damage, 6) if self.variable_weapon_damage else None,
+            self.helmet_name == 'TARANTULA_HELMET',
+            tuple(self.armor_types),
+            tuple((equip, tuple(count[rarity] for rarity in RARITIES)) for equip, count in self.counts.items()),
+            tuple((equip, tuple(rounded(sorted(coefficients[stat])) for stat in self.stat_names))
+                  for equip, coefficients in self.children_coefficients.items()),
+            round(self.multiplier, 6),
+            rounded(self.base_stats[stat] for stat in self.stat_names),
+            self.reforge_table_key(),
+            numpy.packbits(self.allowed_reforges).tobytes(),
+        )
+
+    @property
+    def uses_attack_speed(self):
+        return self.weapon_name != 'LIVID_DAGGER'
+
+    @property
+    def variable_weapon_damage(self):
+        return self.weapon_name == 'MIDAS_SWORD' and not self.only_blacksmith_reforges
+
+
+class DamageLoadouts:
+    """
+    Every weapon, armor set and pet combination of a profile with the same damage optimizer options.
+    Only plain values are kept, optimizer workers build the loadouts and their problems so the event loop never does.
+    Loadouts are numbered weapon first, then armor set, then pet.
+    """
+
+    def __init__(self, profile, *, include_dungeon, potions=(), support_items=(), **options):
+        self.uuid = profile.player.uuid
+        # The other members of the profile don't change its stats
+        self.raw_profile_data = {'profile_id': profile.id, 'cute_name': profile.name,
+                                 'members': {self.uuid: profile.profile_data}}
+        self.include_dungeon = include_dungeon
+        self.potions = list(potions)
+        self.support_items = list(support_items)
+        # The other DamageOptimizerProblem options
+        self.options = options
+        self.shape = (len(profile.weapons), len(self.armor_sets(profile)), len(profile.pets) or 1)
+
+    def __len__(self):
+        return int(numpy.prod(self.shape))
+
+    @staticmethod
+    def armor_sets(profile):
+        """
+        The worn armor, when there is any, and the wardrobe's armor sets.
+        """
+        armor_sets = profile.wardrobe
+        if any(piece is not None for piece in profile.current_armor.values()):
+            armor_sets = [profile.current_armor] + armor_sets
+        return armor_sets
+
+    def profile(self):
+        """
+        The profile again, built from its raw data.
+        """
+        return Profile(player=SimpleNamespace(uuid=self.uuid), raw_profile_data=self.raw_profile_data, load_all=True)
+
+    def loadout(self, profile, index):
+        """
+        Loadout number `index` of `profile`, the profile these loadouts were made of or one built by `profile()`.
+        """
+        weapon, armor_set, pet = (int(position) for position in numpy.unravel_index(index, self.shape))
+        return profile.loadout(weapon=profile.weapons[weapon], armor=self.armor_sets(profile)[armor_set],
+                               pet=profile.pets[pet] if profile.pets else None, dungeon=self.include_dungeon,
+                               potions=self.potions, support_items=self.support_items)
+
+    def problem(self, loadout):
+        return DamageOptimizerProblem(loadout, include_dungeon=self.include_dungeon, **self.options)
+
+
+def damage_model_shape(problem):
+    """
+    Problems with the same shape get the same damage model with different parameters.
+    """
+    return (problem.reforge_table_key(), problem.weapon_type, problem.uses_attack_speed,
+            bool(problem.attack_speed_limit), bool(problem.only_blacksmith_reforges), problem.variable_weapon_damage)
+
+
+# noinspection PyUnresolvedReferences,PyTypeChecker
+def create_damage_template(problem):
+    """
+    Build the Pyomo damage model of every problem with the shape of `problem`, see set_damage_parameters.
+    """
+    attack_speed_limit = problem.attack_speed_limit
+    m = create_model(problem, DamageOptimizerProblem.stat_names)
+
+    # --- parameters ---
+    m.base_stats = Param(DamageOptimizerProblem.stat_names, mutable=True, initialize=0)
+    # crit damage per strength, a tarantula helmet gives 1 per 10
+    m.tarantula = Param(mutable=True, initialize=0)
+    m.attack_speed_limit = Param(mutable=True, initialize=100)
     # ---
 
-    # --- modifiers ---
-    # manually add it here now, will find a better way to do it
-    cd_tara_helm = m.s / \
-        10 if profile.armor['helmet'] == 'TARANTULA_HELMET' else 0
+    # --- variables ---
+    m.s = Var(domain=Reals)
+    m.cd = Var(domain=Reals)
+    m.damage = Var(domain=Reals)
+    m.floored_strength = Var(domain=Integers)
+    m.cc = Var(domain=Reals)
+    m.start = [(m.s, 400), (m.cd, 400), (m.damage, 10000), (m.floored_strength, 60), (m.cc, 100)]
+    if problem.uses_attack_speed:
+        m.a = Var(domain=Reals)
+        m.start.append((m.a, 50))
+    create_multiplier(m, problem)
+    if problem.variable_weapon_damage:
+        m.wd = Var(domain=Reals)
+        m.start.append((m.wd, 200))
+        m.weapon_base_damage = Param(mutable=True, initialize=0)
+    else:
+        m.wd = Param(mutable=True, initialize=0)
     # ---
 
     # --- weapon damage ---
-    if profile.weapon == 'MIDAS_SWORD' and not only_blacksmith_reforges:
-        m.eqn.add(m.wd == profile.weapon.stats.get_stat('damage', base=True, dungeon=include_dungeon) + quicksum(
-            (reforges_set['sword'][k][j].get('damage', 0) * m.reforge_counts['sword', j, k] for i, j, k in
-             m.reforge_set if i == 'sword'), linear=False))
-    # ---
-
-    # --- multiplier ---
-    if not only_blacksmith_reforges:
-        m.eqn.add(m.m == profile.stats.multiplier + (quicksum(
-            (m.reforge_counts[i, j, k] * 0.01 for i, j,
-             k in m.reforge_set if i in armor_types and k == 'renowned'),
-            linear=False) if not only_blacksmith_reforges else 0))
+    if problem.variable_weapon_damage:
+        m.eqn.add(m.wd == m.weapon_base_damage + reforge_sum('damage', m, problem, 'sword'))
     # ---
 
     # --- crit chance ---
-    cc_rule = create_constraint_rule(
-        'crit chance', m, counts, profile, reforges_set, include_dungeon)
-    m.eqn.add(
-        m.cc == m.m * (cc_rule + profile.stats.get_stat('crit chance', base=True, raw=True, dungeon=include_dungeon)))
-    if perfect_crit_chance:
-        m.eqn.add(99.5 <= m.cc)
+    cc_rule = create_constraint_rule('crit chance', m, problem)
+    m.eqn.add(m.cc == m.m * (cc_rule + m.base_stats['crit chance']))
+    m.perfect_crit_chance = Constraint(expr=99.5 <= m.cc)
     # ---
 
     # --- attack speed ---
-    if profile.weapon != 'LIVID_DAGGER':
-        a_rule = create_constraint_rule(
-            'attack speed', m, counts, profile, reforges_set, include_dungeon)
-        m.eqn.add(
-            m.a == m.m * (a_rule + profile.stats.get_stat('attack speed', base=True, raw=True, dungeon=include_dungeon)))
+    if problem.uses_attack_speed:
+        a_rule = create_constraint_rule('attack speed', m, problem)
+        m.eqn.add(m.a == m.m * (a_rule + m.base_stats['attack speed']))
         if attack_speed_limit:
-            m.eqn.add(m.a <= attack_speed_limit)
+            m.eqn.add(m.a <= m.attack_speed_limit)
     # ---
 
     # --- strength ---
-    strength_rule = create_constraint_rule(
-        'strength', m, counts, profile, reforges_set, include_dungeon)
-    m.eqn.add(
-        m.s == m.m * (strength_rule + profile.stats.get_stat('strength', base=True, raw=True, dungeon=include_dungeon)))
+    strength_rule = create_constraint_rule('strength', m, problem)
+    m.eqn.add(m.s == m.m * (strength_rule + m.base_stats['strength']))
     # ---
 
     # --- crit damage ---
-    cd_rule = create_constraint_rule(
-        'crit damage', m, counts, profile, reforges_set, include_dungeon)
-    m.eqn.add(m.cd == m.m * (cd_rule + profile.stats.get_stat('crit damage', base=True, raw=True,
-                                                              dungeon=include_dungeon) + cd_tara_helm))
+    cd_rule = create_constraint_rule('crit damage', m, problem)
+    m.eqn.add(m.cd == m.m * (cd_rule + m.base_stats['crit damage'] + m.tarantula * m.s))
     # ---
 
     m.eqn.add(m.floored_strength >= m.s / 5 - 0.9999)
@@ -200,20 +396,87 @@ def damage_optimizer(profile, *, perfect_crit_chance, attack_speed_limit, only_b
     m.eqn.add(m.damage == (5 + m.wd + m.floored_strength)
               * (1 + m.s / 100) * (1 + m.cd / 100))
 
-    if profile.weapon != 'LIVID_DAGGER':
+    if problem.uses_attack_speed:
         m.objective = Objective(expr=m.damage * (((m.a + 100) / 100) / 0.5) if attack_speed_limit else m.damage,
                                 sense=maximize)
     else:
         m.objective = Objective(expr=m.damage * (((100 + 100) / 100) / 0.5) if attack_speed_limit else m.damage,
                                 sense=maximize)
-    is_optimized = solve(m)
+    return m
+
+
+def set_damage_parameters(m, problem):
+    """
+    Fill a model built by create_damage_template in with the numbers of a problem of its shape.
+    """
+    set_model_parameters(m, problem, DamageOptimizerProblem.stat_names)
+    for stat in problem.stat_names:
+        m.base_stats[stat] = problem.base_stats[stat]
+    m.tarantula = 0.1 if problem.helmet_name == 'TARANTULA_HELMET' else 0
+    if problem.attack_speed_limit:
+        m.attack_speed_limit = problem.attack_speed_limit
+    set_multiplier(m, problem)
+    if problem.variable_weapon_damage:
+        m.weapon_base_damage = problem.weapon_base_damage
+    else:
+        m.wd = problem.weapon_damage
+
+    if problem.perfect_crit_chance:
+        m.perfect_crit_chance.activate()
+    else:
+        m.perfect_crit_chance.deactivate()
+
+    # Start every solve from the same point, not from the last problem's solution
+    for var, start in m.start:
+        var.value = start
+
+
+# Models by shape, building one takes longer than filling it in so they are kept for the next problems
+_models = OrderedDict()
+_MODELS_SIZE = 16
+
+
+def shared_model(shape, create_template, problem):
+    """
+    Return the model of that shape, built by create_template(problem) the first time.
+    """
+    m = _models.get(shape)
+    if m is None:
+        m = _models[shape] = create_template(problem)
+        if len(_models) > _MODELS_SIZE:
+            _models.popitem(last=False)
+    else:
+        _models.move_to_end(shape)
+    return m
+
+
+def create_damage_model(problem):
+    """
+    Return the Pyomo model of a DamageOptimizerProblem, ready to be solved by scip.
+    Problems of the same shape share one model, it only holds a problem's numbers until the next call.
+    """
+    m = shared_model(('damage',) + damage_model_shape(problem), create_damage_template, problem)
+    set_damage_parameters(m, problem)
+    return m
+
+
+# TODO: Add gap limit = 0.10%
+# TODO: possibly a thread limit = 4?
+# noinspection PyCallingNonCallable
+def solve_damage_problem_scip(problem):
+    """
+    Solve a DamageOptimizerProblem with a Pyomo model and the scip executable.
+    Return the best stats and reforge counts.
+    """
+    m = create_damage_model(problem)
+    is_optimized = solve(m, problem.time_limit)
 
     # debug stuff
     # from pyomo.util.infeasible import log_infeasible_constraints
     # log_infeasible_constraints(m, log_expression=True, log_variables=True)
 
     result_atk_speed = 100
-    if profile.weapon != 'LIVID_DAGGER':
+    if problem.uses_attack_speed:
         result_atk_speed = m.a()
     result = {'strength': m.s(),
               'crit damage': m.cd(),
@@ -221,77 +484,289 @@ def damage_optimizer(profile, *, perfect_crit_chance, attack_speed_limit, only_b
               'attack speed': result_atk_speed,
               'is optimized': is_optimized}
 
-    if profile.weapon == 'MIDAS_SWORD' and not only_blacksmith_reforges:
-        result.update({'damage': m.wd()})
-    else:
-        result.update({'damage': m.wd})
+    result.update({'damage': value(m.wd)})
+
+    return result, format_counts(m.reforge_counts)
+
+
+damage_solvers = {
+    'native': solve_damage_problem_exact,
+    'scip': solve_damage_problem_scip,
+}
+
+# What each backend builds before it starts solving, for benchmarks
+damage_model_builders = {
+    'native': create_damage_search,
+    'scip': create_damage_model,
+}
+
+
+def solve_damage_problem(problem):
+    """
+    Solve a DamageOptimizerProblem with its backend, this is what runs in the optimizer worker processes.
+    """
+    return damage_solvers[problem.backend](problem)
+
+
+def solve_damage_problems(problems, grid_caps=None):
+    """
+    Solve DamageOptimizerProblems with the same talismans in one optimizer worker job.
+    Native ones share one talisman grid built with `grid_caps`, see talisman_grid_key.
+    """
+    native = iter(solve_damage_problems_exact([problem for problem in problems if problem.backend == 'native'],
+                                              grid_caps=grid_caps))
+    return [next(native) if problem.backend == 'native' else solve_damage_problem(problem) for problem in problems]
+
+
+def plan_damage_loadouts(loadouts, *, start, stop, limit):
+    """
+    Build the problems of loadouts `start` to `stop` of a DamageLoadouts, this is what runs in the optimizer worker
+    processes for OptimizerPool.rank.
+    The greedy solutions of the `limit` problems with the highest damage upper bounds give the damage a problem must
+    reach to be one of the `limit` best, the others are dropped. Return (index, problem, upper bound, talisman grid key,
+    greedy result or None) of the problems left, best bound first. Problems with a greedy result are warm started by it.
+    """
+    profile = loadouts.profile()
+    problems = {index: loadouts.problem(loadouts.loadout(profile, index)) for index in range(start, stop)}
+    bounds = {index: damage_upper_bound(problem) for index, problem in problems.items()}
+    order = sorted((index for index, bound in bounds.items() if bound > float('-inf')),
+                   key=lambda index: bounds[index], reverse=True)
+
+    seeded = order[:limit]
+    greedy = dict(zip(seeded, greedy_damage_solutions([problems[index] for index in seeded])))
+    lowest = []
+    for index, seed in greedy.items():
+        if seed is not None:
+            problems[index].warm_start = seed[1]
+            lowest.append(damage_objective(problems[index], seed[0]))
+    threshold = sorted(lowest, reverse=True)[limit - 1] if len(lowest) >= limit else float('-inf')
+
+    return [(index, problems[index], bounds[index], talisman_grid_key(problems[index]), greedy.get(index))
+            for index in order if bounds[index] >= threshold]
 
+
+def damage_optimizer(profile, *, perfect_crit_chance, attack_speed_limit, only_blacksmith_reforges, include_dungeon,
+                     reforges_set):
+    """
+    Optimize the profile's reforges for damage in this process, see OptimizerPool to run it without blocking.
+    """
+    return solve_damage_problem(DamageOptimizerProblem(
+        profile,
+        perfect_crit_chance=perfect_crit_chance,
+        attack_speed_limit=attack_speed_limit,
+        only_blacksmith_reforges=only_blacksmith_reforges,
+        include_dungeon=include_dungeon,
+        reforges_set=reforges_set
+    ))
+
+
+class OptimizerGoal:
+    """
+    What the stat optimizer maximizes, new goals only need a definition.
+    `objective` gets {stat: value} of the goal's stats, capped, as numbers or as Pyomo expressions and must never
+    go down when one of them goes up. It is pickled with the problems, so it must be a module level function.
+    `caps` are {stat: profile stat it can't go over}, `minimums` and `maximums` {stat: bound} every solution keeps.
+    """
+
+    def __init__(self, name, stats, objective, *, minimums=None, maximums=None, caps=None):
+        self.name = name
+        self.stats = tuple(stats)
+        self.objective = objective
+        self.minimums = minimums or {}
+        self.maximums = maximums or {}
+        self.caps = caps or {}
+
+    def __repr__(self):
+        return f'<OptimizerGoal {self.name}>'
+
+
+def effective_health(stats):
+    return stats['health'] * (1 + stats['defense'] / 100)
+
+
+def intelligence(stats):
+    return stats['intelligence']
+
+
+def speed(stats):
+    return stats['speed']
+
+
+STAT_GOALS = {goal.name: goal for goal in (
+    OptimizerGoal('ehp', ('health', 'defense'), effective_health),
+    OptimizerGoal('intelligence', ('intelligence',), intelligence),
+    OptimizerGoal('speed', ('speed',), speed, caps={'speed': 'speed cap'}),
+)}
+
+
+class StatOptimizerProblem(OptimizerProblem):
+    """
+    Everything the stat optimizer reads from a profile for a goal, with more `minimums` and `maximums` on any stat.
+    Every reforge can be picked, the weapon's too.
+    """
+
+    def __init__(self, profile, goal, *, only_blacksmith_reforges, include_dungeon, minimums=None, maximums=None,
+                 time_limit=SCIP_TIMELIMIT, backend=OPTIMIZER_BACKEND):
+        weapon = profile.weapon
+        self.goal = goal
+        self.minimums = {**goal.minimums, **(minimums or {})}
+        self.maximums = {**goal.maximums, **(maximums or {})}
+        self.stat_names = tuple(dict.fromkeys((*goal.stats, *self.minimums, *self.maximums)))
+        self.only_blacksmith_reforges = only_blacksmith_reforges
+        self.include_dungeon = include_dungeon
+        self.time_limit = time_limit
+        self.backend = backend
+        self.warm_start = None
+
+        self.weapon_name = weapon.internal_name if weapon else None
+        self.reforge_table = REFORGE_TABLE
+        self.allowed_reforges = self.reforge_table.allowed(
+            only_blacksmith=only_blacksmith_reforges, weapon_name=self.weapon_name)
+        if weapon is not None and reforge_class(weapon.type) not in self.reforge_table.classes:
+            weapon = None
+
+        self._load_equipment(profile, weapon, include_dungeon)
+        self.caps = {stat: profile.stats.get_stat(cap, dungeon=include_dungeon) for stat, cap in goal.caps.items()}
+
+    def signature(self):
+        """
+        Canonical hashable form of everything the solvers read, like DamageOptimizerProblem.signature.
+        """
+        def rounded(values):
+            return tuple(round(value, 6) for value in values)
+
+        return (
+            'stats',
+            self.backend,
+            self.time_limit if self.backend == 'scip' else None,
+            self.goal.name,
+            tuple(sorted((stat, round(bound, 6)) for stat, bound in self.minimums.items())),
+            tuple(sorted((stat, round(bound, 6)) for stat, bound in self.maximums.items())),
+            tuple(sorted((stat, round(cap, 6)) for stat, cap in self.caps.items())),
+            bool(self.only_blacksmith_reforges),
+            bool(self.include_dungeon),
+            tuple(self.armor_types),
+            tuple((equip, tuple(count[rarity] for rarity in RARITIES)) for equip, count in self.counts.items()),
+            tuple((equip, tuple(rounded(sorted(coefficients[stat])) for stat in self.stat_names))
+                  for equip, coefficients in self.children_coefficients.items()),
+            round(self.multiplier, 6),
+            rounded(self.base_stats[stat] for stat in self.stat_names),
+            self.reforge_table_key(),
+            numpy.packbits(self.allowed_reforges).tobytes(),
+        )
+
+
+def stat_model_shape(problem):
+    """
+    Problems with the same shape get the same stat model with different parameters, goals are told apart by name.
+    """
+    return (problem.reforge_table_key(), tuple(problem.counts), problem.goal.name, problem.stat_names,
+            tuple(sorted(problem.minimums)), tuple(sorted(problem.maximums)), bool(problem.only_blacksmith_reforges))
+
+
+# noinspection PyUnresolvedReferences,PyTypeChecker
+def create_stat_template(problem):
+    """
+    Build the Pyomo model of every stat problem with the shape of `problem`, see set_stat_parameters.
+    """
+    stat_names = problem.stat_names
+    m = create_model(problem, stat_names)
+    m.start = []
+
+    m.base_stats = Param(stat_names, mutable=True, initialize=0)
+    m.minimums = Param(sorted(problem.minimums), mutable=True, initialize=0)
+    m.maximums = Param(sorted(problem.maximums), mutable=True, initialize=0)
+    m.caps = Param(sorted(problem.caps), mutable=True, initialize=0)
+    create_multiplier(m, problem)
+
+    m.stats = Var(stat_names, domain=Reals)
+    for stat in stat_names:
+        m.eqn.add(m.stats[stat] == m.m * (create_constraint_rule(stat, m, problem) + m.base_stats[stat]))
+
+    # A capped stat can't go over the stat or its cap, the objective pushes it up to the lowest of both
+    m.capped = Var(sorted(problem.caps), domain=Reals)
+    for stat in problem.caps:
+        m.eqn.add(m.capped[stat] <= m.stats[stat])
+        m.eqn.add(m.capped[stat] <= m.caps[stat])
+    values = {stat: m.capped[stat] if stat in problem.caps else m.stats[stat] for stat in stat_names}
+
+    # Minimums hold for the capped stats and maximums for the stats before their cap
+    for stat in problem.minimums:
+        m.eqn.add(values[stat] >= m.minimums[stat])
+    for stat in problem.maximums:
+        m.eqn.add(m.stats[stat] <= m.maximums[stat])
+
+    m.objective = Objective(expr=problem.goal.objective(values), sense=maximize)
+    return m
+
+
+def set_stat_parameters(m, problem):
+    """
+    Fill a model built by create_stat_template in with the numbers of a problem of its shape.
+    """
+    set_model_parameters(m, problem, problem.stat_names)
+    for stat in problem.stat_names:
+        m.base_stats[stat] = problem.base_stats[stat]
+    for stat, bound in problem.minimums.items():
+        m.minimums[stat] = bound
+    for stat, bound in problem.maximums.items():
+        m.maximums[stat] = bound
+    for stat, cap in problem.caps.items():
+        m.caps[stat] = cap
+    set_multiplier(m, problem)
+
+    for var, start in m.start:
+        var.value = start
+
+
+def create_stat_model(problem):
+    """
+    Return the Pyomo model of a StatOptimizerProblem, ready to be solved by scip.
+    """
+    m = shared_model(('stats',) + stat_model_shape(problem), create_stat_template, problem)
+    set_stat_parameters(m, problem)
+    return m
+
+
+# noinspection PyCallingNonCallable
+def solve_stat_problem_scip(problem):
+    """
+    Solve a StatOptimizerProblem with a Pyomo model and the scip executable.
+    Return the best stats, the goal's objective under its name, and reforge counts.
+    """
+    m = create_stat_model(problem)
+    is_optimized = solve(m, problem.time_limit)
+
+    result = {stat: value(m.stats[stat]) for stat in problem.stat_names}
+    for stat, cap in problem.caps.items():
+        result[stat] = min(result[stat], cap)
+    result[problem.goal.name] = problem.goal.objective(result)
+    result['is optimized'] = is_optimized
     return result, format_counts(m.reforge_counts)
 
-# def ehp_optimizer(player, talisman_rarity_counts, *, only_blacksmith_reforges):
-# equipment_types = ['talisman', 'armor']
-# m = create_model(equipment_types, ehp_reforges)
-#
-# m.m = 1 + player.stats['multiplier'] / 100
-#
-# m.hp = Var(domain=Reals, initialize=1400)
-# m.eqn.add(m.hp == max(0, m.m * (quicksum(ehp_reforges[i][k][j].get('health', 0) * m.reforge_counts[i, j, k] for i, j, k in m.reforge_set) + player.stats['health'])))
-# m.d = Var(domain=Reals, initialize=700)
-# m.eqn.add(m.d == max(0, m.m * (quicksum(ehp_reforges[i][k][j].get('defense', 0) * m.reforge_counts[i, j, k] for i, j, k in m.reforge_set) + player.stats['defense'])))
-#
-# counts = {'talisman': talisman_rarity_counts, 'armor': armor_rarity_counts}
-# for equipment_type in equipment_types:
-#     reforges = ehp_reforges[equipment_type]
-#     sums = {rarity: [] for rarity in rarities}
-#     for reforge in reforges.keys():
-#         for rarity in reforges[reforge].keys():
-#             sums[rarity].append(m.reforge_counts[equipment_type, rarity, reforge])
-#     for rarity in rarities:
-#         m.eqn.add(quicksum(sums[rarity]) == counts[equipment_type][rarity])
-# m.objective = Objective(expr=(m.hp * (1 + m.d / 100)), sense=maximize)
-# solve(m)
-#
-# return {'ehp': m.objective(), 'health': m.hp(), 'defense': m.d()}, format_counts(m.reforge_counts)
-
-
-# def mastiff_ehp_optimizer(only_blacksmith_reforges):
-#     if only_blacksmith_reforges:
-#         return '''Reforge all your armor to fierce
-# Reforge all your talismans to hurtful
-# Reforge your sword/fishing rod to spicy
-# Reforge your bow to rapid'''
-#     else:
-#         return '''Reforge all your armor to fierce
-# Reforge all your talismans to hurtful
-# Reforge your sword/fishing rod to spicy or fabled
-# Reforge your bow to rapid'''
-#
-#
-# def intelligence_optimizer(only_blacksmith_reforges):
-#     if only_blacksmith_reforges:
-#         return '''Reforge all your armor to wise
-# Reforge all your common talismans to demonic
-# Reforge all your other talismans to bizarre
-# Reforge your sword/fishing rod to heroic
-# Reforge your bow to deadly'''
-#     else:
-#         return '''Reforge all your armor to necrotic
-# Reforge all your common talismans to demonic
-# Reforge all your other talismans to bizarre
-# Reforge your sword/fishing rod to heroic
-# Reforge your bow to deadly'''
-#
-#
-# def speed_optimizer(only_blacksmith_reforges):
-#     if only_blacksmith_reforges:
-#         return '''Reforge your common talismans to simple
-# Reforge your other talismans to vivid
-# Reforge your common and uncommon armor to mythic
-# Reforge your other armor to light
-# Sword/bow/fishing rod reforges don't matter'''
-#     else:
-#         return '''Reforge your common talismans to simple
-# Reforge your other talismans to vivid
-# Reforge your common and uncommon armor to renowned or spiked
-# Reforge your other armor to light
-# Sword/bow/fishing rod reforges don't matter'''
+
+stat_solvers = {
+    'native': solve_stat_problem_exact,
+    'scip': solve_stat_problem_scip,
+}
+
+
+def solve_stat_problem(problem):
+    """
+    Solve a StatOptimizerProblem with its backend, this is what runs in the optimizer worker processes.
+    """
+    return stat_solvers[problem.backend](problem)
+
+
+def stat_optimizer(profile, goal, *, only_blacksmith_reforges, include_dungeon, minimums=None, maximums=None):
+    """
+    Optimize the profile's reforges for a goal of STAT_GOALS or any OptimizerGoal in this process.
+    """
+    return solve_stat_problem(StatOptimizerProblem(
+        profile,
+        STAT_GOALS[goal] if isinstance(goal, str) else goal,
+        only_blacksmith_reforges=only_blacksmith_reforges,
+        include_dungeon=include_dungeon,
+        minimums=minimums,
+        maximums=maximums
+    ))
@@ -0,0 +1,89 @@
+import copy
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
+
+from pymongo import ASCENDING
+from pymongo.errors import PyMongoError
+
+
+class OptimizerResultCache:
+    """
+    Solved optimizer results keyed by the problem signature, kept in memory and in mongo.
+    Players with the same setup get the same result, so popular setups are only ever solved once.
+    """
+
+    def __init__(self, collection, *, max_size=1024, max_age=30 * 86400):
+        self.collection = collection
+        self.max_size = max_size
+        # Seconds a stored result is kept in mongo, results only change when the reforge stats change
+        self.max_age = max_age
+        self._cache = OrderedDict()
+
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    async def create_indexes(self):
+        # Mongo drops stored results on its own once they are older than max_age
+        await self.collection.create_index([('created_at', ASCENDING)], expireAfterSeconds=self.max_age)
+
+    @staticmethod
+    def key(problem):
+        return hashlib.sha1(repr(problem.signature()).encode()).hexdigest()
+
+    def _remember(self, key, result):
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def get(self, problem):
+        """
+        Return the stored (stats, counts) result of a problem, None if it was never solved.
+        """
+        key = self.key(problem)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(self._cache[key])
+
+        try:
+            document = await self.collection.find_one({'_id': key})
+        except PyMongoError:
+            document = None
+        if document is None:
+            self.misses += 1
+            return None
+
+        result = (document['stats'], document['counts'])
+        self._remember(key, result)
+        self.db_hits += 1
+        return copy.deepcopy(result)
+
+    async def put(self, problem, result):
+        """
+        Store a solved result, results the solver didn't finish optimizing are not stored.
+        """
+        stats, counts = result
+        if not stats.get('is optimized'):
+            return
+        key = self.key(problem)
+        self._remember(key, copy.deepcopy(result))
+        try:
+            await self.collection.replace_one({'_id': key}, {
+                'stats': stats,
+                'counts': counts,
+                'created_at': datetime.utcnow(),
+            }, upsert=True)
+        except PyMongoError:
+            pass
+
+    def stats(self):
+        return {
+            'size': len(self._cache),
+            'max size': self.max_size,
+            'hits': self.hits,
+            'db hits': self.db_hits,
+            'misses': self.misses,
+        }
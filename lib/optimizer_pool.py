@@ -0,0 +1,297 @@
+import asyncio
+import functools
+import itertools
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from . import OptimizerTimeoutError
+from .optimizer import solve_damage_problem, solve_damage_problems, plan_damage_loadouts
+from .damage_solver import greedy_damage_solution, greedy_damage_solutions, damage_objective
+
+
+class _OptimizerJob:
+    """
+    A job waiting in the optimizer queue for a worker or running in one.
+    """
+
+    def __init__(self, future, sequence, *, owner=None, cost=1):
+        guild, user = owner or (None, None)
+        self.future = future
+        self.sequence = sequence
+        self.user = user
+        # Direct messages have no guild, their user counts as a guild of its own
+        self.guild = guild if guild is not None else ('user', user)
+        self.cost = cost
+        self.queued_at = time.monotonic()
+
+
+class OptimizerPool:
+    """
+    Runs optimizer problems in worker processes so solving never blocks the event loop.
+    Problems are sent to the workers pickled, so they must only hold plain values and not live profiles.
+
+    Every job goes through one queue and at most `max_workers` of them run at once. A free worker goes to the
+    queued job of the guild, then the user, with the fewest running jobs, short jobs first among those.
+    """
+
+    def __init__(self, *, max_workers=2, timeout=30.0, report_interval=5.0):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.report_interval = report_interval
+        self._executor = None
+
+        self._queue = []
+        self._counter = itertools.count()
+        self._running_guilds = Counter()
+        self._running_users = Counter()
+        self.running = 0
+        self.completed = 0
+        self.timed_out = 0
+        self.cancelled = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _priority(self, job, now):
+        # A job that waited longer than a solve takes loses its cost so a stream of short jobs can't starve it
+        cost = job.cost if now - job.queued_at < self.timeout else 0
+        return self._running_guilds[job.guild], self._running_users[job.user], cost, job.sequence
+
+    def queued(self):
+        """
+        Return the queued jobs in the order they will get a worker.
+        """
+        now = time.monotonic()
+        return sorted(self._queue, key=lambda job: self._priority(job, now))
+
+    def position(self, job):
+        """
+        Return the 1 based place of a job in the queue, or 0 once it got a worker.
+        """
+        if job not in self._queue:
+            return 0
+        return self.queued().index(job) + 1
+
+    def _release(self):
+        """
+        Hand out the free workers to the queued jobs in priority order.
+        """
+        while self._queue and self.running < self.max_workers:
+            now = time.monotonic()
+            job = min(self._queue, key=lambda queued: self._priority(queued, now))
+            self._queue.remove(job)
+            self.running += 1
+            self._running_guilds[job.guild] += 1
+            self._running_users[job.user] += 1
+            job.future.set_result(None)
+
+    def _finish(self, job):
+        self.running -= 1
+        self._running_guilds[job.guild] -= 1
+        self._running_users[job.user] -= 1
+        self._running_guilds += Counter()  # drop the owners without running jobs
+        self._running_users += Counter()
+        self._release()
+
+    async def _acquire(self, job, queued=None):
+        """
+        Wait in the queue until `job` gets a worker.
+        `queued` is awaited with the job's position every time it changes, and with 0 once it got a worker.
+        """
+        self._queue.append(job)
+        self._release()
+
+        reported = None
+        try:
+            while not job.future.done():
+                position = self.position(job)
+                if queued is not None and position != reported:
+                    reported = position
+                    await queued(position)
+                await asyncio.wait([job.future], timeout=self.report_interval)
+            if queued is not None and reported is not None:
+                await queued(0)
+        except BaseException as e:
+            # Cancelled, or `queued` raised, the job must not hold its place or worker
+            if job in self._queue:
+                self._queue.remove(job)
+                if isinstance(e, asyncio.CancelledError):
+                    self.cancelled += 1
+            elif job.future.done():
+                # Got a worker on the way out, give it to the next job
+                self._finish(job)
+            raise
+
+    async def run(self, problem, *, solver=solve_damage_problem, timeout=None, owner=None, cost=1, queued=None):
+        """
+        Solve a problem in a worker process and return the solver result.
+
+        The job waits in the queue for a worker first, `owner` is the (guild id, user id) it is shared fairly by
+        and `cost` an estimate of how long it takes, like the number of problems. `queued` is awaited with the
+        job's position in the queue whenever it changes. Cancelling a queued job takes it out of the queue.
+        Raise OptimizerTimeoutError when solving takes longer than `timeout` seconds, a job that timed out or
+        got cancelled after it started keeps its worker until the solver's own time limit stops it.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_event_loop()
+        job = _OptimizerJob(loop.create_future(), next(self._counter), owner=owner, cost=cost)
+        await self._acquire(job, queued)
+
+        try:
+            try:
+                future = self.executor.submit(solver, problem)
+            except BrokenProcessPool:
+                # A worker died, start a new pool and try once more
+                self._executor = None
+                future = self.executor.submit(solver, problem)
+        except BaseException:
+            self._finish(job)
+            raise
+        # The worker is only free again when the process is done, not when we stop waiting for it
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._finish, job))
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise OptimizerTimeoutError(timeout) from None
+        except BrokenProcessPool:
+            self._executor = None
+            raise
+
+        self.completed += 1
+        return result
+
+    async def solutions(self, problem, *, heuristic=greedy_damage_solution, solver=solve_damage_problem,
+                        objective=damage_objective, timeout=None, owner=None, queued=None):
+        """
+        Yield improving results of a problem as they are found.
+        The heuristic result comes first, right away, and warm starts the solver. The solver result follows when it
+        is proven optimal or better than the heuristic one.
+        Once a result was yielded a timeout ends the stream instead of raising OptimizerTimeoutError,
+        so the last result is always the best one found.
+        `owner` and `queued` are passed on to `run`.
+        """
+        best = heuristic(problem)
+        if best is not None:
+            problem.warm_start = best[1]
+            yield best
+
+        try:
+            result = await self.run(problem, solver=solver, timeout=timeout, owner=owner, queued=queued)
+        except OptimizerTimeoutError:
+            if best is None:
+                raise
+            return
+
+        if best is None or result[0]['is optimized'] or objective(problem, result[0]) > objective(problem, best[0]):
+            yield result
+
+    async def rank(self, loadouts, *, limit=10, batch_size=250, chunk_size=8, timeout=None, owner=None, queued=None):
+        """
+        Solve the damage problem of every loadout of a DamageLoadouts. Return the `limit` best as
+        (loadout index, result) with the highest damage first, and the indices of the loadouts that weren't
+        solved to optimality, when there are any the ranking is partial.
+
+        Workers build the loadouts in batches of `batch_size` with plan_damage_loadouts, the event loop only gets
+        the problems that can still make the ranking of their batch. Greedy solutions of every batch give the damage
+        a problem must reach to be ranked, problems whose upper bound is below it are skipped without solving them.
+        The others are solved in chunks of problems with the same talismans spread over the workers,
+        a worker builds the talisman grid of a chunk once for all of its problems.
+        Problems of a chunk that timed out are ranked by their greedy solution instead, flagged not optimized,
+        or left out when that times out too. Loadouts of a batch that timed out are left out.
+        Every job is queued for `owner` with its number of loadouts as cost, `queued` only follows the first one.
+        """
+        batches = [(start, min(start + batch_size, len(loadouts))) for start in range(0, len(loadouts), batch_size)]
+        planned = await asyncio.gather(*(self.run(loadouts, solver=functools.partial(plan_damage_loadouts, start=start,
+                                                                                     stop=stop, limit=limit),
+                                                  timeout=timeout, owner=owner, cost=stop - start,
+                                                  queued=None if position else queued)
+                                         for position, (start, stop) in enumerate(batches)), return_exceptions=True)
+
+        problems, bounds, grid_keys, greedy = {}, {}, {}, {}
+        unbuilt = []
+        for (start, stop), batch in zip(batches, planned):
+            if isinstance(batch, OptimizerTimeoutError):
+                unbuilt.extend(range(start, stop))
+                continue
+            if isinstance(batch, BaseException):
+                raise batch
+            for index, problem, bound, grid_key, seed in batch:
+                problems[index], bounds[index], grid_keys[index] = problem, bound, grid_key
+                if seed is not None:
+                    greedy[index] = seed
+        if not problems:
+            return [], unbuilt
+
+        lowest = sorted((damage_objective(problems[index], seed[0]) for index, seed in greedy.items()), reverse=True)
+        threshold = lowest[limit - 1] if len(lowest) >= limit else float('-inf')
+
+        # Problems that can still make it into the ranking, grouped by the talisman grid they can share
+        groups = {}
+        for index in sorted(problems, key=lambda index: bounds[index], reverse=True):
+            if bounds[index] >= threshold:
+                items, grid_caps = grid_keys[index]
+                indices, caps = groups.setdefault(items, ([], []))
+                indices.append(index)
+                caps.append(grid_caps)
+
+        chunks = []
+        for indices, caps in groups.values():
+            solver = functools.partial(solve_damage_problems, grid_caps=tuple(map(max, zip(*caps))))
+            for start in range(0, len(indices), chunk_size):
+                chunk = indices[start:start + chunk_size]
+                chunks.append((solver, [problems[index] for index in chunk], chunk))
+        results = await asyncio.gather(*(self.run(chunk_problems, solver=solver, timeout=timeout, owner=owner,
+                                                  cost=len(chunk_problems))
+                                         for solver, chunk_problems, _ in chunks), return_exceptions=True)
+
+        ranking = []
+        timed_out = []
+        for (_, _, chunk), chunk_results in zip(chunks, results):
+            if isinstance(chunk_results, OptimizerTimeoutError):
+                # The other chunks are still worth ranking
+                timed_out.extend(chunk)
+                continue
+            if isinstance(chunk_results, BaseException):
+                raise chunk_results
+            ranking.extend((index, result) for index, result in zip(chunk, chunk_results) if result[1])
+
+        unseeded = [index for index in timed_out if index not in greedy]
+        if unseeded:
+            try:
+                fallbacks = await self.run([problems[index] for index in unseeded], solver=greedy_damage_solutions,
+                                           timeout=timeout, owner=owner, cost=len(unseeded))
+                greedy.update(zip(unseeded, fallbacks))
+            except OptimizerTimeoutError:
+                pass
+        ranking.extend((index, greedy[index]) for index in timed_out
+                       if greedy.get(index) is not None and greedy[index][1])
+
+        ranking.sort(key=lambda ranked: damage_objective(problems[ranked[0]], ranked[1][0]), reverse=True)
+        unsolved = sorted(set(timed_out) | set(unbuilt) |
+                          {index for index, result in ranking if not result[0]['is optimized']})
+        return ranking[:limit], unsolved
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self):
+        return {
+            'workers': self.max_workers,
+            'queued': len(self),
+            'running': self.running,
+            'completed': self.completed,
+            'timed out': self.timed_out,
+            'cancelled': self.cancelled,
+        }
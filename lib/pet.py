@@ -1,8 +1,9 @@
+import copy
 import re
 
 from . import PetStats
-from utils import level_from_xp_table
-from constants import PET_RARITIES, PET_XP, PETS
+from utils import PET_LEVELS
+from constants import PET_RARITIES, PETS
 
 
 class Pet:
@@ -15,8 +16,8 @@ class Pet:
 
         self.xp = raw_data.get('exp', 0)
         self.rarity = raw_data.get('tier', 'COMMON').lower()
-        self.xp_remaining = PET_XP[self.rarity][-1] - self.xp
-        self.level = level_from_xp_table(self.xp, PET_XP[self.rarity])
+        self.xp_remaining = PET_LEVELS[self.rarity].max_xp - self.xp
+        self.level = PET_LEVELS[self.rarity].level(self.xp)
 
         self.internal_name = raw_data.get('type', 'PET')
         self.name = PETS[self.internal_name]['name']
@@ -55,6 +56,15 @@ class Pet:
             elif self.item_name == 'Lucky Clover':
                 self.stats.add_stat('magic find', 7)
 
+    def copy(self):
+        """
+        Copy whose stats can be changed without changing this pet's.
+        """
+        pet = copy.copy(self)
+        pet.stats = self.stats.copy()
+        pet.stats.pet = pet
+        return pet
+
     def __str__(self):
         return self.name
 
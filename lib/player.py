@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from . import Profile, Guild
-from . import NeverPlayedSkyblockError, BadProfileError, BadNameError
+from . import NeverPlayedSkyblockError, BadProfileError, BadNameError, APIError
 
 
 class Player:
@@ -13,6 +13,7 @@ class Player:
         self.uuid = uuid
         self.player_data = player_data
         self.online = player_data.get('lastLogout', 0) < player_data.get('lastLogin', 0)
+        self.last_logout = player_data.get('lastLogout', None)
         self.achievements = player_data.get('achievements', {})
         self.discord_tag = player_data.get('socialMedia', {}).get('links', {}).get('DISCORD', None)
         if self.uname is None:
@@ -30,7 +31,7 @@ class Player:
         """
         Get player's skyblock profiles and set the selected profile, if not it will set the last save profile.
         """
-        profiles = await self.hypixel_api_client.get_skyblock_profiles(self.uuid, **kwargs)
+        profiles = await self._get_raw_skyblock_profiles(**kwargs)
 
         if not profiles:
             raise NeverPlayedSkyblockError(self.uname)
@@ -55,6 +56,36 @@ class Player:
         elif not selected_profile:
             self.profile = latest_profile
 
+    async def _get_raw_skyblock_profiles(self, **kwargs):
+        """
+        Get player's raw skyblock profiles from their snapshots while they are fresh, else from the api.
+        Snapshots are also the fallback when the api fails.
+        """
+        snapshots = self.hypixel_api_client.profile_snapshots
+        if snapshots is None:
+            return await self.hypixel_api_client.get_skyblock_profiles(self.uuid, **kwargs)
+
+        # Without a known logout time there is no way to tell if a snapshot is fresh
+        if not self.online and self.last_logout is not None:
+            profiles = await snapshots.load(self.uuid, last_logout=self.last_logout)
+            if profiles is not None:
+                snapshots.hits += 1
+                return profiles
+        snapshots.misses += 1
+
+        try:
+            profiles = await self.hypixel_api_client.get_skyblock_profiles(self.uuid, **kwargs)
+        except APIError:
+            profiles = await snapshots.load(self.uuid)
+            if profiles is None:
+                raise
+            snapshots.fallbacks += 1
+            return profiles
+
+        if profiles:
+            await snapshots.save(self.uuid, profiles)
+        return profiles
+
     async def get_player_guild(self):
         """
         Get player's guild data
@@ -1,11 +1,38 @@
+import copy
 from datetime import datetime
+from functools import cached_property
 
 from . import ProfileStats, Pet, decode_inventory_data
 from . import HypixelLanguageError
-from utils import safe_list_get, level_from_xp_table
+from utils import safe_list_get, DUNGEON_SKILL_LEVELS, MINION_SLOT_LEVELS, SLAYER_LEVELS, skill_level_table
 from constants import *
 
 
+def _talisman_upgrades(tiered_talismans):
+    """
+    {internal name: every higher tier of its family} from the {talisman: higher tiers} edges of tiered_talismans,
+    following them through the family graph so every tier reaches all the ones above it.
+    """
+    upgrades = {}
+
+    def visit(name):
+        if name not in upgrades:
+            upgrades[name] = frozenset()  # families never loop, this only stops a bad entry from recursing forever
+            reached = set()
+            for higher in tiered_talismans.get(name, ()):
+                reached.add(higher)
+                reached |= visit(higher)
+            upgrades[name] = frozenset(reached)
+        return upgrades[name]
+
+    for name in tiered_talismans:
+        visit(name)
+    return {name: higher for name, higher in upgrades.items() if higher}
+
+
+TALISMAN_UPGRADES = _talisman_upgrades(TIERED_TALISMANS)
+
+
 class Profile:
     def __init__(self, *, player, raw_profile_data, load_all):
         self.player = player
@@ -30,7 +57,6 @@ class Profile:
             self.minions = self._parse_collection(self.profile_data.get('crafted_generators', []))
 
         self.enabled_api = {'skills': False, 'collection': False, 'inventory': False, 'banking': False}
-        self.current_armor = {'helmet': None, 'chestplate': None, 'leggings': None, 'boots': None}
         self.armor = {'helmet': None, 'chestplate': None, 'leggings': None, 'boots': None}
         self.weapon = None
         self.pet = None
@@ -41,8 +67,8 @@ class Profile:
             self.dungeon_stats[dungeon] = self.profile_data.get('dungeons', {}).get('dungeon_types', {}).get(dungeon,
                                                                                                              {})
             if 'experience' in self.dungeon_stats[dungeon]:
-                self.dungeon_stats[dungeon]['level'] = level_from_xp_table(self.dungeon_stats[dungeon]['experience'],
-                                                                           DUNGEON_SKILL_LEVEL_REQUIREMENT)
+                self.dungeon_stats[dungeon]['level'] = DUNGEON_SKILL_LEVELS.level(
+                    self.dungeon_stats[dungeon]['experience'])
 
         # Load dungeon classes stats
         self.selected_dungeon_class = self.profile_data.get('dungeons', {}).get('selected_dungeon_class', None)
@@ -52,7 +78,7 @@ class Profile:
             class_xp = self.profile_data.get('dungeons', {}).get('player_classes', {}).get(dungeon_class, {}).get(
                 'experience', 0)
             self.dungeon_classes_xp[dungeon_class] = class_xp
-            self.dungeon_classes[dungeon_class] = level_from_xp_table(class_xp, DUNGEON_SKILL_LEVEL_REQUIREMENT)
+            self.dungeon_classes[dungeon_class] = DUNGEON_SKILL_LEVELS.level(class_xp)
 
         # Load profile's bank data if banking api is enabled
         self.bank_balance = 0.00
@@ -70,10 +96,7 @@ class Profile:
                 self.enabled_api['skills'] = True
                 xp = int(self.profile_data.get(f'experience_skill_{skill}', 0))
                 self.skills_xp[skill] = xp
-                self.skills[skill] = level_from_xp_table(
-                    xp,
-                    RUNECRAFTING_LEVEL_REQUIREMENT if skill == 'runecrafting' else SKILL_LEVEL_REQUIREMENT
-                )
+                self.skills[skill] = skill_level_table(skill).level(xp)
         self.skill_average = sum(
             skill_level for skill, skill_level in self.skills.items() if skill not in COSMETIC_SKILL_NAMES) / (
                                      len(SKILL_NAMES) - len(COSMETIC_SKILL_NAMES))
@@ -84,7 +107,7 @@ class Profile:
         for slayer_name in SLAYER_NAMES:
             xp = self.profile_data.get('slayer_bosses', {}).get(slayer_name, {}).get('xp', 0)
             self.slayers_xp[slayer_name] = xp
-            self.slayers[slayer_name] = level_from_xp_table(xp, SLAYER_LEVEL_REQUIREMENT[slayer_name])
+            self.slayers[slayer_name] = SLAYER_LEVELS[slayer_name].level(xp)
         self.total_slayer_xp = sum(self.slayers_xp.values())
 
         # Loads profile's kills and deaths
@@ -109,55 +132,99 @@ class Profile:
         self.unlocked_collections = self._parse_collection(self.profile_data.get('unlocked_coll_tiers', []))
 
         self.unique_minions = sum(self.minions.values())
-        self.minion_slots = level_from_xp_table(self.unique_minions, MINION_SLOT_REQUIREMENT)
+        self.minion_slots = MINION_SLOT_LEVELS.level(self.unique_minions)
 
-        # Load profile stats
-        self.stats = ProfileStats(BASE_PLAYER_STATS.copy(), profile=self)
+        self.fairy_souls = self.profile_data.get('fairy_souls_collected', 0)
 
-        self.stats.combat_bonus = self.skills.get('combat', 0) * 4
+        # Inventories, stats, talismans and pets are only loaded when they are accessed
+        if any(key in self.profile_data for key in ('inv_contents', 'ender_chest_contents', 'talisman_bag')):
+            self.enabled_api['inventory'] = True
 
-        self.fairy_souls = self.profile_data.get('fairy_souls_collected', 0)
-        self.stats.add_stat('health', FAIRY_SOUL_HP_BONUS[self.fairy_souls // 5])
-        self.stats.add_stat('defense', self.fairy_souls // 5 + self.fairy_souls // 25)
-        self.stats.add_stat('strength', self.fairy_souls // 5 + self.fairy_souls // 25)
-        self.stats.add_stat('speed', self.fairy_souls // 50)
+        self.loaded_all = load_all
+
+    @cached_property
+    def stats(self):
+        stats = ProfileStats(BASE_PLAYER_STATS.copy(), profile=self)
+
+        stats.combat_bonus = self.skills.get('combat', 0) * 4
+
+        stats.add_stat('health', FAIRY_SOUL_HP_BONUS[self.fairy_souls // 5])
+        stats.add_stat('defense', self.fairy_souls // 5 + self.fairy_souls // 25)
+        stats.add_stat('strength', self.fairy_souls // 5 + self.fairy_souls // 25)
+        stats.add_stat('speed', self.fairy_souls // 50)
 
         for slayer_name, slayer_level in self.slayers.items():
-            self.stats += ProfileStats(SLAYER_REWARDS[slayer_name][slayer_level])
+            stats += ProfileStats(SLAYER_REWARDS[slayer_name][slayer_level])
 
         for skill_name, skill_level in self.skills.items():
-            self.stats += ProfileStats(SKILL_REWARDS[skill_name][skill_level])
+            stats += ProfileStats(SKILL_REWARDS[skill_name][skill_level])
 
         # TODO: FIX ME
-        self.stats.dungeon_bonus = ACCUMULATED_CATACOMB_LEVEL_REWARDS['dungeon bonus'][
+        stats.dungeon_bonus = ACCUMULATED_CATACOMB_LEVEL_REWARDS['dungeon bonus'][
             self.dungeon_stats[DUNGEONS[0]].get('level', 0)] / 100
 
-        # Load profile's current equipped armor
-        for armor in self._parse_inventory(self.profile_data, ['inv_armor', 'data']):
+        # Renowned reforge bonus of the profile's items, items in backpacks and the cake bag count too
+        items = self._armor_items + self.inventory + self.echest + self.talisman_bag + self._wardrobe_items
+        for item in items:
+            if item:
+                if item.reforge == 'renowned':
+                    stats.multiplier += 0.01
+                items.extend(item.contents or [])
+
+        # Load talisman stats
+        if self.loaded_all:
+            stats.childrens.extend([talisman.stats for talisman in self.talismans if talisman.active])
+
+        return stats
+
+    @cached_property
+    def _armor_items(self):
+        return self._parse_inventory(self.profile_data, ['inv_armor', 'data'])
+
+    @cached_property
+    def current_armor(self):
+        """
+        Profile's current equipped armor.
+        """
+        current_armor = {'helmet': None, 'chestplate': None, 'leggings': None, 'boots': None}
+        for armor in self._armor_items:
             # check for special type
             if armor.type == 'hatccessory':
-                self.current_armor['helmet'] = armor
+                current_armor['helmet'] = armor
             else:
-                self.current_armor[armor.type] = armor
-
-        # Load profile's inventories
-        self.inventory = self._parse_inventory(self.profile_data, ['inv_contents', 'data'])
-        self.echest = self._parse_inventory(self.profile_data, ['ender_chest_contents', 'data'])
-        self.talisman_bag = self._parse_inventory(self.profile_data, ['talisman_bag', 'data'])
-        # Comment out unnecessary inventories for now
-        # self.candy_bag = self._parse_inventory(self.profile_raw_data, ['candy_inventory_contents', 'data'])
-        # self.potion_bag = self._parse_inventory(self.profile_raw_data, ['potion_bag', 'data'])
-        # self.fish_bag = self._parse_inventory(self.profile_raw_data, ['fishing_bag', 'data'])
-        # self.quiver = self._parse_inventory(self.profile_raw_data, ['quiver', 'data'])
-        if self.inventory or self.echest or self.talisman_bag:
-            self.enabled_api['inventory'] = True
+                current_armor[armor.type] = armor
+        return current_armor
+
+    @cached_property
+    def inventory(self):
+        return self._parse_inventory(self.profile_data, ['inv_contents', 'data'])
+
+    @cached_property
+    def echest(self):
+        return self._parse_inventory(self.profile_data, ['ender_chest_contents', 'data'])
+
+    @cached_property
+    def talisman_bag(self):
+        return self._parse_inventory(self.profile_data, ['talisman_bag', 'data'])
 
-        # Load profile's weapon from inventory and ender chest
-        self.weapons = [item for item in self.inventory + self.echest if item.type in ('sword', 'bow')]
+    # Comment out unnecessary inventories for now
+    # candy_inventory_contents, potion_bag, fishing_bag, quiver
 
-        # Load profile's wardrobe
-        self.wardrobe = []
-        wardrobe = self._parse_inventory(self.profile_data, ['wardrobe_contents', 'data'], index_empty=True)
+    @cached_property
+    def weapons(self):
+        """
+        Profile's weapons from inventory and ender chest.
+        """
+        return [item for item in self.inventory + self.echest if item.type in ('sword', 'bow')]
+
+    @cached_property
+    def _wardrobe_items(self):
+        return self._parse_inventory(self.profile_data, ['wardrobe_contents', 'data'], index_empty=True)
+
+    @cached_property
+    def wardrobe(self):
+        wardrobe = self._wardrobe_items
+        armor_sets = []
         for wardrobe_page in range(0, 2 * 36, 36):  # 2 for current max 2 pages of wardrobe
             for i in range(wardrobe_page, wardrobe_page + 9):
                 armor_set = {
@@ -168,63 +235,61 @@ class Profile:
                 }
                 if all(item is None for item in armor_set.values()):
                     continue
-                self.wardrobe.append(armor_set)
+                armor_sets.append(armor_set)
+        return armor_sets
 
-        # Check if player has dungeon armor/wep items
-        self.has_dungeon_items = False
-        for item in self.inventory + self.echest + wardrobe:
-            if not item:
-                continue
-            if item.dungeon:
-                self.has_dungeon_items = True
-                break
+    @cached_property
+    def has_dungeon_items(self):
+        """
+        Check if player has dungeon armor/wep items.
+        """
+        return any(item and item.dungeon for item in self.inventory + self.echest + self._wardrobe_items)
 
-        self.loaded_all = load_all
-        if load_all:
-            # Load profile's talismans from inventory + talisman bag and talisman counts
-            self.talismans = [talisman for talisman in self.inventory + self.talisman_bag if
-                              talisman.type in ('accessory', 'hatccessory')]
-            self.talisman_counts = {'common': 0, 'uncommon': 0, 'rare': 0, 'epic': 0, 'legendary': 0, 'mythic': 0}
-            talismans_dup = []
-
-            for talisman in self.talismans:
-                talisman.active = True
-                # Check for talisman families
-                if talisman.internal_name in TIERED_TALISMANS:
-                    for other_fam_member in TIERED_TALISMANS[talisman.internal_name]:
-                        if other_fam_member in self.talismans:
-                            talisman.active = False
-                            break
-
-                if not talisman.active:
-                    continue  # if talisman active already set to false due to families
-                # Check for duplicate talismans
-                if self.talismans.count(talisman) > 1:
-                    talisman.active = False
-                    if talisman not in talismans_dup:
-                        talismans_dup.append(talisman)  # append the reference to a list to set active true later
-
-            # Set one of the talisman dup to active true
-            for talisman in talismans_dup:
-                talisman.active = True
-
-            # Load talisman stats
-            self.stats.childrens.extend([talisman.stats for talisman in self.talismans if talisman.active])
-
-            # Load talisman counts
-            for taliman in self.talismans:
-                if taliman.active:
-                    # Check for hypixel language because it's most reliable here
-                    try:
-                        self.talisman_counts[taliman.rarity] += 1
-                    except KeyError:
-                        raise HypixelLanguageError from None
-
-            # Loads profile's pets
-            self.pets = []
-            if 'pets' in self.profile_data:
-                for pet_data in self.profile_data['pets']:
-                    self.pets.append(Pet(pet_data, profile=self))
+    @cached_property
+    def _talismans_resolved(self):
+        """
+        (talismans, {rarity: active talismans}) in one pass over them with the owned internal names in a set.
+        """
+        talismans = [talisman for talisman in self.inventory + self.talisman_bag if
+                     talisman.type in ('accessory', 'hatccessory')]
+        owned = {talisman.internal_name for talisman in talismans}
+
+        counted = set()
+        talisman_counts = {'common': 0, 'uncommon': 0, 'rare': 0, 'epic': 0, 'legendary': 0, 'mythic': 0}
+        for talisman in talismans:
+            # Lower tiers of an owned family member and every duplicate after the first are inactive
+            upgraded = not TALISMAN_UPGRADES.get(talisman.internal_name, frozenset()).isdisjoint(owned)
+            talisman.active = not upgraded and talisman.internal_name not in counted
+            if talisman.active:
+                counted.add(talisman.internal_name)
+                talisman_counts[talisman.rarity] = talisman_counts.get(talisman.rarity, 0) + 1
+        return talismans, talisman_counts
+
+    @cached_property
+    def talismans(self):
+        """
+        Profile's talismans from inventory + talisman bag, inactive ones are duplicates or lower tiers of a family.
+        """
+        return self._talismans_resolved[0]
+
+    @cached_property
+    def talisman_counts(self):
+        talisman_counts = self._talismans_resolved[1]
+        # Check for hypixel language because it's most reliable here
+        if len(talisman_counts) > len(RARITIES):
+            raise HypixelLanguageError
+        return talisman_counts
+
+    @cached_property
+    def pets(self):
+        return [Pet(pet_data, profile=self) for pet_data in self.profile_data.get('pets', [])]
+
+    @cached_property
+    def active_pet(self):
+        for pet in self.pets:
+            if pet.active:
+                return pet
+        return None
 
     def __str__(self):
         return self.name
@@ -236,7 +301,7 @@ class Profile:
         if weapon and self.loaded_all:
             self.weapon = weapon
 
-            self.stats.childrens.append(self.weapon.stats)
+            self.stats.add_children([self.weapon.stats])
 
     def set_armor(self, armor, *, dungeon=False):
         """
@@ -245,7 +310,7 @@ class Profile:
         if armor and self.loaded_all:
             self.armor = armor
 
-            self.stats.childrens.extend([piece.stats for piece in self.armor.values() if piece is not None])
+            self.stats.add_children([piece.stats for piece in self.armor.values() if piece is not None])
 
             # Armor passive/set bonus
             if self.armor == {'helmet': 'SUPERIOR_DRAGON_HELMET', 'chestplate': 'SUPERIOR_DRAGON_CHESTPLATE',
@@ -282,6 +347,9 @@ class Profile:
                 self.weapon.stats.add_modifier('damage',
                                                lambda stat: stat + self.stats.get_stat('health', dungeon=dungeon) // 50)
 
+            # Set bonuses change the children and the multipliers without going through add_stat
+            self.stats.invalidate()
+
     def set_pet(self, pet, *, dungeon=False):
         """
         Set profile pet.
@@ -289,11 +357,47 @@ class Profile:
         if pet and self.loaded_all:
             self.pet = pet
 
-            self.stats.childrens.append(self.pet.stats)
+            self.stats.add_children([self.pet.stats])
 
             pet_ability = PETS[self.pet.internal_name]['ability']
             if callable(pet_ability):
                 pet_ability(self, dungeon=dungeon)
+            self.stats.invalidate()
+
+    def set_potions(self, potions):
+        """
+        Add the stats of DAMAGE_POTIONS potions, potions is [(name, level)].
+        """
+        for name, level in potions:
+            for stat, amounts in DAMAGE_POTIONS[name]['stats'].items():
+                if stat == 'archery bonus':
+                    self.stats.archery_bonus += amounts[level]
+                else:
+                    self.stats.add_stat(stat, amounts[level])
+
+    def set_support_items(self, support_items):
+        """
+        Add the stats of SUPPORT_ITEMS support items, support_items is their names.
+        """
+        for name in support_items:
+            for stat, amount in SUPPORT_ITEMS[name]['stats'].items():
+                self.stats.add_stat(stat, amount)
+
+    def loadout(self, *, weapon, armor, pet, dungeon=False, potions=(), support_items=()):
+        """
+        View of the profile with that weapon, armor, pet, potions and support items, this profile and its items are
+        left as they are. Its stats are a LoadoutStats layer on this profile's, talismans, skills and slayer rewards
+        are shared and never copied. The equipment is copied, set bonuses and pet abilities change its stats.
+        """
+        profile = copy.copy(self)
+        profile.stats = self.stats.layer(profile)
+        profile.set_weapon(weapon.copy() if weapon else None)
+        profile.set_armor({piece_type: piece.copy() if piece else None for piece_type, piece in armor.items()}
+                          if armor else None, dungeon=dungeon)
+        profile.set_pet(pet.copy() if pet else None, dungeon=dungeon)
+        profile.set_potions(potions)
+        profile.set_support_items(support_items)
+        return profile
 
     def set_pet_armor_automatically(self):
         if not self.loaded_all:
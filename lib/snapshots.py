@@ -0,0 +1,120 @@
+import json
+import time
+import zlib
+
+from bson.binary import Binary
+from pymongo import ASCENDING, DESCENDING, UpdateOne, DeleteMany
+from pymongo.errors import PyMongoError
+
+
+class ProfileSnapshotStore:
+    """
+    Compacted skyblock profiles stored in mongo, one document per (uuid, profile_id, last_save).
+    A player's profiles only change when they play, so while they stay logged out the last fetched profiles
+    can be served with a single db read instead of a skyblock/profiles request. The player request is still made,
+    its online status and last logout are what tells whether a snapshot is fresh.
+    """
+
+    def __init__(self, collection, *, max_age=86400, save_grace=60):
+        self.collection = collection
+        # Seconds a snapshot is trusted at most, coop members can still change shared data while the player is away
+        self.max_age = max_age
+        # Seconds hypixel can take to save a profile after the player logged out
+        self.save_grace = save_grace
+
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    async def create_indexes(self):
+        await self.collection.create_index(
+            [('uuid', ASCENDING), ('profile_id', ASCENDING), ('last_save', DESCENDING)], unique=True)
+
+    @staticmethod
+    def compact(uuid, raw_profile_data):
+        """
+        Only keep what Profile reads of the player in a raw profile and compress it.
+        Profile reads all of the player's member data but only the crafted minions of their coop members, their
+        other data is left out.
+        """
+        members = {member: {'crafted_generators': member_data['crafted_generators']}
+                   if 'crafted_generators' in member_data else {}
+                   for member, member_data in raw_profile_data['members'].items()}
+        members[uuid] = raw_profile_data['members'][uuid]
+        compacted = {
+            'profile_id': raw_profile_data['profile_id'],
+            'cute_name': raw_profile_data.get('cute_name', ''),
+            'members': members,
+        }
+        if 'banking' in raw_profile_data:
+            compacted['banking'] = raw_profile_data['banking']
+        return Binary(zlib.compress(json.dumps(compacted, separators=(',', ':')).encode()))
+
+    @staticmethod
+    def expand(data):
+        return json.loads(zlib.decompress(data))
+
+    def is_fresh(self, snapshot, *, last_logout):
+        """
+        Snapshot is fresh when it was fetched after the player's last logout was saved and isn't too old.
+        """
+        now = time.time()
+        fetched_at = snapshot['fetched_at']
+        return now - fetched_at <= self.max_age and last_logout / 1000 + self.save_grace <= fetched_at
+
+    async def load(self, uuid, *, last_logout=None):
+        """
+        Get the raw profiles of a player from their latest snapshots.
+        With `last_logout` only fresh snapshots are returned, without it any snapshot is returned.
+        Return None when there isn't any usable snapshot.
+        """
+        try:
+            snapshots = await self.collection.find({'uuid': uuid}).to_list(length=None)
+        except PyMongoError:
+            return None
+
+        latest = {}
+        for snapshot in snapshots:
+            current = latest.get(snapshot['profile_id'])
+            if current is None or snapshot['last_save'] > current['last_save']:
+                latest[snapshot['profile_id']] = snapshot
+
+        if not latest:
+            return None
+        if last_logout is not None and not all(self.is_fresh(snapshot, last_logout=last_logout)
+                                               for snapshot in latest.values()):
+            return None
+        return [self.expand(snapshot['data']) for snapshot in latest.values()]
+
+    async def save(self, uuid, raw_profiles):
+        """
+        Store the latest raw profiles of a player and drop their older snapshots.
+        """
+        fetched_at = time.time()
+        profile_ids = []
+        requests = []
+        for raw_profile_data in raw_profiles:
+            member = raw_profile_data.get('members', {}).get(uuid)
+            if member is None:
+                continue
+            profile_ids.append(raw_profile_data['profile_id'])
+            key = {'uuid': uuid, 'profile_id': raw_profile_data['profile_id'], 'last_save': member.get('last_save', 0)}
+            requests.append(UpdateOne(key, {'$set': {
+                'fetched_at': fetched_at,
+                'data': self.compact(uuid, raw_profile_data),
+            }}, upsert=True))
+            requests.append(DeleteMany({**key, 'last_save': {'$lt': key['last_save']}}))
+        # Profiles the player left or deleted
+        requests.append(DeleteMany({'uuid': uuid, 'profile_id': {'$nin': profile_ids}}))
+
+        try:
+            await self.collection.bulk_write(requests, ordered=False)
+        except PyMongoError:
+            pass
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'fallbacks': self.fallbacks,
+        }
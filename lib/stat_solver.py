@@ -0,0 +1,350 @@
+import time
+
+import numpy
+
+from .damage_solver import _LocalSearch, _PENALTY, _SearchTimeout, _reforge_options, format_reforge_counts
+
+_EPSILON = 1e-9
+
+
+def _pareto_2d(points, *, key, value):
+    """
+    _pareto for values of at most 2 stats, one sweep over the points sorted best first instead of comparing pairs.
+    """
+    groups = {}
+    for point in points:
+        groups.setdefault(key(point), []).append(point)
+
+    kept = []
+    for group in groups.values():
+        group.sort(key=value, reverse=True)
+        best = None
+        for point in group:
+            point_value = value(point)
+            # Points with a higher first value came before, a point is only kept if its second value beats them all
+            if best is None or point_value[-1] > best:
+                kept.append(point)
+                best = point_value[-1]
+    return kept
+
+
+def _pareto_3d(points, *, key, value):
+    """
+    _pareto for values of 3 stats. Points sorted best first can only be beaten by points before them, the best
+    third value among the kept points with at least its second value is read from a max fenwick tree.
+    """
+    groups = {}
+    for point in points:
+        groups.setdefault(key(point), []).append((value(point), point))
+
+    kept = []
+    for group in groups.values():
+        group.sort(key=lambda valued: valued[0], reverse=True)
+        # 1 based rank of every second value, the highest first
+        ranks = {second: rank for rank, second in enumerate(sorted({v[1] for v, _ in group}, reverse=True), 1)}
+        tree = [float('-inf')] * (len(ranks) + 1)
+        for point_value, point in group:
+            rank = ranks[point_value[1]]
+            index, best = rank, float('-inf')
+            while index:
+                best = max(best, tree[index])
+                index -= index & -index
+            if best >= point_value[2]:
+                continue
+            kept.append(point)
+            index = rank
+            while index < len(tree):
+                tree[index] = max(tree[index], point_value[2])
+                index += index & -index
+    return kept
+
+
+def _pareto_nd(points, *, key, value):
+    """
+    _pareto for values of any number of stats. Points sorted best first can only be beaten by points before them,
+    each point is compared to all of the kept ones at once.
+    """
+    groups = {}
+    for point in points:
+        groups.setdefault(key(point), []).append((value(point), point))
+
+    kept = []
+    for group in groups.values():
+        group.sort(key=lambda valued: valued[0], reverse=True)
+        front = numpy.empty((len(group), len(group[0][0])))
+        size = 0
+        for point_value, point in group:
+            if size and (front[:size] >= point_value).all(axis=1).any():
+                continue
+            front[size] = point_value
+            size += 1
+            kept.append(point)
+    return kept
+
+
+class _StatModel:
+    """
+    Reforge options and reported stats of the stat optimizer for a StatOptimizerProblem.
+    Stat vectors hold the reforge totals of the problem's stats in order, and the number of renowned pieces last.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.stat_names = problem.stat_names
+        self.variable_multiplier = not problem.only_blacksmith_reforges
+        self.feasible = True
+
+    def _item_groups(self):
+        """
+        (equipment type, rarity, amount, options) of every group of items sharing the same reforges,
+        options are (stat vector, reforge) of every reforge they can get.
+        """
+        problem = self.problem
+        groups = []
+        for equipment_type, counts in problem.counts.items():
+            if equipment_type == 'talisman':
+                coefficients = {stat: 1 for stat in self.stat_names}
+            else:
+                coefficients = {stat: sum(problem.children_coefficients[equipment_type][stat])
+                                for stat in self.stat_names}
+            for rarity, count in counts.items():
+                if count <= 0:
+                    continue
+                options = [(tuple(coefficients[stat] * value for stat, value in zip(self.stat_names, vector))
+                            + (int(reforge == 'renowned' and equipment_type in problem.armor_types
+                                   and self.variable_multiplier),), reforge)
+                           for reforge, vector in _reforge_options(problem, equipment_type, rarity, self.stat_names)]
+                groups.append((equipment_type, rarity, count, options))
+        return groups
+
+    def stats_for(self, vector):
+        """
+        Stats of a reforge stat vector, capped where the goal has a cap, with the goal objective.
+        Return them and whether they keep the minimums, of the capped stats, and maximums, of the stats before caps.
+        """
+        problem = self.problem
+        multiplier = problem.multiplier + 0.01 * vector[-1]
+        stats = {stat: multiplier * (problem.base_stats[stat] + value) for stat, value in zip(self.stat_names, vector)}
+        feasible = all(stats[stat] <= maximum + _EPSILON for stat, maximum in problem.maximums.items())
+        for stat, cap in problem.caps.items():
+            stats[stat] = min(stats[stat], cap)
+        feasible = feasible and all(stats[stat] >= minimum - _EPSILON for stat, minimum in problem.minimums.items())
+        stats[problem.goal.name] = problem.goal.objective(stats)
+        return stats, feasible
+
+
+class _StatSearch(_StatModel):
+    """
+    Exact search for the reforges maximizing the objective of a StatOptimizerProblem's goal.
+
+    Goal objectives never decrease when a stat they read goes up, more of a stat with a minimum never hurts and
+    less of a stat with only a maximum never hurts, so only reforges on the pareto front of those stats can be optimal.
+    Items are added one at a time and every partial combination that another one with the same renowned pieces and
+    totals of the other stats with a maximum beats is dropped.
+    Totals are compared with what the items left can still add in mind: combinations that can't keep a minimum or
+    maximum anymore are dropped, and a stat past the point where its minimum, cap or maximum is sure not to matter
+    counts as that point, so the combinations past it only compete on the other stats.
+    Past `deadline`, a time.monotonic() value, solving raises _SearchTimeout.
+    """
+    # How far partial totals are kept from the bounds they are compared to, for rounding errors
+    margin = 1e-6
+
+    def __init__(self, problem, *, deadline=None):
+        super().__init__(problem)
+        self.deadline = deadline
+        goal_stats = set(problem.goal.stats)
+        # Stats with a maximum that more of can also help can't be compared, combinations only compete with the same
+        # totals. Stats with only a maximum are compared by less is better.
+        self.key_indices = [index for index, stat in enumerate(self.stat_names) if stat in problem.maximums
+                            and (stat in goal_stats or stat in problem.minimums)]
+        self.value_indices = [index for index in range(len(self.stat_names)) if index not in self.key_indices]
+        self.signs = [-1 if stat in problem.maximums else 1 for stat in self.stat_names]
+        self.pareto = {1: _pareto_2d, 2: _pareto_2d, 3: _pareto_3d}.get(len(self.value_indices), _pareto_nd)
+        # Values are compared as they are when no stat of them has a minimum, maximum or cap
+        self.clipped = any(self.stat_names[index] in bounds for index in self.value_indices
+                           for bounds in (problem.minimums, problem.maximums, problem.caps))
+        # Totals are clipped to these before comparing them, they move as items are added
+        self.floors = [-numpy.inf] * len(self.stat_names)
+        self.ceilings = [numpy.inf] * len(self.stat_names)
+
+    def _slots(self):
+        """
+        One slot per item with every reforge it can get as (stat vector, reforge), the renowned flag last in vectors.
+        Reforges another one of the same slot beats are left out.
+        """
+        slots = []
+        for equipment_type, rarity, count, options in self._item_groups():
+            options = self.pareto(options, key=self._key, value=self._value)
+            slots.extend([(equipment_type, rarity, options)] * count)
+        return slots
+
+    def _key(self, point):
+        vector = point[0]
+        return (vector[-1],) + tuple(round(vector[index], 6) for index in self.key_indices)
+
+    def _value(self, point):
+        vector = point[0]
+        if not self.clipped:
+            return tuple(vector[index] for index in self.value_indices)
+        return tuple(self.signs[index] * min(max(vector[index], self.floors[index]), self.ceilings[index])
+                     for index in self.value_indices)
+
+    def _bounds(self, slots):
+        """
+        For every number of slots added, the (lowest, highest) totals the slots left can add, and the
+        (low, high) totals the combinations must stay in to be feasible.
+        """
+        problem = self.problem
+        lows = numpy.array([[min(vector[index] for vector, _ in options) for index in range(len(self.stat_names))]
+                            for _, _, options in slots]).reshape(len(slots), len(self.stat_names))
+        highs = numpy.array([[max(vector[index] for vector, _ in options) for index in range(len(self.stat_names))]
+                             for _, _, options in slots]).reshape(len(slots), len(self.stat_names))
+        # Sums of the slots after each slot, the last one adds nothing
+        left_low = numpy.cumsum(lows[::-1], axis=0)[::-1][1:].tolist() + [[0] * len(self.stat_names)]
+        left_high = numpy.cumsum(highs[::-1], axis=0)[::-1][1:].tolist() + [[0] * len(self.stat_names)]
+
+        renowned = sum(max(vector[-1] for vector, _ in options) for _, _, options in slots)
+        multipliers = (problem.multiplier, problem.multiplier + 0.01 * renowned)
+        return left_low, left_high, multipliers
+
+    def _limits(self, bound, stat, multipliers):
+        """
+        The totals of a stat for which the stat is `bound` with the lowest and the highest multiplier, lowest first.
+        """
+        totals = [bound / multiplier - self.problem.base_stats[stat] for multiplier in multipliers]
+        return min(totals), max(totals)
+
+    def _filter(self, front, left_low, left_high, multipliers, incumbent):
+        """
+        Drop the combinations that can't keep a minimum or maximum anymore, or beat the `incumbent` objective even
+        with the most the slots left can add, and move the floors and ceilings for the slots left.
+        """
+        if not front:
+            return front
+        problem = self.problem
+        margin = self.margin
+        vectors = numpy.array([vector for vector, _ in front])
+        keep = numpy.ones(len(front), dtype=bool)
+        for index, stat in enumerate(self.stat_names):
+            if stat in problem.minimums:
+                possible, sure = self._limits(problem.minimums[stat], stat, multipliers)
+                keep &= vectors[:, index] >= possible - left_high[index] - margin
+                if self.signs[index] > 0 and stat not in problem.goal.stats:
+                    self.ceilings[index] = sure - left_low[index] + margin
+            if stat in problem.maximums:
+                sure, possible = self._limits(problem.maximums[stat], stat, multipliers)
+                keep &= vectors[:, index] <= possible - left_low[index] + margin
+                if self.signs[index] < 0:
+                    self.floors[index] = sure - left_high[index] - margin
+            if stat in problem.caps and self.signs[index] > 0:
+                _, sure = self._limits(problem.caps[stat], stat, multipliers)
+                self.ceilings[index] = min(self.ceilings[index], sure - left_low[index] + margin)
+
+        if incumbent > -numpy.inf:
+            # Every stat at the most it can get, objectives never go down when a stat goes up
+            highest = {}
+            for index, stat in enumerate(self.stat_names):
+                totals = problem.base_stats[stat] + vectors[:, index] + left_high[index]
+                highest[stat] = numpy.maximum(multipliers[0] * totals, multipliers[1] * totals)
+                if stat in problem.caps:
+                    highest[stat] = numpy.minimum(highest[stat], problem.caps[stat])
+            keep &= problem.goal.objective(highest) >= incumbent - margin * max(1, abs(incumbent))
+        return [point for point, kept in zip(front, keep.tolist()) if kept]
+
+    def solve(self, incumbent=-numpy.inf):
+        """
+        Return the best stats and {(equipment type, rarity, reforge): count}, None stats when nothing is feasible
+        or nothing reaches the `incumbent` objective.
+        """
+        slots = self._slots()
+        left_low, left_high, multipliers = self._bounds(slots) if slots else ([], [], None)
+
+        # Choices are linked as (choice, previous choices) so extending a point doesn't copy them
+        front = [((0,) * (len(self.stat_names) + 1), None)]
+        for position, (equipment_type, rarity, options) in enumerate(slots):
+            if self.deadline is not None and time.monotonic() > self.deadline:
+                raise _SearchTimeout
+            front = [
+                (tuple(a + b for a, b in zip(vector, option_vector)), ((equipment_type, rarity, reforge), choices))
+                for vector, choices in front for option_vector, reforge in options
+            ]
+            front = self._filter(front, left_low[position], left_high[position], multipliers, incumbent)
+            front = self.pareto(front, key=self._key, value=self._value)
+
+        best, best_choices = None, None
+        for vector, choices in front:
+            stats, feasible = self.stats_for(vector)
+            if feasible and (best is None or stats[self.problem.goal.name] > best[self.problem.goal.name]):
+                best, best_choices = stats, choices
+
+        counts = {}
+        while best_choices is not None:
+            choice, best_choices = best_choices
+            counts[choice] = counts.get(choice, 0) + 1
+        return best, counts
+
+
+class _StatLocalSearch(_LocalSearch, _StatModel):
+    """
+    _LocalSearch for a StatOptimizerProblem, breaking a minimum or maximum is penalized.
+    """
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        self.groups = []
+        for equipment_type, rarity, count, options in self._item_groups():
+            self._add_group(equipment_type, rarity, count, [(reforge, vector) for vector, reforge in options])
+
+    def _scores(self, totals):
+        problem = self.problem
+        multiplier = problem.multiplier + 0.01 * totals[:, -1]
+        stats = {stat: multiplier * (problem.base_stats[stat] + totals[:, index])
+                 for index, stat in enumerate(self.stat_names)}
+        violation = numpy.zeros(len(totals))
+        for stat, maximum in problem.maximums.items():
+            violation += numpy.maximum(0, stats[stat] - maximum - _EPSILON)
+        for stat, cap in problem.caps.items():
+            stats[stat] = numpy.minimum(stats[stat], cap)
+        for stat, minimum in problem.minimums.items():
+            violation += numpy.maximum(0, minimum - stats[stat] - _EPSILON)
+        return problem.goal.objective(stats) - _PENALTY * violation, violation
+
+    def vector_for(self, counts):
+        """
+        Stat vector of a set of reforge counts.
+        """
+        vector = numpy.zeros(len(self.stat_names) + 1)
+        for equipment_type, rarity, _, names, vectors in self.groups:
+            for index, reforge in enumerate(names):
+                vector += counts.get((equipment_type, rarity, reforge), 0) * vectors[index]
+        return tuple(vector.tolist())
+
+
+def solve_stat_problem_exact(problem, *, deadline=None):
+    """
+    Solve a StatOptimizerProblem in process without an external solver.
+    Return the best stats and reforge counts like the scip backend.
+    The greedy solution is found first, combinations that can't beat it are dropped right away.
+    Like scip the search stops after the problem's time limit, or at `deadline`, a time.monotonic() value,
+    and the greedy solution is returned instead, flagged not optimized.
+    """
+    deadline = time.monotonic() + float(problem.time_limit) if deadline is None else deadline
+    local_search = _StatLocalSearch(problem)
+    greedy_counts = local_search.solve()
+    greedy = local_search.stats_for(local_search.vector_for(greedy_counts))[0] if greedy_counts is not None else None
+
+    search = _StatSearch(problem, deadline=deadline)
+    try:
+        result, counts = search.solve(greedy[problem.goal.name] if greedy is not None else -numpy.inf)
+        is_optimized = True
+    except _SearchTimeout:
+        result, counts = None, {}
+        is_optimized = False
+    if result is None and greedy is not None:
+        # Nothing beat the greedy solution, or no time was left to find out
+        result, counts = greedy, greedy_counts
+    if result is None:
+        # Nothing satisfies the goal's constraints, same as an infeasible scip model
+        result = search.stats_for((0,) * (len(search.stat_names) + 1))[0]
+    result['is optimized'] = is_optimized
+    return result, format_reforge_counts(problem, counts)
@@ -1,6 +1,70 @@
+import copy
+import functools
+
+import numpy
+
+from constants import STAT_NAMES
+
+# Column of every stat in stat vectors, items call attack speed bonus attack speed and profiles have stats items don't.
+# A stat first seen in a stats dict or add_stat gets the next column, vectors made before it are narrower.
+STAT_KEYS = list(dict.fromkeys(['attack speed' if stat == 'bonus attack speed' else stat for stat in STAT_NAMES]
+                               + ['speed cap', 'ability damage', 'dungeon bonus']))
+STAT_INDEX = {stat: index for index, stat in enumerate(STAT_KEYS)}
+
+
+def stat_index(key):
+    """
+    Column of a stat in stat vectors, adding one for stats that have none yet.
+    """
+    index = STAT_INDEX.get(key)
+    if index is None:
+        index = STAT_INDEX[key] = len(STAT_KEYS)
+        STAT_KEYS.append(key)
+    return index
+
+
+def stat_vector(stats_dict):
+    """
+    Return the (values, present) vectors of a {stat: value} dict, present is whether the dict has the stat.
+    """
+    indices = [stat_index(key) for key in stats_dict]
+    values = numpy.zeros(len(STAT_KEYS))
+    present = numpy.zeros(len(STAT_KEYS), dtype=bool)
+    values[indices] = list(stats_dict.values())
+    present[indices] = True
+    return values, present
+
+
+def _widen(vector, width):
+    """
+    Vector, or matrix of vectors, padded to width columns, stats it has no column for are 0.
+    """
+    if vector.shape[-1] >= width:
+        return vector
+    padding = numpy.zeros(vector.shape[:-1] + (width - vector.shape[-1],), dtype=vector.dtype)
+    return numpy.concatenate((vector, padding), axis=-1)
+
+
+@functools.lru_cache()
+def _static_mask(width):
+    """
+    Columns of the stats multipliers, modifiers and dungeon bonuses don't change.
+    """
+    return numpy.array([key in Stats._static_stats for key in STAT_KEYS[:width]])
+
+
+@functools.lru_cache()
+def _own_dungeon_bonus_mask(width):
+    """
+    Columns of the stats only the item's own dungeon bonus applies to.
+    """
+    return numpy.array([key in ('crit chance', 'attack speed') for key in STAT_KEYS[:width]])
+
+
 class Stats:
     """
     Base stats class.
+    Stats are kept as a float vector with a column per stat of STAT_KEYS and a mask of the stats it has.
     """
 
     # List of stat that isn't affected by multiplier/modifier/dungeon bonus
@@ -10,7 +74,7 @@ class Stats:
         if not stats_dict:
             # so it wont be empty
             stats_dict = {'speed cap': 0}
-        self._stats = stats_dict
+        self._values, self._present = stat_vector(stats_dict)
         self.multiplier = 1
         self.modifiers = {}
         self.dungeon_bonus = 0
@@ -18,6 +82,13 @@ class Stats:
         self.profile = None
         self.type = None
 
+    @property
+    def _stats(self):
+        """
+        {stat: value} of the stats it has.
+        """
+        return {STAT_KEYS[index]: self._values[index].item() for index in numpy.flatnonzero(self._present)}
+
     def __str__(self):
         return str(self._stats)
 
@@ -25,20 +96,58 @@ class Stats:
         return str(self._stats)
 
     def __len__(self):
-        return len(self._stats)
+        return int(self._present.sum())
+
+    def _value(self, key):
+        index = STAT_INDEX.get(key)
+        if index is None or index >= len(self._values):
+            return 0
+        return self._values[index].item()
+
+    def _vectors(self, width):
+        """
+        (values, present) widened to width columns.
+        """
+        if len(self._values) < width:
+            self._values = _widen(self._values, width)
+            self._present = _widen(self._present, width)
+        return self._values, self._present
+
+    def stat_vector(self):
+        """
+        (values, present) of get_stat of every stat it has.
+        """
+        return stat_vector(dict(self))
 
     def get_stat(self, key):
         raise NotImplementedError
 
+    def copy(self):
+        """
+        Copy whose stats and modifiers can be changed without changing this one.
+        """
+        stats = copy.copy(self)
+        stats._values = self._values.copy()
+        stats._present = self._present.copy()
+        stats.modifiers = {key: modifiers.copy() for key, modifiers in self.modifiers.items()}
+        return stats
+
+    def invalidate(self):
+        """
+        Forget stats computed from this one, called whenever its stats change.
+        """
+        pass
+
     def add_stat(self, key, value):
         """
         Default add stat is add to non dungeon base stat.
         """
         if isinstance(key, str) and isinstance(value, (int, float)):
-            if key in self._stats:
-                self._stats[key] += value
-            else:
-                self.set_stat(key, value)
+            index = stat_index(key)
+            values, present = self._vectors(len(STAT_KEYS))
+            values[index] += value
+            present[index] = True
+            self.invalidate()
         else:
             raise TypeError
 
@@ -47,7 +156,11 @@ class Stats:
         Default set stat is set stat to non dungeon base stat.
         """
         if isinstance(key, str) and isinstance(value, (int, float)):
-            self._stats[key] = value
+            index = stat_index(key)
+            values, present = self._vectors(len(STAT_KEYS))
+            values[index] = value
+            present[index] = True
+            self.invalidate()
         else:
             raise TypeError
 
@@ -61,15 +174,22 @@ class Stats:
             if key not in self.modifiers.keys():
                 self.modifiers[key] = []
             self.modifiers[key].append(modifier)
+            self.invalidate()
         else:
             raise TypeError
 
     def __iadd__(self, other):
-        if isinstance(other, (dict, Stats)):
-            for key, value in other:
-                self.add_stat(key, value)
+        if isinstance(other, dict):
+            other_values, other_present = stat_vector(other)
+        elif isinstance(other, Stats):
+            other_values, other_present = other.stat_vector()
         else:
             raise TypeError
+        values, present = self._vectors(len(STAT_KEYS))
+        width = len(other_values)
+        values[:width] += other_values
+        present[:width] |= other_present
+        self.invalidate()
         return self
 
     @staticmethod
@@ -84,6 +204,11 @@ class Stats:
 class ProfileStats(Stats):
     """
     Profile stats class, extends from Stats class and has extra children attribute that contains all profile item stats.
+
+    Computed stats are memoized by variant until invalidate is called, by add_stat, add_modifier and the profile's
+    set_weapon, set_armor and set_pet. Anything else changing the children or a multiplier must call it too.
+    Children totals of a variant are one reduction over the children's stat vectors, and a stat whose modifiers read
+    other stats gets them from the memo, computing them first if needed, so every stat is computed once.
     """
 
     def __init__(self, stats_dict=None, profile=None):
@@ -92,6 +217,42 @@ class ProfileStats(Stats):
         self.childrens = []
         self.combat_bonus = 0
         self.archery_bonus = 0
+        # {(base, raw, dungeon): {stat: value}}
+        self._computed = {}
+        # {(base, dungeon): (totals vector of the children without modifiers, present, children with modifiers)}
+        self._children_totals = {}
+        # (children stat matrices, children with modifiers), shared by every variant
+        self._children_matrix = None
+
+    def invalidate(self):
+        self._computed = {}
+        self._children_totals = {}
+        self._children_matrix = None
+
+    def copy(self):
+        stats = super().copy()
+        stats.childrens = self.childrens.copy()
+        stats.invalidate()
+        return stats
+
+    def add_children(self, childrens):
+        """
+        Add the stats of items or a pet to the children.
+        """
+        self.childrens.extend(childrens)
+        self.invalidate()
+
+    def layer(self, profile=None):
+        """
+        LoadoutStats on top of these stats, for a loadout of profile.
+        """
+        return LoadoutStats(self, profile=profile)
+
+    def stat_vector(self):
+        if not self.childrens and not self.modifiers and self.multiplier == 1:
+            # Stats only made to be added to a profile's, like skill rewards, get_stat is their own stats
+            return self._values, self._present
+        return super().stat_vector()
 
     def get_stat(self, key, *, base=False, raw=False, dungeon=False, ignore=None):
         """
@@ -100,34 +261,203 @@ class ProfileStats(Stats):
         Base stat is profile stat without profile multiplier + children base stat.
         Raw stat is profile stat without modifiers + children base stat.
         """
-        if ignore is None:
-            ignore = []
         if isinstance(key, str):
-            childrens_stat = self.get_all_children_stat(key, base=(base or raw), dungeon=dungeon, ignore=ignore)
-            stat = self._stats.get(key, 0) + childrens_stat
-            if not base:
-                stat = stat if key in self._static_stats else stat * self.multiplier
-            if not raw:
-                if key in self.modifiers:
-                    for func in self.modifiers[key]:
-                        stat = func(stat)
-            return stat
+            computed = self._computed.setdefault((base, raw, dungeon), {})
+            if key not in computed:
+                computed[key] = self._compute_stat(key, base=base, raw=raw, dungeon=dungeon, ignore=ignore)
+            return computed[key]
         else:
             raise TypeError
 
-    def get_all_children_stat(self, key, *, base=False, dungeon=False, ignore=None):
-        if isinstance(key, str):
-            total = 0
-            for child in self.childrens:
-                if isinstance(child, PetStats):
-                    total += child.get_stat(key)
+    def _compute_stat(self, key, *, base, raw, dungeon, ignore):
+        childrens_stat = self.get_all_children_stat(key, base=(base or raw), dungeon=dungeon, ignore=ignore)
+        stat = self._value(key) + childrens_stat
+        if not base:
+            stat = stat if key in self._static_stats else stat * self.multiplier
+        if not raw:
+            if key in self.modifiers:
+                for func in self.modifiers[key]:
+                    stat = func(stat)
+        return stat
+
+    def get_all_stats(self, *, base=False, raw=False, dungeon=False):
+        """
+        Every stat of the profile, its children and its modifiers of one variant as {stat: value}.
+        """
+        _, children_present, deferred = self._get_children_totals(base=(base or raw), dungeon=dungeon)
+        width = len(STAT_KEYS)
+        present = _widen(self._present, width) | _widen(children_present, width)
+        keys = dict.fromkeys(STAT_KEYS[index] for index in numpy.flatnonzero(present))
+        for child in deferred:
+            keys.update(dict.fromkeys(child._stats))
+        keys.update(dict.fromkeys(self.modifiers))
+        return {key: self.get_stat(key, base=base, raw=raw, dungeon=dungeon) for key in keys}
+
+    def _own_childrens(self):
+        """
+        Children whose stat vectors these stats stack themselves.
+        """
+        return self.childrens
+
+    def _get_children_matrix(self):
+        """
+        Stat vectors of the children without modifiers stacked in one matrix, with everything the variants scale them
+        by, and the children with modifiers, their modifiers can read profile stats so they are only asked for the
+        stats that are needed.
+        """
+        if self._children_matrix is None:
+            rows = []
+            deferred = []
+            for child in self._own_childrens():
+                if isinstance(child, PetStats) or (isinstance(child, ItemStats) and not child.modifiers):
+                    rows.append(child)
                 elif isinstance(child, ItemStats):
-                    total += child.get_stat(key, base=base, dungeon=dungeon)
+                    deferred.append(child)
+
+            width = len(STAT_KEYS)
+            values = numpy.zeros((len(rows), width))
+            present = numpy.zeros((len(rows), width), dtype=bool)
+            # Pets have no reforge, no dungeon bonus and their multiplier doesn't apply
+            reforge_values = numpy.zeros((len(rows), width))
+            reforge_present = numpy.zeros((len(rows), width), dtype=bool)
+            in_dungeon = numpy.zeros(len(rows), dtype=bool)
+            own_bonus = numpy.zeros(len(rows))
+            profile_bonus = numpy.zeros(len(rows))
+            multipliers = numpy.ones(len(rows))
+            for row, child in enumerate(rows):
+                child_values, child_present = child._vectors(width)
+                values[row] = child_values
+                present[row] = child_present
+                if isinstance(child, ItemStats):
+                    reforge_values[row], reforge_present[row] = child._reforge_vectors(width)
+                    multipliers[row] = child.multiplier
+                    if child.dungeon:
+                        in_dungeon[row] = True
+                        own_bonus[row] = child.dungeon_bonus
+                        profile_bonus[row] = child.profile.stats.dungeon_bonus
+
+            self._children_matrix = (values, present, reforge_values, reforge_present, in_dungeon, own_bonus,
+                                     profile_bonus, multipliers, deferred)
+        return self._children_matrix
+
+    def _scale_children(self, *, base, dungeon):
+        """
+        Stat vectors of the children without modifiers scaled by their reforges, dungeon bonuses and multipliers at
+        once, one row per child. Return (values, present, children with modifiers).
+        """
+        (values, present, reforge_values, reforge_present, in_dungeon, own_bonus, profile_bonus, multipliers,
+         deferred) = self._get_children_matrix()
+        width = values.shape[1]
+        if base:
+            # Base stats take the reforge stats away, even the ones the item has none of
+            values = values - reforge_values
+            present = present | reforge_present
+        if dungeon and in_dungeon.any():
+            factor = (1 + own_bonus)[:, None] + numpy.where(_own_dungeon_bonus_mask(width), 0,
+                                                            profile_bonus[:, None])
+            values = numpy.where(in_dungeon[:, None], values * factor, values)
+        values = values * numpy.where(_static_mask(width), 1, multipliers[:, None])
+        return values, present, deferred
+
+    def _get_children_totals(self, *, base, dungeon):
+        """
+        Totals of every stat of the children without modifiers, the scaled rows are summed in order, one after
+        another, so totals are the same as adding the children one at a time.
+        Return (totals, present, children with modifiers).
+        """
+        key = (base, dungeon)
+        if key not in self._children_totals:
+            values, present, deferred = self._scale_children(base=base, dungeon=dungeon)
+            self._children_totals[key] = values.sum(axis=0), present.any(axis=0), deferred
+        return self._children_totals[key]
+
+    def get_all_children_stat(self, key=None, *, base=False, dungeon=False, ignore=None):
+        """
+        Total of a stat of every child, without a key the stat vector of the children without modifiers.
+        """
+        if key is None:
+            return self._get_children_totals(base=base, dungeon=dungeon)[0]
+        elif isinstance(key, str):
+            totals, _, deferred = self._get_children_totals(base=base, dungeon=dungeon)
+            index = STAT_INDEX.get(key)
+            total = totals[index].item() if index is not None and index < len(totals) else 0
+            for child in deferred:
+                total += child.get_stat(key, base=base, dungeon=dungeon)
             return total
         else:
             raise TypeError
 
 
+class LoadoutStats(ProfileStats):
+    """
+    Stats of a loadout layered on a profile's stats without copying them.
+
+    The base's children, like talismans, and their totals are shared, equipment is added to the layer's own
+    children and potions, support items and set bonuses to its own stats. The base's stat vector and modifiers are
+    only copied the first time the layer changes them, so any number of layers can be made from one profile.
+    The base must not change while layers of it are used.
+    """
+
+    def __init__(self, base, profile=None):
+        self.base = base
+        self._values, self._present = base._values, base._present
+        self._shared_vectors = True
+        self.multiplier = base.multiplier
+        self.modifiers = base.modifiers
+        self._shared_modifiers = True
+        self.dungeon_bonus = base.dungeon_bonus
+        self.combat_bonus = base.combat_bonus
+        self.archery_bonus = base.archery_bonus
+        self.profile = profile
+        self.type = None
+        self.layer_childrens = []
+        self.invalidate()
+
+    @property
+    def childrens(self):
+        return self.base.childrens + self.layer_childrens
+
+    def _own_childrens(self):
+        return self.layer_childrens
+
+    def _vectors(self, width):
+        if self._shared_vectors:
+            self._values, self._present = self._values.copy(), self._present.copy()
+            self._shared_vectors = False
+        return super()._vectors(width)
+
+    def add_modifier(self, key, modifier):
+        if self._shared_modifiers:
+            self.modifiers = {key: modifiers.copy() for key, modifiers in self.modifiers.items()}
+            self._shared_modifiers = False
+        super().add_modifier(key, modifier)
+
+    def copy(self):
+        stats = copy.copy(self)
+        stats._shared_vectors = stats._shared_modifiers = True
+        stats.layer_childrens = self.layer_childrens.copy()
+        stats.invalidate()
+        return stats
+
+    def add_children(self, childrens):
+        self.layer_childrens.extend(childrens)
+        self.invalidate()
+
+    def _get_children_totals(self, *, base, dungeon):
+        """
+        The base's totals followed by the layer's children in one reduction.
+        """
+        key = (base, dungeon)
+        if key not in self._children_totals:
+            base_totals, base_present, base_deferred = self.base._get_children_totals(base=base, dungeon=dungeon)
+            values, present, deferred = self._scale_children(base=base, dungeon=dungeon)
+            width = max(len(base_totals), values.shape[1])
+            values = numpy.vstack((_widen(base_totals, width), _widen(values, width)))
+            present = _widen(base_present, width) | _widen(present, width).any(axis=0)
+            self._children_totals[key] = values.sum(axis=0), present, base_deferred + deferred
+        return self._children_totals[key]
+
+
 class ItemStats(Stats):
     """
     Item stats class, extends from Stats class and has extra reforge stat attribute.
@@ -142,6 +472,34 @@ class ItemStats(Stats):
         self.profile = item.profile
         self.reforge_stat = {}
 
+    @property
+    def reforge_stat(self):
+        """
+        {stat: value} of the reforge stats, kept as a vector like the stats.
+        """
+        return {STAT_KEYS[index]: self._reforge_values[index].item()
+                for index in numpy.flatnonzero(self._reforge_present)}
+
+    @reforge_stat.setter
+    def reforge_stat(self, reforge_stats):
+        self._reforge_values, self._reforge_present = stat_vector(reforge_stats)
+        self.invalidate()
+
+    def _reforge_vectors(self, width):
+        """
+        (reforge values, present) widened to width columns.
+        """
+        if len(self._reforge_values) < width:
+            self._reforge_values = _widen(self._reforge_values, width)
+            self._reforge_present = _widen(self._reforge_present, width)
+        return self._reforge_values, self._reforge_present
+
+    def copy(self):
+        stats = super().copy()
+        stats._reforge_values = self._reforge_values.copy()
+        stats._reforge_present = self._reforge_present.copy()
+        return stats
+
     def get_stat(self, key, *, base=False, dungeon=False):
         """
         Default get stat is get all stat + multiplier + modifiers.
@@ -149,9 +507,11 @@ class ItemStats(Stats):
         Stat returns is always with multiplier and modifiers.
         """
         if isinstance(key, str):
-            stat = self._stats.get(key, 0)
-            if base and key in self.reforge_stat:
-                stat = stat - self.reforge_stat.get(key, 0)
+            stat = self._value(key)
+            if base:
+                index = STAT_INDEX.get(key)
+                if index is not None and index < len(self._reforge_present) and self._reforge_present[index]:
+                    stat = stat - self._reforge_values[index].item()
             if key in self.modifiers:  # this wont affect static stat due to add_modifier never accept static stat
                 for func in self.modifiers[key]:
                     stat = func(stat)
@@ -191,8 +551,11 @@ class PetStats(Stats):
         self.type = pet.type
         self.profile = pet.profile
 
+    def stat_vector(self):
+        return self._values, self._present
+
     def get_stat(self, key):
         if isinstance(key, str):
-            return self._stats.get(key, 0)
+            return self._value(key)
         else:
             raise TypeError
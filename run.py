@@ -11,20 +11,22 @@ import config
 if os.name == "nt":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-client = Bot(
-    command_prefix=config.BOT_PREFIXES,
-    description='Skyblock Simplified',
-    case_insensitive=True,
-    max_messages=None,
-    fetch_offline_members=False,
-    activity=discord.Game(f'| 🍤 {config.BOT_PREFIXES[-1]} help')
-)
+# Optimizer worker processes import this module again when they are spawned instead of forked
+if __name__ == '__main__':
+    client = Bot(
+        command_prefix=config.BOT_PREFIXES,
+        description='Skyblock Simplified',
+        case_insensitive=True,
+        max_messages=None,
+        fetch_offline_members=False,
+        activity=discord.Game(f'| 🍤 {config.BOT_PREFIXES[-1]} help')
+    )
 
-for extension in config.COG_EXTENSIONS:
-    try:
-        client.load_extension(extension)
-    except Exception:
-        print(f'Failed to load extension {extension}.', file=sys.stderr)
-        traceback.print_exc()
+    for extension in config.COG_EXTENSIONS:
+        try:
+            client.load_extension(extension)
+        except Exception:
+            print(f'Failed to load extension {extension}.', file=sys.stderr)
+            traceback.print_exc()
 
-client.run(config.DISCORD_TOKEN)
+    client.run(config.DISCORD_TOKEN)
@@ -1,6 +1,10 @@
 from .embed import Embed
 from .converters import UserConverterSafe
 from .helper import *
+from .levels import LevelTable, SKILL_LEVELS, RUNECRAFTING_LEVELS, DUNGEON_SKILL_LEVELS, MINION_SLOT_LEVELS, \
+    SLAYER_LEVELS, PET_LEVELS, skill_level_table
+from .reforges import ReforgeTable, DAMAGE_REFORGE_TABLE, REFORGE_TABLE, reforge_class
+from .talismans import TalismanCatalog, TALISMAN_CATALOG
 from .help_pages import HelpPages
 from .help_command import PaginatedHelpCommand
 from .command_with_cooldown import CommandWithCooldown, GroupWithCooldown
@@ -116,6 +116,28 @@ class Context(commands.Context):
         ans = await self.bot.wait_for('message', timeout=timeout, check=message_check)
         return ans.clean_content
 
+    async def cancellable(self, coro):
+        """
+        Run `coro` and return its result, entering `exit` cancels it and raises SessionTimeout.
+        """
+        def message_check(m):
+            if m.author.id == self.author.id and m.channel.id == self.channel.id and m.clean_content.lower() == 'exit':
+                raise SessionTimeout
+            return False
+
+        tasks = [
+            self.bot.loop.create_task(coro),
+            self.bot.loop.create_task(self.bot.wait_for('message', check=message_check))
+        ]
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for future in tasks:
+                future.cancel()
+
+        return done.pop().result()
+
     async def send_in_task(self, message, emoji_list, *, embed):
         try:
             if embed:
@@ -36,7 +36,7 @@ class Embed(discord.Embed):
 
         return self
 
-    async def send(self, *, dm=False, dm_extra=False):
+    def _prepare(self):
         self.timestamp = datetime.now()
 
         if not self.footer:
@@ -45,9 +45,21 @@ class Embed(discord.Embed):
                 icon_url='https://skyblocksimplified.com/discord/images/logo.gif'
             )
 
+    async def send(self, *, dm=False, dm_extra=False):
+        self._prepare()
+
         if dm and not isinstance(self.channel, discord.DMChannel):
             msg = await self.user.send(self.user.mention, embed=self)
             if dm_extra:
                 await self.channel.send(f'{self.user.mention}, I have sent you a DM with the information!')
             return msg
         return await self.channel.send(self.user.mention if self.user else None, embed=self)
+
+    async def edit(self, message):
+        """
+        Replace the embed of a message sent before, like a result that got better.
+        """
+        self._prepare()
+
+        await message.edit(embed=self)
+        return message
@@ -60,7 +60,7 @@ class GuildPages(Pages):
             self.embed.description = f'{description}```Level > {guild.level}\n' \
                                      f'Members > {guild.member_amount}\n' \
                                      f'Online members > {guild.current_online}\n' \
-                                     f'Owner > {guild.owner.player.uname if guild.owner else None}\n' \
+                                     f'Owner > {guild.owner.player.uname if guild.owner and guild.owner.player else None}\n' \
                                      f'Created at > {guild.created_at.replace(microsecond=0)}``````' \
                                      f'Average deaths > {guild.average_deaths:,}\n' \
                                      f'Average money > {guild.average_money:,.2f}\n' \
@@ -2,6 +2,8 @@ import asyncio
 import aiohttp
 import time
 import re
+from bisect import bisect_right
+from collections import OrderedDict
 from copy import deepcopy
 from urllib.parse import quote
 import pytz
@@ -37,16 +39,11 @@ async def get_from_name_uuid(name_uuid, *, session, with_history=False):
 
 def level_from_xp_table(xp, table):
     """
-    Takes a xp value and a list of level requirements.
+    Takes a xp value and a list of cumulative level requirements.
     Returns whatever level the thing should be at.
+    Prefer the prebuilt tables in utils.levels for the known level requirements.
     """
-    level = 0
-    for i, requirement in enumerate(table):
-        if xp >= requirement:
-            level = i + 1
-        else:
-            break
-    return level
+    return bisect_right(table, xp)
 
 
 def safe_list_get(lst, i):
@@ -138,18 +135,28 @@ def emod(activity, weapon):
     return result
 
 
-def get_stats_from_description(desc):
+_COLOR_CODE_REGEX = re.compile('§.')
+_STAT_REGEX = re.compile(r'([\w ]*): \D?(\d*\.?\d*)(.*)')
+_REFORGE_REGEX = re.compile(r'.*\(([\w ]*) \+(\d*)')
+
+# Parsed stats of recently seen descriptions, the same lore shows up on thousands of items
+_DESCRIPTION_STATS_CACHE_SIZE = 4096
+_description_stats_cache = OrderedDict()
+
+
+def strip_color_codes(text):
     """
-    Get item stats from clean description and estimated total dungeon bonus.
-    Return item stats dict, item reforge stats dict, estimated total dungeon bonus value.
+    Remove minecraft color and format codes (§ followed by one character) from text.
     """
-    stat_regex = re.compile('([\w ]*): \D?(\d*\.?\d*)(.*)')
-    reforge_regex = re.compile('.*\(([\w ]*) \+(\d*)')
+    return _COLOR_CODE_REGEX.sub('', text)
+
+
+def _parse_stats_from_description(desc):
     stats = {}
     reforge_stats = {}
 
     for line in desc:
-        stat_match = stat_regex.match(line)
+        stat_match = _STAT_REGEX.match(line)
         if stat_match is None:
             continue  # if doesn't match
 
@@ -166,7 +173,7 @@ def get_stats_from_description(desc):
 
         # check for reforge stat
         if stat_match.group(3):
-            reforge_match = reforge_regex.match(stat_match.group(3))
+            reforge_match = _REFORGE_REGEX.match(stat_match.group(3))
             if reforge_match is not None:
                 reforge_value = reforge_match.group(2)
 
@@ -177,6 +184,25 @@ def get_stats_from_description(desc):
     return stats, reforge_stats
 
 
+def get_stats_from_description(desc):
+    """
+    Get item stats from clean description.
+    Return item stats dict, item reforge stats dict.
+    Results are cached by description, the returned dicts are fresh copies and safe to mutate.
+    """
+    key = tuple(desc)
+    cached = _description_stats_cache.get(key)
+    if cached is None:
+        cached = _description_stats_cache[key] = _parse_stats_from_description(key)
+        if len(_description_stats_cache) > _DESCRIPTION_STATS_CACHE_SIZE:
+            _description_stats_cache.popitem(last=False)
+    else:
+        _description_stats_cache.move_to_end(key)
+
+    stats, reforge_stats = cached
+    return stats.copy(), reforge_stats.copy()
+
+
 def closest(lst, k):
     """
     Find closest number in the given list.
@@ -215,12 +241,20 @@ async def ask_for_guild(ctx, guild, *, hypixel_api_client, load_members=False):
     guild_data = await hypixel_api_client.get_guild(params={'name': guild})
     if guild_data is None:
         raise BadGuildError(guild)
-    await ctx.send(f'{ctx.author.mention}, I am getting the guild information, please wait a little bit!')
+    message = await ctx.send(f'{ctx.author.mention}, I am getting the guild information, please wait a little bit!')
 
     guild = Guild(guild_data)
 
     if load_members:
-        await guild.load_all_members(hypixel_api_client=hypixel_api_client)
+        last_edit = time.monotonic()
+        async for _ in guild.load_members(hypixel_api_client=hypixel_api_client,
+                                          concurrency=ctx.bot.config.GUILD_LOAD_CONCURRENCY):
+            # Edit the progress at most every 2 seconds so it doesn't hit discord ratelimit
+            if time.monotonic() - last_edit >= 2 and guild.loaded_members < guild.member_amount:
+                last_edit = time.monotonic()
+                await message.edit(content=f'{ctx.author.mention}, I am getting the guild information, '
+                                           f'loaded {guild.loaded_members}/{guild.member_amount} members!')
+        guild.load_skyblock_stats()
 
     return guild
 
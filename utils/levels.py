@@ -0,0 +1,62 @@
+from bisect import bisect_right
+
+import numpy
+
+from constants import SKILL_LEVEL_REQUIREMENT, RUNECRAFTING_LEVEL_REQUIREMENT, DUNGEON_SKILL_LEVEL_REQUIREMENT, \
+    SLAYER_LEVEL_REQUIREMENT, PET_XP, MINION_SLOT_REQUIREMENT
+
+
+class LevelTable:
+    """
+    Cumulative xp requirements of every level, checked once when the table is built.
+    Level of a xp value is the amount of requirements it reaches, found by binary search.
+    """
+    __slots__ = ('name', 'requirements', '_array')
+
+    def __init__(self, requirements, *, name='level table'):
+        requirements = tuple(requirements)
+        if any(lower > upper for lower, upper in zip(requirements, requirements[1:])):
+            raise ValueError(f'{name} requirements must be cumulative')
+
+        self.name = name
+        self.requirements = requirements
+        self._array = numpy.array(requirements, dtype=numpy.float64)
+
+    def __len__(self):
+        return len(self.requirements)
+
+    def __repr__(self):
+        return f'<LevelTable {self.name} max level={len(self)}>'
+
+    @property
+    def max_xp(self):
+        return self.requirements[-1] if self.requirements else 0
+
+    def level(self, xp):
+        """
+        Takes a xp value and returns whatever level the thing should be at.
+        """
+        return bisect_right(self.requirements, xp)
+
+    def levels(self, xps):
+        """
+        Vectorized version of level for a whole batch of xp values, like every member of a guild.
+        Takes any array like of xp values and returns a numpy array of levels.
+        """
+        return numpy.searchsorted(self._array, numpy.asarray(xps, dtype=numpy.float64), side='right')
+
+
+SKILL_LEVELS = LevelTable(SKILL_LEVEL_REQUIREMENT, name='skill')
+RUNECRAFTING_LEVELS = LevelTable(RUNECRAFTING_LEVEL_REQUIREMENT, name='runecrafting')
+DUNGEON_SKILL_LEVELS = LevelTable(DUNGEON_SKILL_LEVEL_REQUIREMENT, name='dungeon skill')
+MINION_SLOT_LEVELS = LevelTable(MINION_SLOT_REQUIREMENT, name='minion slot')
+SLAYER_LEVELS = {slayer: LevelTable(table, name=f'{slayer} slayer')
+                 for slayer, table in SLAYER_LEVEL_REQUIREMENT.items()}
+PET_LEVELS = {rarity: LevelTable(table, name=f'{rarity} pet') for rarity, table in PET_XP.items()}
+
+
+def skill_level_table(skill):
+    """
+    Level table of a skill, runecrafting has its own.
+    """
+    return RUNECRAFTING_LEVELS if skill == 'runecrafting' else SKILL_LEVELS
@@ -0,0 +1,144 @@
+import numpy
+
+from constants import DAMAGE_REFORGES, REFORGES, WEAPON_ONLY_REFORGES, RARITIES
+
+
+def reforge_class(equipment_type):
+    """
+    Reforges are shared by every armor piece, other equipment types have their own.
+    """
+    return 'armor' if equipment_type in ('helmet', 'chestplate', 'leggings', 'boots') else equipment_type
+
+
+class ReforgeTable:
+    """
+    Reforge stats compiled into dense arrays indexed by (equipment class, rarity, reforge, stat).
+    Reforges of a class keep the order of the reforges dict, classes with less reforges are padded with
+    reforges that aren't available at any rarity.
+    """
+    __slots__ = ('name', 'source', 'classes', 'rarities', 'stats', 'reforges', 'coefficients', 'available',
+                 'blacksmith', 'weapon_only', '_class_index', '_rarity_index', '_stat_index', '_reforge_index',
+                 '_weapon_masks')
+
+    def __init__(self, reforges, *, weapon_only=None, name='reforge table'):
+        self.name = name
+        self.source = reforges
+        self.classes = tuple(reforges)
+        self.rarities = tuple(RARITIES)
+        stats = {}
+        for class_reforges in reforges.values():
+            for reforge_stats in class_reforges.values():
+                for rarity, rarity_stats in reforge_stats.items():
+                    if rarity != 'blacksmith':
+                        stats.update(dict.fromkeys(rarity_stats))
+        self.stats = tuple(stats)
+        self.reforges = {equipment_class: tuple(class_reforges) for equipment_class, class_reforges in reforges.items()}
+
+        self._class_index = {equipment_class: index for index, equipment_class in enumerate(self.classes)}
+        self._rarity_index = {rarity: index for index, rarity in enumerate(self.rarities)}
+        self._stat_index = {stat: index for index, stat in enumerate(self.stats)}
+        self._reforge_index = {equipment_class: {reforge: index for index, reforge in enumerate(class_reforges)}
+                               for equipment_class, class_reforges in self.reforges.items()}
+
+        size = max((len(class_reforges) for class_reforges in self.reforges.values()), default=0)
+        shape = (len(self.classes), len(self.rarities), size)
+        self.coefficients = numpy.zeros(shape + (len(self.stats),), dtype=numpy.int64)
+        self.available = numpy.zeros(shape, dtype=bool)
+        self.blacksmith = numpy.zeros((len(self.classes), size), dtype=bool)
+        for class_index, (equipment_class, class_reforges) in enumerate(reforges.items()):
+            for reforge_index, reforge_stats in enumerate(class_reforges.values()):
+                self.blacksmith[class_index, reforge_index] = reforge_stats.get('blacksmith', False) is True
+                for rarity, rarity_stats in reforge_stats.items():
+                    if rarity == 'blacksmith' or rarity not in self._rarity_index:
+                        continue
+                    rarity_index = self._rarity_index[rarity]
+                    self.available[class_index, rarity_index, reforge_index] = True
+                    for stat, value in rarity_stats.items():
+                        self.coefficients[class_index, rarity_index, reforge_index, self._stat_index[stat]] = value
+
+        # Reforges only some weapon can get, every weapon gets its mask once
+        self.weapon_only = {}
+        for equipment_class, class_reforges in (weapon_only or {}).items():
+            for reforge, weapon_name in class_reforges.items():
+                if equipment_class in self._class_index and reforge in self._reforge_index[equipment_class]:
+                    self.weapon_only[equipment_class, reforge] = weapon_name
+        self._weapon_masks = {weapon_name: self._build_weapon_mask(weapon_name)
+                              for weapon_name in set(self.weapon_only.values())}
+        self._weapon_masks[None] = self._build_weapon_mask(None)
+
+    def __repr__(self):
+        return f'<ReforgeTable {self.name} reforges={sum(len(reforges) for reforges in self.reforges.values())}>'
+
+    def __reduce_ex__(self, protocol):
+        # Problems sent to optimizer workers look the shared table up again instead of pickling it
+        if self is DAMAGE_REFORGE_TABLE:
+            return 'DAMAGE_REFORGE_TABLE'
+        if self is REFORGE_TABLE:
+            return 'REFORGE_TABLE'
+        return super().__reduce_ex__(protocol)
+
+    def _build_weapon_mask(self, weapon_name):
+        mask = numpy.ones(self.blacksmith.shape, dtype=bool)
+        for (equipment_class, reforge), reforge_weapon in self.weapon_only.items():
+            if reforge_weapon != weapon_name:
+                mask[self._class_index[equipment_class], self._reforge_index[equipment_class][reforge]] = False
+        return mask
+
+    def class_index(self, equipment_type):
+        return self._class_index[reforge_class(equipment_type)]
+
+    def rarity_index(self, rarity):
+        return self._rarity_index[rarity]
+
+    def reforge_index(self, equipment_type, reforge):
+        return self._reforge_index[reforge_class(equipment_type)][reforge]
+
+    def reforge_name(self, equipment_type, index):
+        return self.reforges[reforge_class(equipment_type)][index]
+
+    def weapon_mask(self, weapon_name):
+        """
+        Reforges a weapon can get, as a (class, reforge) mask.
+        """
+        return self._weapon_masks.get(weapon_name, self._weapon_masks[None])
+
+    def contains(self, reforges):
+        """
+        Whether every reforge of a reforges dict is in this table with the same stats.
+        """
+        for equipment_class, class_reforges in reforges.items():
+            source = self.source.get(equipment_class)
+            if source is None:
+                return False
+            for reforge, reforge_stats in class_reforges.items():
+                if source.get(reforge) != reforge_stats:
+                    return False
+        return True
+
+    def allowed(self, *, only_blacksmith=False, weapon_name=None, reforges=None):
+        """
+        Reforges that can be picked as a (class, rarity, reforge) mask.
+        `reforges` is a reforges dict with some of the table reforges removed, only the ones left are allowed.
+        """
+        allowed = self.available & self.weapon_mask(weapon_name)[:, numpy.newaxis, :]
+        if only_blacksmith:
+            allowed &= self.blacksmith[:, numpy.newaxis, :]
+        if reforges is not None:
+            kept = numpy.zeros(self.blacksmith.shape, dtype=bool)
+            for equipment_class, class_reforges in reforges.items():
+                for reforge in class_reforges:
+                    kept[self._class_index[equipment_class], self._reforge_index[equipment_class][reforge]] = True
+            allowed &= kept[:, numpy.newaxis, :]
+        return allowed
+
+    def stat_column(self, stat):
+        """
+        Coefficients of one stat as a (class, rarity, reforge) array, zeros for a stat no reforge gives.
+        """
+        if stat not in self._stat_index:
+            return numpy.zeros(self.available.shape, dtype=numpy.int64)
+        return self.coefficients[..., self._stat_index[stat]]
+
+
+DAMAGE_REFORGE_TABLE = ReforgeTable(DAMAGE_REFORGES, weapon_only=WEAPON_ONLY_REFORGES, name='damage reforges')
+REFORGE_TABLE = ReforgeTable(REFORGES, weapon_only=WEAPON_ONLY_REFORGES, name='reforges')
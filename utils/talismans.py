@@ -0,0 +1,76 @@
+import re
+
+from constants import TALISMANS
+
+
+class TalismanCatalog:
+    """
+    Index of a talisman catalog, {internal name regex: display name} in rough price order like TALISMANS.
+    Every pattern is folded into one alternation so an internal name is matched once against all of them, the entry
+    it matched is then kept by internal name. An internal name matches at most one entry, the patterns match from the
+    start of a name like re.match.
+    """
+    __slots__ = ('name', 'keys', 'names', '_pattern', '_entries')
+
+    def __init__(self, talismans, *, name='talisman catalog'):
+        self.name = name
+        self.keys = tuple(getattr(key, 'pattern', key) for key in talismans)
+        self.names = tuple(talismans.values())
+        # Entry groups are named by index so the group that matched is the entry
+        self._pattern = re.compile('|'.join(f'(?P<_{index}>{key})' for index, key in enumerate(self.keys)))
+
+        # {internal name: entry index or None}, the plain keys are internal names of their own entry
+        self._entries = {}
+        for index, key in enumerate(self.keys):
+            if re.escape(key) != key:
+                continue
+            matches = [other for other, pattern in enumerate(self.keys) if re.match(pattern, key)]
+            if matches != [index]:
+                raise ValueError(f'{name} entries {", ".join(self.keys[other] for other in matches)} overlap')
+            self._entries[key] = index
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __repr__(self):
+        return f'<TalismanCatalog {self.name} entries={len(self)}>'
+
+    def entry(self, internal_name):
+        """
+        Index of the entry an internal name matches, None when it matches none.
+        """
+        try:
+            return self._entries[internal_name]
+        except KeyError:
+            match = self._pattern.match(internal_name)
+            index = self._entries[internal_name] = int(match.lastgroup[1:]) if match else None
+            return index
+
+    def owned(self, talismans):
+        """
+        Indices of the entries the active talismans match.
+        """
+        owned = {self.entry(talisman.internal_name) for talisman in talismans if talisman.active}
+        owned.discard(None)
+        return owned
+
+    def missing(self, talismans, *, rarity=None, max_price=None, rarities=None, prices=None):
+        """
+        Indices of the entries none of the active talismans match, in catalog order.
+        With rarity only the entries of that rarity in rarities and with max_price only the ones under that many coins
+        in prices are kept, both are {catalog key: value} and entries they have no value for are left out.
+        """
+        owned = self.owned(talismans)
+        missing = []
+        for index, key in enumerate(self.keys):
+            if index in owned:
+                continue
+            if rarity is not None and (rarities or {}).get(key) != rarity:
+                continue
+            if max_price is not None and not (prices or {}).get(key, max_price) < max_price:
+                continue
+            missing.append(index)
+        return missing
+
+
+TALISMAN_CATALOG = TalismanCatalog(TALISMANS, name='talismans')